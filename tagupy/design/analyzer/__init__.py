@@ -1 +1,31 @@
-__all__ = []
+from ._anova import Anova, AnovaResult
+from ._best_subset import BestSubset, BestSubsetResult
+from ._lenth import Lenth, LenthResult, lenth_critical_cache
+from ._recursive import RecursiveFit, RecursiveLeastSquares
+from ._resampling import Resampling, ResamplingResult
+from ._sn_ratio import SNRatio, SNRatioResult
+from ._stepwise import Stepwise, StepwiseResult
+from ._two_stage_dsd import TwoStageDSD, TwoStageDSDResult
+from ._walsh_hadamard import EffectEstimate, WalshHadamard
+
+__all__ = [
+    "Anova",
+    "AnovaResult",
+    "BestSubset",
+    "BestSubsetResult",
+    "EffectEstimate",
+    "Lenth",
+    "LenthResult",
+    "RecursiveFit",
+    "RecursiveLeastSquares",
+    "Resampling",
+    "ResamplingResult",
+    "SNRatio",
+    "SNRatioResult",
+    "Stepwise",
+    "StepwiseResult",
+    "TwoStageDSD",
+    "TwoStageDSDResult",
+    "WalshHadamard",
+    "lenth_critical_cache",
+]
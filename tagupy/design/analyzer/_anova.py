@@ -0,0 +1,256 @@
+"""
+_Analyzer Class of Multi-response Regression and ANOVA Module
+"""
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from tagupy.design.analyzer._input import _check_input
+from tagupy.design.analyzer._replicate import _collapse
+from tagupy.type import _Analyzer as Analyzer
+from tagupy.utils import ModelMatrix
+from tagupy.utils._linalg import _back_substitution
+from tagupy.utils._special import _f_sf, _t_sf2
+
+
+class AnovaResult(NamedTuple):
+    """
+    Least-squares fit and ANOVA of every response
+
+    Attributes
+    ----------
+    labels: List[str]
+        names of the model terms (n_term)
+    coef: numpy.ndarray
+        regression coefficients (n_term x n_response)
+    std_err: numpy.ndarray
+        standard errors of coef (n_term x n_response)
+    t_value: numpy.ndarray
+        coef / std_err (n_term x n_response)
+    p_value: numpy.ndarray
+        two-sided p-values of the t tests (n_term x n_response)
+    ss_term: numpy.ndarray
+        partial sums of squares of each term, coef^2 / [(X'X)^-1]_jj (n_term x n_response),
+        whose F statistic ss_term / ms_error equals t_value^2
+    ss_model: numpy.ndarray
+        sums of squares explained by the model, around the mean if it has an intercept (n_response)
+    ss_error: numpy.ndarray
+        residual sums of squares (n_response)
+    df_model: int
+        degrees of freedom of the model
+    df_error: int
+        degrees of freedom of the residuals
+    f_value: numpy.ndarray
+        F statistics of the whole model (n_response)
+    f_p_value: numpy.ndarray
+        p-values of the F tests of the whole model (n_response)
+    r2: numpy.ndarray
+        coefficients of determination (n_response)
+    ss_pure_error: Optional[numpy.ndarray]
+        within-run sums of squares of the replicates (n_response), None unless collapsed
+    df_pure_error: Optional[int]
+        degrees of freedom of the pure error, None unless collapsed
+    ss_lack_of_fit: Optional[numpy.ndarray]
+        ss_error - ss_pure_error (n_response), None unless collapsed
+    df_lack_of_fit: Optional[int]
+        df_error - df_pure_error, None unless collapsed
+    lof_f_value: Optional[numpy.ndarray]
+        F statistics of the lack of fit against the pure error (n_response), None unless collapsed
+    lof_p_value: Optional[numpy.ndarray]
+        p-values of the lack-of-fit F tests (n_response), None unless collapsed
+
+    Notes
+    -----
+    The statistics which need the residual variance are nan when df_error = 0,
+    and so are those of the lack of fit when df_pure_error or df_lack_of_fit = 0.
+    """
+    labels: List[str]
+    coef: np.ndarray
+    std_err: np.ndarray
+    t_value: np.ndarray
+    p_value: np.ndarray
+    ss_term: np.ndarray
+    ss_model: np.ndarray
+    ss_error: np.ndarray
+    df_model: int
+    df_error: int
+    f_value: np.ndarray
+    f_p_value: np.ndarray
+    r2: np.ndarray
+    ss_pure_error: Optional[np.ndarray] = None
+    df_pure_error: Optional[int] = None
+    ss_lack_of_fit: Optional[np.ndarray] = None
+    df_lack_of_fit: Optional[int] = None
+    lof_f_value: Optional[np.ndarray] = None
+    lof_p_value: Optional[np.ndarray] = None
+
+
+class Anova(Analyzer):
+    """
+    _Analyzer Class of Multi-response Regression and ANOVA Module
+
+    Method
+    ------
+    analyze(exmatrix: numpy.ndarray, result: numpy.ndarray) -> AnovaResult
+
+    Notes
+    -----
+    The model matrix X is factorized once as X = QR, and all the responses Y
+    are solved together: the coefficients are R^-1 (Q'Y), Q'Y being a single
+    matrix product, and the standard errors share the diagonal of (X'X)^-1 = R^-1 R^-T.
+    Statistics are returned as (n_term x n_response) or (n_response) arrays.
+
+    With collapse=True, the replicated runs are first reduced to their counts n_i,
+    mean responses and within-run sums of squares in one grouped pass,
+    and the model is fitted on the distinct runs weighted by sqrt(n_i).
+    The fit is the same as on every run, while its cost is divided by the replication factor,
+    and the residuals split into pure error and lack of fit.
+    A ReplicatedDesign (get_exmatrix(lazy=True)) is collapsed without being materialized.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.analyzer import Anova
+    >>> from tagupy.design.generator import PlackettBurman
+    >>> exmatrix = PlackettBurman(n_rep=2).get_exmatrix(n_factor=3)
+    >>> noise = np.array([0.1, -0.1, 0.2, 0., -0.1, 0.1, -0.2, 0.])
+    >>> result = np.stack([5 + 2 * exmatrix[:, 0] + noise, 1 - exmatrix[:, 2] + noise], axis=1)
+    >>> anova = Anova(terms="linear").analyze(exmatrix, result)
+    >>> anova.labels
+    ['1', 'x0', 'x1', 'x2']
+    >>> anova.coef.round(3) + 0.
+    array([[ 5.,  1.],
+           [ 2.,  0.],
+           [ 0.,  0.],
+           [ 0., -1.]])
+    >>> bool((anova.p_value[[1, 3], [0, 1]] < 1e-4).all())
+    True
+    """
+
+    def __init__(
+        self,
+        terms: Union[str, Iterable[Iterable[int]]] = "linear",
+        collapse: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        terms: Union[str, Iterable[Iterable[int]]]
+            model terms, "linear", "interaction", "quadratic" or explicit tuples of factor indices,
+            see also tagupy.utils.ModelMatrix
+        collapse: bool
+            if True, fit on the distinct runs and test the lack of fit against the pure error
+        """
+        assert isinstance(collapse, bool), \
+            f"Invalid input: collapse expected bool, got {type(collapse)}::{collapse}"
+        self.terms = terms
+        self.collapse = collapse
+
+    def analyze(self, exmatrix: np.ndarray, result: np.ndarray) -> AnovaResult:
+        """
+        Fit the model to every response and compute the ANOVA
+
+        Parameters
+        ----------
+        exmatrix: numpy.ndarray
+            Target experiment Matrix (n_experiment x n_factor), or a ReplicatedDesign
+        result: numpy.ndarray
+            Target Result Matrix (n_experiment x n_response)
+
+        Returns
+        -------
+        analysis_result: AnovaResult
+            coefficients, tests and sums of squares of every response
+
+        Raises
+        ------
+        numpy.linalg.LinAlgError
+            if the model matrix does not have full column rank
+        """
+        if not self.collapse:
+            exmatrix, result = _check_input(exmatrix, result)
+            return _fit(ModelMatrix(exmatrix, terms=self.terms), result)
+        summary = _collapse(exmatrix, result)
+        model = ModelMatrix(summary.exmatrix, terms=self.terms)
+        return _fit(model, summary.means, summary.counts, summary.ss_within.sum(axis=0))
+
+
+def _fit(
+    model: ModelMatrix,
+    result: np.ndarray,
+    counts: Optional[np.ndarray] = None,
+    ss_pure_error: Optional[np.ndarray] = None,
+) -> AnovaResult:
+    """
+    least-squares fit of every response on the model matrix through one QR factorization,
+    the rows being the mean responses of counts replicates if given
+    """
+    x = model.toarray()
+    n_row, n_term = x.shape
+    weight = np.ones(n_row) if counts is None else np.sqrt(counts)
+    q, r = np.linalg.qr(x * weight[:, None])
+    if n_term > n_row or (np.abs(np.diag(r)) <= 1e-10 * max(np.abs(r).max(), 1e-300)).any():
+        raise np.linalg.LinAlgError("model matrix does not have full column rank")
+
+    qty = q.T @ (result * weight[:, None])
+    coef = _back_substitution(r, qty)
+    r_inv = _back_substitution(r, np.eye(n_term))
+    inv_diag = (r_inv * r_inv).sum(axis=1)
+
+    resid = (result - x @ coef) * weight[:, None]
+    ss_error = (resid * resid).sum(axis=0)
+    n_run = n_row if counts is None else int(counts.sum())
+    intercept = () in model.terms
+    center = weight ** 2 @ result / n_run if intercept else np.zeros(result.shape[1])
+    ss_total = weight ** 2 @ ((result - center) ** 2)
+    if ss_pure_error is not None:
+        ss_lack_of_fit = ss_error
+        ss_error = ss_error + ss_pure_error
+        ss_total = ss_total + ss_pure_error
+    df_model = n_term - 1 if intercept else n_term
+    df_error = n_run - n_term
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ms_error = ss_error / df_error if df_error else np.full(result.shape[1], np.nan)
+        std_err = np.sqrt(inv_diag[:, None] * ms_error[None, :])
+        t_value = coef / std_err
+        ss_model = ss_total - ss_error
+        f_value = (ss_model / df_model) / ms_error if df_model else np.full(result.shape[1], np.nan)
+        r2 = ss_model / ss_total
+    p_value = _t_sf2(t_value, df_error) if df_error else np.full(coef.shape, np.nan)
+    f_p_value = _f_sf(f_value, df_model, df_error) if df_error and df_model \
+        else np.full(result.shape[1], np.nan)
+
+    lack_of_fit = {}
+    if ss_pure_error is not None:
+        df_pure_error, df_lack_of_fit = n_run - n_row, n_row - n_term
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lof_f_value = (ss_lack_of_fit / df_lack_of_fit) / (ss_pure_error / df_pure_error) \
+                if df_pure_error and df_lack_of_fit else np.full(result.shape[1], np.nan)
+        lof_p_value = _f_sf(lof_f_value, df_lack_of_fit, df_pure_error) \
+            if df_pure_error and df_lack_of_fit else np.full(result.shape[1], np.nan)
+        lack_of_fit = dict(
+            ss_pure_error=ss_pure_error,
+            df_pure_error=df_pure_error,
+            ss_lack_of_fit=ss_lack_of_fit,
+            df_lack_of_fit=df_lack_of_fit,
+            lof_f_value=lof_f_value,
+            lof_p_value=lof_p_value,
+        )
+
+    return AnovaResult(
+        labels=model.labels,
+        coef=coef,
+        std_err=std_err,
+        t_value=t_value,
+        p_value=p_value,
+        ss_term=coef * coef / inv_diag[:, None],
+        ss_model=ss_model,
+        ss_error=ss_error,
+        df_model=df_model,
+        df_error=df_error,
+        f_value=f_value,
+        f_p_value=f_p_value,
+        r2=r2,
+        **lack_of_fit,
+    )
@@ -0,0 +1,352 @@
+"""
+_Analyzer Class of Best-subset Regression Module
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from tagupy.design.analyzer._input import _check_input
+from tagupy.type import _Analyzer as Analyzer
+from tagupy.utils import ModelMatrix, is_positive_int
+from tagupy.utils._model_matrix import _label
+
+_TOL = 1e-10
+_TASKS_PER_JOB = 32
+_CHUNKS_PER_JOB = 4
+
+Subset = Tuple[int, ...]
+
+
+class BestSubsetResult(NamedTuple):
+    """
+    Best models of every size found by a BestSubset analysis
+
+    Attributes
+    ----------
+    sizes: numpy.ndarray
+        number of terms besides the intercept of each model (n_model)
+    terms: List[List[Tuple[int, ...]]]
+        terms of each model as tuples of factor indices, the intercept () first
+    labels: List[List[str]]
+        names of the terms of each model
+    ss_error: numpy.ndarray
+        residual sums of squares of the models (n_model)
+    r2: numpy.ndarray
+        coefficients of determination of the models (n_model)
+    n_node: int
+        number of subsets whose children were scored, a measure of the search effort
+
+    Notes
+    -----
+    Models are sorted by size, then by ss_error.
+    """
+    sizes: np.ndarray
+    terms: List[List[Tuple[int, ...]]]
+    labels: List[List[str]]
+    ss_error: np.ndarray
+    r2: np.ndarray
+    n_node: int
+
+
+class BestSubset(Analyzer):
+    """
+    _Analyzer Class of Best-subset Regression Module
+
+    Method
+    ------
+    analyze(exmatrix: numpy.ndarray, result: numpy.ndarray) -> BestSubsetResult
+
+    Notes
+    -----
+    The subsets are searched depth first, a subset S being extended only by the candidates
+    after its last one, so that every subset is visited once (leaps and bounds).
+    A node keeps the residuals e of S and the remaining candidates C orthogonalized against S,
+    and scores all its children at once as RSS(S + c) = RSS(S) - (c'e)^2 / c'c.
+    The child S + c_j is expanded only if RSS(S + c_j + ... + c_last),
+    a lower bound of the residual sums of squares in its subtree,
+    is below the worst of the n_best models kept for a size it can still reach.
+    The bounds of all the children come from one QR factorization of the reversed C,
+    and a child inherits the factorization of its parent by one Gram-Schmidt step.
+    The models found by forward selection are kept first, which tightens the bounds early.
+
+    The bounds prune only when the candidates in a subtree do not fit the runs exactly,
+    i.e. they are effective for n_candidate + 1 < n_experiment and small max_size.
+    With n_jobs > 1, the subtrees of the first-level subsets are searched in a process pool.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.analyzer import BestSubset
+    >>> from tagupy.design.generator import DSD
+    >>> exmatrix = DSD(n_rep=1).get_exmatrix(n_factor=6, n_fake=2)
+    >>> noise = np.random.default_rng(0).normal(scale=0.5, size=len(exmatrix))
+    >>> result = 3 * exmatrix[:, 0] - 2 * exmatrix[:, 3] + 2 * exmatrix[:, 0] ** 2 + noise
+    >>> best = BestSubset(terms="quadratic", max_size=3).analyze(exmatrix, result)
+    >>> best.labels[-1]
+    ['1', 'x0', 'x3', 'x0^2']
+    """
+
+    def __init__(
+        self,
+        terms: Union[str, Iterable[Iterable[int]]] = "interaction",
+        max_size: int = 6,
+        n_best: int = 1,
+        n_jobs: int = 1,
+    ):
+        """
+        Parameters
+        ----------
+        terms: Union[str, Iterable[Iterable[int]]]
+            candidate terms, "linear", "interaction", "quadratic" or explicit tuples
+            of factor indices, see also tagupy.utils.ModelMatrix,
+            the intercept is always in the model
+        max_size: int
+            largest number of terms besides the intercept, at most n_experiment - 2,
+            the search grows quickly with it once the extra terms only fit the noise
+        n_best: int
+            number of models kept for every size
+        n_jobs: int
+            number of processes, the search runs in the calling process when 1
+        """
+        assert is_positive_int(max_size), \
+            f"Invalid input: max_size expected positive (>0) integer, " \
+            f"got {type(max_size)}::{max_size}"
+        assert is_positive_int(n_best), \
+            f"Invalid input: n_best expected positive (>0) integer, got {type(n_best)}::{n_best}"
+        assert is_positive_int(n_jobs), \
+            f"Invalid input: n_jobs expected positive (>0) integer, got {type(n_jobs)}::{n_jobs}"
+        self.terms = terms
+        self.max_size = max_size
+        self.n_best = n_best
+        self.n_jobs = n_jobs
+
+    def analyze(self, exmatrix: np.ndarray, result: np.ndarray) -> BestSubsetResult:
+        """
+        Search the best models of every size
+
+        Parameters
+        ----------
+        exmatrix: numpy.ndarray
+            Target experiment Matrix (n_experiment x n_factor)
+        result: numpy.ndarray
+            Target Result Matrix (n_experiment x 1)
+
+        Returns
+        -------
+        analysis_result: BestSubsetResult
+            best models of every size
+        """
+        exmatrix, result = _check_input(exmatrix, result)
+        assert result.shape[1] == 1, \
+            f"Invalid input: result expected (n_experiment x 1) array, got {result.shape}"
+        model = ModelMatrix(exmatrix, terms=self.terms)
+        terms = [term for term in model.terms if term]
+        n_run = len(exmatrix)
+        max_size = min(self.max_size, len(terms), n_run - 2)
+        assert max_size > 0, \
+            f"Invalid input: exmatrix expected more than 2 runs and a candidate, " \
+            f"got {n_run} runs and {len(terms)} candidates"
+
+        y = result[:, 0]
+        candidates = model.columns(terms)
+        e = y - y.mean()
+        ortho = candidates - candidates.mean(axis=0)
+        norm2 = (candidates * candidates).sum(axis=0)
+        leaders = _Leaders(max_size, self.n_best)
+        _seed(leaders, e, ortho, norm2)
+
+        tasks = _expand(leaders, e, ortho, np.arange(len(terms)), (), norm2, max_size)
+        n_node = 1
+        if self.n_jobs == 1:
+            for task in tasks:
+                n_node += _search(leaders, *task, norm2, max_size)
+        else:
+            # the first subtrees are by far the largest, split the tree breadth first
+            # until there are enough tasks, and deal them out to balance the chunks
+            while 0 < len(tasks) < _TASKS_PER_JOB * self.n_jobs:
+                n_node += len(tasks)
+                tasks = [child for task in tasks
+                         for child in _expand(leaders, *task, norm2, max_size)]
+            n_chunk = min(len(tasks), _CHUNKS_PER_JOB * self.n_jobs)
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as pool:
+                futures = [pool.submit(_search_tasks, leaders, tasks[i::n_chunk], norm2, max_size)
+                           for i in range(n_chunk)]
+                for future in futures:
+                    found, count = future.result()
+                    leaders.merge(found)
+                    n_node += count
+
+        ss_total = float(e @ e)
+        sizes, subsets, ss_error = leaders.models()
+        selected = [[()] + [terms[j] for j in subset] for subset in subsets]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = 1 - ss_error / ss_total
+        return BestSubsetResult(
+            sizes=sizes,
+            terms=selected,
+            labels=[[_label(term) for term in subset] for subset in selected],
+            ss_error=ss_error,
+            r2=r2,
+            n_node=n_node,
+        )
+
+
+class _Leaders:
+    """
+    n_best smallest residual sums of squares and their subsets for every size
+    """
+
+    def __init__(self, max_size: int, n_best: int):
+        self.n_best = n_best
+        self.rss = [np.empty(0) for _ in range(max_size + 1)]
+        self.subsets: List[List[Subset]] = [[] for _ in range(max_size + 1)]
+
+    def worst(self, size: int) -> float:
+        rss = self.rss[size]
+        return rss[-1] if len(rss) == self.n_best else np.inf
+
+    def push(self, size: int, rss: np.ndarray, subsets: List[Subset]) -> None:
+        keep = rss < self.worst(size)
+        if not keep.any():
+            return
+        known = set(self.subsets[size])
+        new = [i for i in np.flatnonzero(keep) if subsets[i] not in known]
+        rss = np.concatenate([self.rss[size], rss[new]])
+        subsets = self.subsets[size] + [subsets[i] for i in new]
+        order = np.argsort(rss, kind="stable")[:self.n_best]
+        self.rss[size] = rss[order]
+        self.subsets[size] = [subsets[i] for i in order]
+
+    def merge(self, other: "_Leaders") -> None:
+        for size in range(1, len(self.rss)):
+            self.push(size, other.rss[size], other.subsets[size])
+
+    def models(self) -> Tuple[np.ndarray, List[Subset], np.ndarray]:
+        sizes = np.concatenate([np.full(len(rss), size) for size, rss in enumerate(self.rss)])
+        subsets = [subset for el in self.subsets for subset in el]
+        return sizes.astype(np.int64), subsets, np.concatenate(self.rss)
+
+
+def _children(e: np.ndarray, ortho: np.ndarray, norm2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    decrease of the residual sum of squares by each remaining candidate, and which can enter
+    """
+    ortho2 = (ortho * ortho).sum(axis=0)
+    valid = ortho2 > _TOL * np.maximum(norm2, _TOL)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gain = np.where(valid, (e @ ortho) ** 2 / ortho2, 0.)
+    return gain, valid
+
+
+def _nested_bounds(e: np.ndarray, ortho: np.ndarray) -> np.ndarray:
+    """
+    residual sums of squares of e on the candidates ortho[:, j:] for every j
+
+    Note
+    ----
+    Q[:, :t] of the Householder QR of the reversed candidates spans their last t columns,
+    or a larger space if they are dependent, which still gives lower bounds
+    """
+    n_col = ortho.shape[1]
+    q, _ = np.linalg.qr(ortho[:, ::-1])
+    proj = np.cumsum((q.T @ e) ** 2)
+    count = np.minimum(np.arange(n_col, 0, -1), len(proj))
+    bounds: np.ndarray = np.maximum(e @ e - proj[count - 1], 0.)
+    return bounds
+
+
+def _step(
+    e: np.ndarray,
+    ortho: np.ndarray,
+    j: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    residuals and candidates after j, orthogonalized against the candidate j
+    """
+    u = ortho[:, j] / np.linalg.norm(ortho[:, j])
+    rest = ortho[:, j + 1:]
+    return e - u * (u @ e), rest - np.outer(u, u @ rest)
+
+
+def _seed(leaders: _Leaders, e: np.ndarray, ortho: np.ndarray, norm2: np.ndarray) -> None:
+    """
+    keep the models of forward selection, so that the bounds prune from the start
+    """
+    index = np.arange(ortho.shape[1])
+    subset: Subset = ()
+    for size in range(1, len(leaders.rss)):
+        gain, valid = _children(e, ortho, norm2[index])
+        if not valid.any():
+            return
+        j = int(np.argmax(np.where(valid, gain, -1.)))
+        subset = tuple(sorted(subset + (int(index[j]),)))
+        leaders.push(size, np.array([e @ e - gain[j]]), [subset])
+        u = ortho[:, j] / np.linalg.norm(ortho[:, j])
+        e = e - u * (u @ e)
+        ortho = np.delete(ortho, j, axis=1)
+        ortho = ortho - np.outer(u, u @ ortho)
+        index = np.delete(index, j)
+
+
+def _expand(
+    leaders: _Leaders,
+    e: np.ndarray,
+    ortho: np.ndarray,
+    index: np.ndarray,
+    subset: Subset,
+    norm2: np.ndarray,
+    max_size: int,
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray, Subset]]:
+    """
+    score the children of subset and return the states of those worth expanding
+    """
+    gain, valid = _children(e, ortho, norm2[index])
+    size = len(subset) + 1
+    rss = e @ e - gain
+    keep = np.flatnonzero(valid & (rss < leaders.worst(size)))
+    leaders.push(size, rss[keep], [subset + (int(index[j]),) for j in keep])
+    if size >= max_size or len(index) < 2:
+        return []
+    threshold = max(leaders.worst(k) for k in range(size + 1, max_size + 1))
+    bounds = _nested_bounds(e, ortho)
+    res = []
+    for j in map(int, np.flatnonzero(valid[:-1] & (bounds[:-1] < threshold))):
+        e_child, ortho_child = _step(e, ortho, j)
+        res.append((e_child, ortho_child, index[j + 1:], subset + (int(index[j]),)))
+    return res
+
+
+def _search(
+    leaders: _Leaders,
+    e: np.ndarray,
+    ortho: np.ndarray,
+    index: np.ndarray,
+    subset: Subset,
+    norm2: np.ndarray,
+    max_size: int,
+) -> int:
+    """
+    depth-first search of the subtree of subset, return the number of nodes
+    """
+    stack = [(e, ortho, index, subset)]
+    n_node = 0
+    while stack:
+        state = stack.pop()
+        n_node += 1
+        # children are pushed in reverse, so that the largest subtrees are searched first
+        stack.extend(_expand(leaders, *state, norm2, max_size)[::-1])
+    return n_node
+
+
+def _search_tasks(
+    leaders: _Leaders,
+    tasks: List[Tuple[np.ndarray, np.ndarray, np.ndarray, Subset]],
+    norm2: np.ndarray,
+    max_size: int,
+) -> Tuple[_Leaders, int]:
+    """
+    _search of several subtrees in a worker process, which returns its copy of leaders
+    """
+    n_node = sum(_search(leaders, *task, norm2, max_size) for task in tasks)
+    return leaders, n_node
@@ -0,0 +1,33 @@
+"""
+Input validation shared by the Analyzers
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def _check_input(exmatrix: np.ndarray, result: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    validate exmatrix and result, a 1-d result is taken as a single response
+
+    Parameters
+    ----------
+    exmatrix: numpy.ndarray
+        Target experiment Matrix (n_experiment x n_factor), or any design convertible by np.asarray
+    result: numpy.ndarray
+        Target Result Matrix (n_experiment x n_response) or (n_experiment)
+
+    Returns
+    -------
+    exmatrix, result: Tuple[numpy.ndarray, numpy.ndarray]
+        exmatrix as an array and result as a float (n_experiment x n_response) array
+    """
+    exmatrix = np.asarray(exmatrix)
+    result = np.asarray(result, dtype=float)
+    assert exmatrix.ndim == 2, \
+        f"Invalid input: exmatrix expected 2-d array, got {exmatrix.ndim}-d array"
+    if result.ndim == 1:
+        result = result[:, None]
+    assert result.ndim == 2 and len(result) == len(exmatrix), \
+        f"Invalid input: result expected ({len(exmatrix)} x n_response) array, got {result.shape}"
+    return exmatrix, result
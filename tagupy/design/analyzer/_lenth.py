@@ -0,0 +1,195 @@
+"""
+_Analyzer Class of Lenth's Method for Unreplicated Designs Module
+"""
+from typing import List, NamedTuple, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from tagupy.design.analyzer._walsh_hadamard import WalshHadamard
+from tagupy.type import _Analyzer as Analyzer
+from tagupy.utils import LRUCache
+from tagupy.utils._model_matrix import _label
+from tagupy.utils._special import _norm_ppf, _t_isf2
+
+lenth_critical_cache = LRUCache(maxsize=256)
+
+
+class LenthResult(NamedTuple):
+    """
+    Lenth's analysis of the effects of every response
+
+    Attributes
+    ----------
+    labels: List[str]
+        names of the effects (n_effect)
+    effects: numpy.ndarray
+        effects, i.e. twice the coefficients of the -1/+1 coded terms (n_effect x n_response)
+    pse: numpy.ndarray
+        Lenth's pseudo standard error (n_response)
+    me: numpy.ndarray
+        margin of error t_{1 - alpha / 2, m / 3} PSE (n_response)
+    sme: numpy.ndarray
+        simultaneous margin of error t_{gamma, m / 3} PSE,
+        gamma = (1 + (1 - alpha)^(1 / m)) / 2 (n_response)
+    active: numpy.ndarray
+        bool, |effects| > me (n_effect x n_response)
+    half_normal: numpy.ndarray
+        half-normal quantile of the rank of each |effect| in its response (n_effect x n_response),
+        the x-axis of the half-normal plot
+
+    Notes
+    -----
+    m is the number of effects.
+    """
+    labels: List[str]
+    effects: np.ndarray
+    pse: np.ndarray
+    me: np.ndarray
+    sme: np.ndarray
+    active: np.ndarray
+    half_normal: np.ndarray
+
+
+class Lenth(Analyzer):
+    """
+    _Analyzer Class of Lenth's Method for Unreplicated Designs Module
+
+    Methods
+    -------
+    analyze(exmatrix: numpy.ndarray, result: numpy.ndarray) -> LenthResult
+    analyze_effects(effects: numpy.typing.ArrayLike) -> LenthResult
+
+    Notes
+    -----
+    The effects of a two-level orthogonal design are estimated by WalshHadamard,
+    every term of a 2^k full factorial design and the main effects of other designs
+    such as Plackett-Burman designs.
+    For the m effects c of each response,
+    s0 = 1.5 median|c| and PSE = 1.5 median{|c| : |c| < 2.5 s0}.
+    The absolute effects are sorted once along the effects,
+    so that the trimmed set is a prefix of every column
+    and both medians are gathered for all the responses at once.
+    The critical values depend only on (m, alpha) and are kept in lenth_critical_cache.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.analyzer import Lenth
+    >>> from tagupy.design.generator import FullFact
+    >>> exmatrix = FullFact(n_rep=1).get_exmatrix(levels=[2, 2, 2, 2])
+    >>> noise = np.random.default_rng(0).normal(scale=0.1, size=len(exmatrix))
+    >>> result = 10 + 2 * exmatrix[:, 0] - 3 * exmatrix[:, 2] + noise
+    >>> res = Lenth(alpha=0.05).analyze(exmatrix, result)
+    >>> [label for label, active in zip(res.labels, res.active[:, 0]) if active]
+    ['x0', 'x2']
+    """
+
+    def __init__(self, alpha: float = 0.05):
+        """
+        Parameters
+        ----------
+        alpha: float
+            significance level of the margins of error
+        """
+        assert isinstance(alpha, float) and 0 < alpha < 1, \
+            f"Invalid input: alpha expected float in (0, 1), got {type(alpha)}::{alpha}"
+        self.alpha = alpha
+
+    def analyze(self, exmatrix: np.ndarray, result: np.ndarray) -> LenthResult:
+        """
+        Estimate the effects and test them by Lenth's method
+
+        Parameters
+        ----------
+        exmatrix: numpy.ndarray
+            Target experiment Matrix (n_experiment x n_factor) of an orthogonal two-level design
+        result: numpy.ndarray
+            Target Result Matrix (n_experiment x n_response)
+
+        Returns
+        -------
+        analysis_result: LenthResult
+            effects and margins of error of every response
+        """
+        estimate = WalshHadamard().analyze(exmatrix, result)
+        assert estimate.method != "lstsq", \
+            "Invalid input: exmatrix expected an orthogonal two-level design"
+        if estimate.contrasts is None:
+            effects = estimate.effects
+            labels = [_label((j,)) for j in range(len(effects))]
+        else:
+            effects = 2 * estimate.contrasts[1:]
+            n_factor = np.asarray(exmatrix).shape[1]
+            labels = [_label(tuple(j for j in range(n_factor) if s >> j & 1))
+                      for s in range(1, len(estimate.contrasts))]
+        return self._test(labels, effects)
+
+    def analyze_effects(self, effects: npt.ArrayLike) -> LenthResult:
+        """
+        Test effects estimated elsewhere by Lenth's method
+
+        Parameters
+        ----------
+        effects: numpy.typing.ArrayLike
+            effects of an orthogonal design, (n_effect x n_response) or (n_effect)
+
+        Returns
+        -------
+        analysis_result: LenthResult
+            margins of error of every response, the labels being "e0", "e1", ...
+        """
+        effects = np.asarray(effects, dtype=float)
+        if effects.ndim == 1:
+            effects = effects[:, None]
+        assert effects.ndim == 2 and len(effects) >= 2, \
+            f"Invalid input: effects expected (n_effect >= 2 x n_response) array, " \
+            f"got {effects.shape}"
+        return self._test([f"e{i}" for i in range(len(effects))], effects)
+
+    def _test(self, labels: List[str], effects: np.ndarray) -> LenthResult:
+        m = len(effects)
+        pse = _pse(effects)
+        t_me, t_sme = _critical_values(m, self.alpha)
+        me, sme = t_me * pse, t_sme * pse
+        rank = np.empty(effects.shape, dtype=np.int64)
+        np.put_along_axis(rank, np.argsort(np.abs(effects), axis=0),
+                          np.arange(m)[:, None], axis=0)
+        quantiles = _norm_ppf(0.5 + 0.5 * (np.arange(m) + 0.5) / m)
+        return LenthResult(
+            labels=labels,
+            effects=effects,
+            pse=pse,
+            me=me,
+            sme=sme,
+            active=np.abs(effects) > me,
+            half_normal=quantiles[rank],
+        )
+
+
+def _pse(effects: np.ndarray) -> np.ndarray:
+    """
+    Lenth's pseudo standard error of every column of effects
+    """
+    m = len(effects)
+    abs_sorted = np.sort(np.abs(effects), axis=0)
+    s0 = 1.5 * (abs_sorted[(m - 1) // 2] + abs_sorted[m // 2]) / 2
+    # |c| < 2.5 s0 keeps a prefix of the sorted column, of at least its lower half
+    count = (abs_sorted < 2.5 * s0).sum(axis=0)
+    count = np.maximum(count, 1)
+    low = np.take_along_axis(abs_sorted, ((count - 1) // 2)[None], axis=0)[0]
+    high = np.take_along_axis(abs_sorted, (count // 2)[None], axis=0)[0]
+    pse: np.ndarray = 1.5 * (low + high) / 2
+    return pse
+
+
+def _critical_values(m: int, alpha: float) -> Tuple[float, float]:
+    """
+    t quantiles of the margin of error and the simultaneous margin of error, with m / 3 df
+    """
+    def factory() -> Tuple[float, float]:
+        p = np.array([alpha, 1 - (1 - alpha) ** (1 / m)])
+        t_me, t_sme = _t_isf2(p, m / 3)
+        return float(t_me), float(t_sme)
+    t_me, t_sme = lenth_critical_cache.get((m, alpha), factory)
+    return float(t_me), float(t_sme)
@@ -0,0 +1,255 @@
+"""
+_Analyzer Class of Recursive Least-squares Module
+"""
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from tagupy.design.analyzer._input import _check_input
+from tagupy.type import _Analyzer as Analyzer
+from tagupy.utils import ModelMatrix
+from tagupy.utils._linalg import _back_substitution, _qr_add_row, _qr_delete_row
+from tagupy.utils._model_matrix import _expand_terms, _label
+
+
+class RecursiveFit(NamedTuple):
+    """
+    Current least-squares fit of a RecursiveLeastSquares analysis
+
+    Attributes
+    ----------
+    labels: List[str]
+        names of the model terms (n_term)
+    coef: numpy.ndarray
+        regression coefficients (n_term x n_response),
+        nan while the runs do not determine every term
+    ss_error: numpy.ndarray
+        residual sums of squares (n_response)
+    n_run: int
+        number of runs in the fit
+    df_error: int
+        degrees of freedom of the residuals
+    """
+    labels: List[str]
+    coef: np.ndarray
+    ss_error: np.ndarray
+    n_run: int
+    df_error: int
+
+
+class RecursiveLeastSquares(Analyzer):
+    """
+    _Analyzer Class of Recursive Least-squares Module
+
+    Methods
+    -------
+    analyze(exmatrix: numpy.ndarray, result: numpy.ndarray) -> RecursiveFit
+    update(run_row: numpy.typing.ArrayLike, response: numpy.typing.ArrayLike) -> RecursiveFit
+    downdate(run_row: numpy.typing.ArrayLike, response: numpy.typing.ArrayLike) -> RecursiveFit
+
+    Notes
+    -----
+    The analyzer keeps the triangular factor R of the model matrix X = QR,
+    the rotated responses Q'Y and the residual sums of squares, but not the runs.
+    analyze() starts a new fit by one QR factorization,
+    update() appends runs by Givens rotations and downdate() removes runs,
+    e.g. a bad run, by hyperbolic rotations.
+    Each run costs O(p (p + m)) and the coefficients one back substitution in O(p^2 m),
+    p and m being the numbers of terms and responses, instead of a refit over every run.
+
+    The terms are fixed on the first call: a specification such as "quadratic"
+    is expanded on the runs of that call, so give explicit terms
+    when the fit starts from update() with a single run.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.analyzer import RecursiveLeastSquares
+    >>> from tagupy.design.generator import PlackettBurman
+    >>> exmatrix = PlackettBurman(n_rep=1).get_exmatrix(n_factor=3)
+    >>> result = 5 + 2 * exmatrix[:, 0] - exmatrix[:, 2]
+    >>> rls = RecursiveLeastSquares(terms="linear")
+    >>> fit = rls.analyze(exmatrix, result)
+    >>> fit.coef[:, 0].round(3) + 0.
+    array([ 5.,  2.,  0., -1.])
+    >>> fit = rls.update([1, 1, 1], 8.)
+    >>> fit.n_run, fit.ss_error.round(3)
+    (5, array([2.]))
+    >>> fit = rls.downdate([1, 1, 1], 8.)
+    >>> fit.n_run, fit.ss_error.round(3) + 0.
+    (4, array([0.]))
+    """
+
+    def __init__(self, terms: Union[str, Iterable[Iterable[int]]] = "linear"):
+        """
+        Parameters
+        ----------
+        terms: Union[str, Iterable[Iterable[int]]]
+            model terms, "linear", "interaction", "quadratic" or explicit tuples of factor indices,
+            see also tagupy.utils.ModelMatrix
+        """
+        self.terms = terms
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Discard the current fit
+        """
+        self._terms: Optional[Tuple[Tuple[int, ...], ...]] = None
+        self._n_factor = 0
+        self._r = np.empty((0, 0))
+        self._z = np.empty((0, 0))
+        self._ss_error = np.empty(0)
+        self._n_run = 0
+
+    def analyze(self, exmatrix: np.ndarray, result: np.ndarray) -> RecursiveFit:
+        """
+        Start a new fit on the runs of exmatrix
+
+        Parameters
+        ----------
+        exmatrix: numpy.ndarray
+            Target experiment Matrix (n_experiment x n_factor)
+        result: numpy.ndarray
+            Target Result Matrix (n_experiment x n_response)
+
+        Returns
+        -------
+        analysis_result: RecursiveFit
+            least-squares fit of the runs
+        """
+        exmatrix, result = _check_input(exmatrix, result)
+        self.reset()
+        terms = self._start(exmatrix, result.shape[1])
+        x = ModelMatrix(exmatrix, terms=terms).toarray()
+        q, r = np.linalg.qr(x)
+        z = q.T @ result
+        resid = result - q @ z
+        self._r[:len(r)] = r
+        self._z[:len(z)] = z
+        self._ss_error = (resid * resid).sum(axis=0)
+        self._n_run = len(exmatrix)
+        return self.get_fit()
+
+    def update(self, run_row: npt.ArrayLike, response: npt.ArrayLike) -> RecursiveFit:
+        """
+        Add runs to the fit
+
+        Parameters
+        ----------
+        run_row: numpy.typing.ArrayLike
+            levels of the factors of a run (n_factor), or of several runs (n_run x n_factor)
+        response: numpy.typing.ArrayLike
+            responses of the runs, (n_response) or (n_run x n_response)
+
+        Returns
+        -------
+        analysis_result: RecursiveFit
+            least-squares fit including the runs
+        """
+        rows, responses = self._check_runs(run_row, response)
+        terms = self._terms if self._terms is not None else self._start(rows, responses.shape[1])
+        for x, y in zip(_model_rows(rows, terms), responses):
+            e = _qr_add_row(self._r, self._z, x, y)
+            self._ss_error = self._ss_error + e * e
+            self._n_run += 1
+        return self.get_fit()
+
+    def downdate(self, run_row: npt.ArrayLike, response: npt.ArrayLike) -> RecursiveFit:
+        """
+        Remove runs from the fit
+
+        Parameters
+        ----------
+        run_row: numpy.typing.ArrayLike
+            levels of the factors of a run (n_factor), or of several runs (n_run x n_factor),
+            which must have been added with the same response
+        response: numpy.typing.ArrayLike
+            responses of the runs, (n_response) or (n_run x n_response)
+
+        Returns
+        -------
+        analysis_result: RecursiveFit
+            least-squares fit without the runs
+
+        Raises
+        ------
+        numpy.linalg.LinAlgError
+            if the remaining runs do not determine every term, the fit is left unchanged then
+        """
+        rows, responses = self._check_runs(run_row, response)
+        assert self._terms is not None and len(rows) <= self._n_run, \
+            f"Invalid input: run_row expected at most {self._n_run} runs in the fit, " \
+            f"got {len(rows)}"
+        r, z, ss_error = self._r.copy(), self._z.copy(), self._ss_error.copy()
+        for x, y in zip(_model_rows(rows, self._terms), responses):
+            e = _qr_delete_row(r, z, x, y)
+            ss_error = ss_error - e * e
+        self._r, self._z = r, z
+        self._ss_error = np.maximum(ss_error, 0.)
+        self._n_run -= len(rows)
+        return self.get_fit()
+
+    def get_fit(self) -> RecursiveFit:
+        """
+        Return the current fit in O(p^2 m) operations
+
+        Returns
+        -------
+        analysis_result: RecursiveFit
+            least-squares fit of the runs added so far
+        """
+        assert self._terms is not None, \
+            "Invalid call: no run has been added, call analyze or update first"
+        diag = np.abs(np.diag(self._r))
+        if (diag <= 1e-10 * max(diag.max(initial=0.), 1e-300)).any():
+            coef = np.full(self._z.shape, np.nan)
+        else:
+            coef = _back_substitution(self._r, self._z)
+        return RecursiveFit(
+            labels=[_label(term) for term in self._terms],
+            coef=coef,
+            ss_error=self._ss_error.copy(),
+            n_run=self._n_run,
+            df_error=self._n_run - len(self._terms),
+        )
+
+    def _start(self, exmatrix: np.ndarray, n_response: int) -> Tuple[Tuple[int, ...], ...]:
+        """
+        fix the terms on the runs of exmatrix and allocate an empty fit, returning the terms
+        """
+        terms = _expand_terms(exmatrix, self.terms)
+        self._terms = terms
+        self._n_factor = exmatrix.shape[1]
+        self._r = np.zeros((len(terms), len(terms)))
+        self._z = np.zeros((len(terms), n_response))
+        self._ss_error = np.zeros(n_response)
+        return terms
+
+    def _check_runs(
+        self,
+        run_row: npt.ArrayLike,
+        response: npt.ArrayLike,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        rows = np.asarray(run_row, dtype=float)
+        responses = np.asarray(response, dtype=float)
+        if rows.ndim == 1:
+            rows, responses = rows[None], responses.reshape(1, -1)
+        elif responses.ndim == 1:
+            responses = responses[:, None]
+        assert rows.ndim == 2 and (self._terms is None or rows.shape[1] == self._n_factor), \
+            f"Invalid input: run_row expected ({self._n_factor or 'n_factor'}) " \
+            f"or (n_run x n_factor) array, got {rows.shape}"
+        n_response = self._z.shape[1] if self._terms is not None else responses.shape[-1]
+        assert responses.shape == (len(rows), n_response), \
+            f"Invalid input: response expected ({len(rows)} x {n_response}) array, " \
+            f"got {responses.shape}"
+        return rows, responses
+
+
+def _model_rows(rows: np.ndarray, terms: Tuple[Tuple[int, ...], ...]) -> np.ndarray:
+    """
+    rows of the model matrix of a few runs, without going through the column cache
+    """
+    return np.stack([np.prod(rows[:, list(term)], axis=1) for term in terms], axis=1)
@@ -0,0 +1,87 @@
+"""
+Replicate structure of the experiment shared by the Analyzers
+"""
+from typing import NamedTuple, Union
+
+import numpy as np
+
+from tagupy.design.analyzer._input import _check_input
+from tagupy.design.generator import ReplicatedDesign
+
+
+class ReplicateSummary(NamedTuple):
+    """
+    Sufficient statistics of the replicated runs of an experiment
+
+    Attributes
+    ----------
+    exmatrix: numpy.ndarray
+        distinct runs of the experiment (n_unique x n_factor)
+    counts: numpy.ndarray
+        number of replicates of each distinct run (n_unique)
+    means: numpy.ndarray
+        mean responses of each distinct run (n_unique x n_response)
+    ss_within: numpy.ndarray
+        within-run sums of squares around the means (n_unique x n_response)
+    """
+    exmatrix: np.ndarray
+    counts: np.ndarray
+    means: np.ndarray
+    ss_within: np.ndarray
+
+
+def _collapse(
+    exmatrix: Union[np.ndarray, ReplicatedDesign],
+    result: np.ndarray,
+) -> ReplicateSummary:
+    """
+    collapse the replicated runs into their sufficient statistics
+
+    Parameters
+    ----------
+    exmatrix: Union[numpy.ndarray, ReplicatedDesign]
+        Target experiment Matrix (n_experiment x n_factor),
+        a ReplicatedDesign gives its replicate structure without being materialized
+    result: numpy.ndarray
+        Target Result Matrix (n_experiment x n_response) or (n_experiment)
+
+    Returns
+    -------
+    summary: ReplicateSummary
+        distinct runs in the order of np.unique and their statistics
+
+    Notes
+    -----
+    The result of a ReplicatedDesign is reshaped into (n_rep x n_run x n_response)
+    and reduced over the replicates, then the runs of its base block are grouped,
+    so that the stacked experiment matrix is never created.
+    Any other exmatrix is grouped directly by np.unique.
+    Groups are merged with the pooled statistics
+    n = sum n_i, mean = sum n_i m_i / n and ss = sum ss_i + sum n_i (m_i - mean)^2.
+    """
+    if isinstance(exmatrix, ReplicatedDesign):
+        _, result = _check_input(np.empty((len(exmatrix), 0)), result)
+        blocks = result.reshape(exmatrix.n_rep, len(exmatrix.base), -1)
+        means = blocks.mean(axis=0)
+        ss_within = ((blocks - means) ** 2).sum(axis=0)
+        counts = np.full(len(means), exmatrix.n_rep)
+        exmatrix = exmatrix.base
+    else:
+        exmatrix, result = _check_input(exmatrix, result)
+        means, ss_within = result, np.zeros(result.shape)
+        counts = np.ones(len(result), dtype=np.int64)
+
+    unique, inverse = np.unique(exmatrix, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    if len(unique) == len(exmatrix):
+        order = np.argsort(inverse)
+        return ReplicateSummary(unique, counts[order], means[order], ss_within[order])
+
+    order = np.argsort(inverse, kind="stable")
+    start = np.flatnonzero(np.r_[True, np.diff(inverse[order]) != 0])
+    counts, means, ss_within = counts[order], means[order], ss_within[order]
+    n = np.add.reduceat(counts, start)
+    mean = np.add.reduceat(counts[:, None] * means, start) / n[:, None]
+    dev = means - np.repeat(mean, np.diff(np.r_[start, len(order)]), axis=0)
+    ss = np.add.reduceat(ss_within + counts[:, None] * dev ** 2, start)
+    return ReplicateSummary(unique, n, mean, ss)
@@ -0,0 +1,238 @@
+"""
+_Analyzer Class of Permutation and Bootstrap Inference Module
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from tagupy.design.analyzer._input import _check_input
+from tagupy.type import _Analyzer as Analyzer
+from tagupy.utils import ModelMatrix, is_positive_int
+
+_METHODS = ("permutation", "bootstrap")
+
+
+class ResamplingResult(NamedTuple):
+    """
+    Resampling inference on the coefficients of every response
+
+    Attributes
+    ----------
+    labels: List[str]
+        names of the model terms (n_term)
+    coef: numpy.ndarray
+        least-squares coefficients (n_term x n_response)
+    p_value: Optional[numpy.ndarray]
+        two-sided permutation p-values (n_term x n_response), None for the bootstrap,
+        nan for the intercept, whose estimate, the mean, is invariant under permutations
+    std_err: Optional[numpy.ndarray]
+        bootstrap standard errors (n_term x n_response), None for permutations
+    ci_low: Optional[numpy.ndarray]
+        lower bounds of the percentile confidence intervals (n_term x n_response),
+        None for permutations
+    ci_high: Optional[numpy.ndarray]
+        upper bounds of the percentile confidence intervals (n_term x n_response),
+        None for permutations
+    n_resample: int
+        number of resamples
+    method: str
+        "permutation" or "bootstrap"
+    """
+    labels: List[str]
+    coef: np.ndarray
+    p_value: Optional[np.ndarray]
+    std_err: Optional[np.ndarray]
+    ci_low: Optional[np.ndarray]
+    ci_high: Optional[np.ndarray]
+    n_resample: int
+    method: str
+
+
+class Resampling(Analyzer):
+    """
+    _Analyzer Class of Permutation and Bootstrap Inference Module
+
+    Method
+    ------
+    analyze(exmatrix: numpy.ndarray, result: numpy.ndarray) -> ResamplingResult
+
+    Notes
+    -----
+    The model matrix X is factorized once into the projection P = (X'X)^-1 X',
+    so that a batch of B resamples is refitted by one product P Y* of (B x n x m) responses.
+    "permutation": the responses are permuted over the runs,
+    and the p-value of a coefficient is (1 + #{|coef*| >= |coef|}) / (1 + n_resample)
+    "bootstrap": the residuals, rescaled by sqrt(n / (n - p)), are resampled with replacement
+    and added to the fitted values, which gives coef* = coef + P e*
+
+    The resamples are drawn in batches of batch_size,
+    each from its own stream spawned by numpy.random.SeedSequence(seed),
+    so that the results depend on seed and batch_size but not on n_jobs.
+    With n_jobs > 1, the batches are solved in a process pool.
+    The bootstrap keeps every coef* for the percentile intervals,
+    i.e. n_resample x n_term x n_response floats.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.analyzer import Resampling
+    >>> from tagupy.design.generator import FullFact
+    >>> exmatrix = FullFact(n_rep=2).get_exmatrix(levels=[2, 2, 2])
+    >>> noise = np.random.default_rng(0).normal(scale=0.2, size=len(exmatrix))
+    >>> result = 1 + exmatrix[:, 0] + noise
+    >>> res = Resampling(method="permutation", n_resample=2000, seed=0).analyze(exmatrix, result)
+    >>> res.labels
+    ['1', 'x0', 'x1', 'x2']
+    >>> bool(res.p_value[1, 0] < 0.01), bool(res.p_value[2, 0] > 0.05)
+    (True, True)
+    """
+
+    def __init__(
+        self,
+        method: str = "permutation",
+        n_resample: int = 10000,
+        terms: Union[str, Iterable[Iterable[int]]] = "linear",
+        alpha: float = 0.05,
+        batch_size: int = 1000,
+        n_jobs: int = 1,
+        seed: Optional[int] = None,
+    ):
+        """
+        Parameters
+        ----------
+        method: str
+            "permutation" or "bootstrap"
+        n_resample: int
+            number of resamples
+        terms: Union[str, Iterable[Iterable[int]]]
+            model terms, "linear", "interaction", "quadratic" or explicit tuples of factor indices,
+            see also tagupy.utils.ModelMatrix
+        alpha: float
+            1 - confidence level of the bootstrap intervals
+        batch_size: int
+            number of resamples refitted at once
+        n_jobs: int
+            number of processes, the batches are solved in the calling process when 1
+        seed: Optional[int]
+            entropy of numpy.random.SeedSequence, fresh entropy if None
+        """
+        assert method in _METHODS, \
+            f"Invalid input: method expected one of {_METHODS}, got {type(method)}::{method}"
+        for name, value in [("n_resample", n_resample), ("batch_size", batch_size),
+                            ("n_jobs", n_jobs)]:
+            assert is_positive_int(value), \
+                f"Invalid input: {name} expected positive (>0) integer, got {type(value)}::{value}"
+        assert isinstance(alpha, float) and 0 < alpha < 1, \
+            f"Invalid input: alpha expected float in (0, 1), got {type(alpha)}::{alpha}"
+        self.method = method
+        self.n_resample = n_resample
+        self.terms = terms
+        self.alpha = alpha
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.seed = seed
+
+    def analyze(self, exmatrix: np.ndarray, result: np.ndarray) -> ResamplingResult:
+        """
+        Fit the model and resample every response
+
+        Parameters
+        ----------
+        exmatrix: numpy.ndarray
+            Target experiment Matrix (n_experiment x n_factor)
+        result: numpy.ndarray
+            Target Result Matrix (n_experiment x n_response)
+
+        Returns
+        -------
+        analysis_result: ResamplingResult
+            coefficients with their permutation p-values or bootstrap intervals
+
+        Raises
+        ------
+        numpy.linalg.LinAlgError
+            if the model matrix does not have full column rank
+        """
+        exmatrix, result = _check_input(exmatrix, result)
+        model = ModelMatrix(exmatrix, terms=self.terms)
+        x = model.toarray()
+        n_run, n_term = x.shape
+        if n_term >= n_run or np.linalg.matrix_rank(x) < n_term:
+            raise np.linalg.LinAlgError(
+                "model matrix expected full column rank with residual degrees of freedom")
+        proj = np.linalg.pinv(x)
+        coef = proj @ result
+
+        sizes = [self.batch_size] * (self.n_resample // self.batch_size)
+        if self.n_resample % self.batch_size:
+            sizes.append(self.n_resample % self.batch_size)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        if self.method == "permutation":
+            data = result
+        else:
+            resid = result - x @ coef
+            data = resid * np.sqrt(n_run / (n_run - n_term))
+        args = [(self.method, seed, size, proj, data, coef) for seed, size in zip(seeds, sizes)]
+        if self.n_jobs == 1:
+            batches = [_batch(*arg) for arg in args]
+        else:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as pool:
+                batches = list(pool.map(_batch, *zip(*args)))
+
+        if self.method == "permutation":
+            p_value = (1 + np.sum(batches, axis=0)) / (1 + self.n_resample)
+            if () in model.terms:
+                p_value[model.terms.index(())] = np.nan
+            return ResamplingResult(
+                labels=model.labels,
+                coef=coef,
+                p_value=p_value,
+                std_err=None,
+                ci_low=None,
+                ci_high=None,
+                n_resample=self.n_resample,
+                method=self.method,
+            )
+        boot = coef + np.concatenate(batches)
+        ci_low, ci_high = np.quantile(boot, [self.alpha / 2, 1 - self.alpha / 2], axis=0)
+        return ResamplingResult(
+            labels=model.labels,
+            coef=coef,
+            p_value=None,
+            std_err=boot.std(axis=0, ddof=1),
+            ci_low=ci_low,
+            ci_high=ci_high,
+            n_resample=self.n_resample,
+            method=self.method,
+        )
+
+
+def _batch(
+    method: str,
+    seed: np.random.SeedSequence,
+    size: int,
+    proj: np.ndarray,
+    data: np.ndarray,
+    coef: np.ndarray,
+) -> np.ndarray:
+    """
+    refit a batch of resamples at once
+
+    Returns
+    -------
+    res: numpy.ndarray
+        "permutation": counts of |coef*| >= |coef| (n_term x n_response)
+        "bootstrap": coef* - coef = P e* (size x n_term x n_response)
+    """
+    rng = np.random.default_rng(seed)
+    n_run = len(data)
+    if method == "permutation":
+        index = rng.permuted(np.broadcast_to(np.arange(n_run), (size, n_run)), axis=1)
+        resampled = proj @ data[index]
+        tol = 1e-12 * np.maximum(np.abs(coef), 1e-300)
+        count: np.ndarray = (np.abs(resampled) >= np.abs(coef) - tol).sum(axis=0)
+        return count
+    index = rng.integers(0, n_run, size=(size, n_run))
+    delta: np.ndarray = proj @ data[index]
+    return delta
@@ -0,0 +1,194 @@
+"""
+_Analyzer Class of Taguchi Signal-to-Noise Ratio Module
+"""
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from tagupy.design.analyzer._input import _check_input
+from tagupy.design.generator import ReplicatedDesign
+from tagupy.type import _Analyzer as Analyzer
+from tagupy.utils import is_positive_int
+
+_KINDS = ("larger", "smaller", "nominal")
+
+
+class SNRatioResult(NamedTuple):
+    """
+    Signal-to-noise ratios of the runs and their response tables
+
+    Attributes
+    ----------
+    exmatrix: numpy.ndarray
+        runs of a single replicate (n_run x n_factor)
+    sn: numpy.ndarray
+        SN ratio of each run in dB (n_run x n_response)
+    mean: numpy.ndarray
+        mean response of each run over the replicates (n_run x n_response)
+    levels: List[numpy.ndarray]
+        sorted levels of each factor (n_factor, each n_level)
+    effects: List[numpy.ndarray]
+        mean SN ratio at each level of each factor (n_factor, each n_level x n_response)
+    delta: numpy.ndarray
+        range of the mean SN ratios over the levels of each factor (n_factor x n_response)
+    best: numpy.ndarray
+        level of each factor with the largest mean SN ratio (n_factor x n_response)
+    """
+    exmatrix: np.ndarray
+    sn: np.ndarray
+    mean: np.ndarray
+    levels: List[np.ndarray]
+    effects: List[np.ndarray]
+    delta: np.ndarray
+    best: np.ndarray
+
+
+class SNRatio(Analyzer):
+    """
+    _Analyzer Class of Taguchi Signal-to-Noise Ratio Module
+
+    Method
+    ------
+    analyze(exmatrix: Union[numpy.ndarray, ReplicatedDesign], result: numpy.ndarray)
+        -> SNRatioResult
+
+    Notes
+    -----
+    The replicates, e.g. the runs of an outer (noise) array crossed with the inner array,
+    are laid out as n_rep stacked blocks of the same n_run runs,
+    so that the result is reshaped into a (n_rep x n_run x n_response) view
+    and every SN ratio is a single reduction over the replicates:
+    "larger": -10 log10(mean(1 / y^2))
+    "smaller": -10 log10(mean(y^2))
+    "nominal": 10 log10(mean(y)^2 / s^2), s^2 being the unbiased variance
+    The runs are grouped by the levels of every factor at once,
+    with one argsort and one np.add.reduceat over the (factor, level) pairs.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.analyzer import SNRatio
+    >>> from tagupy.design.generator import FullFact
+    >>> design = FullFact(n_rep=50).get_exmatrix(levels=[2, 3], lazy=True)
+    >>> noise = np.random.default_rng(0).normal(size=len(design))
+    >>> x = np.asarray(design)
+    >>> result = 10 + x[:, 1] + (1 + 2 * x[:, 0]) * noise
+    >>> res = SNRatio(kind="nominal").analyze(design, result)
+    >>> [level.tolist() for level in res.levels]
+    [[0, 1], [0, 1, 2]]
+    >>> res.best[:, 0]
+    array([0., 2.])
+    """
+
+    def __init__(self, kind: str = "nominal", n_rep: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        kind: str
+            "larger" (larger-is-better), "smaller" (smaller-is-better)
+            or "nominal" (nominal-is-best)
+        n_rep: Optional[int]
+            number of stacked blocks of a plain exmatrix,
+            n_rep of a ReplicatedDesign or the number of distinct runs if None
+        """
+        assert kind in _KINDS, \
+            f"Invalid input: kind expected one of {_KINDS}, got {type(kind)}::{kind}"
+        assert n_rep is None or is_positive_int(n_rep), \
+            f"Invalid input: n_rep expected positive (>0) integer, got {type(n_rep)}::{n_rep}"
+        self.kind = kind
+        self.n_rep = n_rep
+
+    def analyze(
+        self,
+        exmatrix: Union[np.ndarray, ReplicatedDesign],
+        result: np.ndarray,
+    ) -> SNRatioResult:
+        """
+        Compute the SN ratio of every run and the response tables of the factors
+
+        Parameters
+        ----------
+        exmatrix: Union[numpy.ndarray, ReplicatedDesign]
+            Target experiment Matrix (n_rep * n_run x n_factor) made of n_rep identical blocks,
+            a ReplicatedDesign is never materialized
+        result: numpy.ndarray
+            Target Result Matrix (n_rep * n_run x n_response)
+
+        Returns
+        -------
+        analysis_result: SNRatioResult
+            SN ratios, mean responses and response tables
+        """
+        base, blocks = _blocks(exmatrix, result, self.n_rep)
+        assert self.kind != "nominal" or len(blocks) >= 2, \
+            "Invalid input: nominal-is-best expected n_rep >= 2"
+        mean = blocks.mean(axis=0)
+        with np.errstate(divide="ignore"):
+            if self.kind == "larger":
+                sn = -10 * np.log10(np.mean(blocks ** -2, axis=0))
+            elif self.kind == "smaller":
+                sn = -10 * np.log10(np.einsum("ijk,ijk->jk", blocks, blocks) / len(blocks))
+            else:
+                sn = 10 * np.log10(mean ** 2 / blocks.var(axis=0, ddof=1))
+        levels, effects = _response_tables(base, sn)
+        delta = np.array([table.max(axis=0) - table.min(axis=0) for table in effects])
+        best = np.array([level[np.argmax(table, axis=0)]
+                         for level, table in zip(levels, effects)], dtype=float)
+        return SNRatioResult(
+            exmatrix=base,
+            sn=sn,
+            mean=mean,
+            levels=levels,
+            effects=effects,
+            delta=delta.reshape(len(effects), sn.shape[1]),
+            best=best.reshape(len(effects), sn.shape[1]),
+        )
+
+
+def _blocks(
+    exmatrix: Union[np.ndarray, ReplicatedDesign],
+    result: np.ndarray,
+    n_rep: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    single block of the runs and the (n_rep x n_run x n_response) view of the result
+    """
+    if isinstance(exmatrix, ReplicatedDesign):
+        assert n_rep is None or n_rep == exmatrix.n_rep, \
+            f"Invalid input: n_rep expected {exmatrix.n_rep} for the ReplicatedDesign, got {n_rep}"
+        _, result = _check_input(np.empty((len(exmatrix), 0)), result)
+        return exmatrix.base, result.reshape(exmatrix.n_rep, len(exmatrix.base), -1)
+
+    exmatrix, result = _check_input(exmatrix, result)
+    if n_rep is None:
+        n_rep = len(exmatrix) // len(np.unique(exmatrix, axis=0))
+    assert len(exmatrix) % n_rep == 0, \
+        f"Invalid input: exmatrix expected n_rep={n_rep} blocks, got {len(exmatrix)} runs"
+    n_run = len(exmatrix) // n_rep
+    stacked = exmatrix.reshape(n_rep, n_run, -1)
+    assert (stacked == stacked[0]).all(), \
+        "Invalid input: exmatrix expected n_rep identical stacked blocks"
+    return stacked[0], result.reshape(n_rep, n_run, -1)
+
+
+def _response_tables(
+    exmatrix: np.ndarray,
+    sn: np.ndarray,
+) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    """
+    sorted levels of every factor and the mean SN ratio at each of them
+    """
+    n_run, n_factor = exmatrix.shape
+    levels, codes = [], np.empty((n_factor, n_run), dtype=np.int64)
+    for j in range(n_factor):
+        level, codes[j] = np.unique(exmatrix[:, j], return_inverse=True)
+        levels.append(level)
+    sizes = np.array([len(level) for level in levels], dtype=np.int64)
+    offsets = np.r_[0, np.cumsum(sizes)[:-1]]
+    # group id of every (factor, run) pair, the groups of a factor being contiguous
+    group = (codes + offsets[:, None]).reshape(-1)
+    order = np.argsort(group, kind="stable")
+    start = np.flatnonzero(np.r_[True, np.diff(group[order]) != 0])
+    sums = np.add.reduceat(sn[order % n_run], start)
+    means = sums / np.diff(np.r_[start, len(order)])[:, None]
+    return levels, np.split(means, offsets[1:])
@@ -0,0 +1,318 @@
+"""
+_Analyzer Class of Stepwise Model Selection Module
+"""
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from tagupy.design.analyzer._input import _check_input
+from tagupy.type import _Analyzer as Analyzer
+from tagupy.utils import ModelMatrix, is_positive_int
+from tagupy.utils._linalg import _back_substitution, _qr_add_column, _qr_delete_column
+from tagupy.utils._model_matrix import _label
+from tagupy.utils._special import _f_sf
+
+_CRITERIA = ("aicc", "bic", "p_value")
+_DIRECTIONS = ("forward", "backward", "both")
+_TOL = 1e-10
+
+
+class StepwiseResult(NamedTuple):
+    """
+    Model selected by a Stepwise analysis
+
+    Attributes
+    ----------
+    labels: List[str]
+        names of the selected terms, in the order they entered the model
+    terms: List[Tuple[int, ...]]
+        selected terms as tuples of factor indices, see also tagupy.utils.ModelMatrix
+    coef: numpy.ndarray
+        regression coefficients of the selected terms (n_term)
+    ss_error: float
+        residual sum of squares of the selected model
+    criterion: float
+        AICc or BIC of the selected model, nan for the p-value criterion
+    history: List[Tuple[str, str, float]]
+        steps as ("add" or "remove", label, AICc or BIC after the step or p-value of the term)
+    """
+    labels: List[str]
+    terms: List[Tuple[int, ...]]
+    coef: np.ndarray
+    ss_error: float
+    criterion: float
+    history: List[Tuple[str, str, float]]
+
+
+class Stepwise(Analyzer):
+    """
+    _Analyzer Class of Stepwise Model Selection Module
+
+    Method
+    ------
+    analyze(exmatrix: numpy.ndarray, result: numpy.ndarray) -> StepwiseResult
+
+    Notes
+    -----
+    The candidate terms are the columns of a ModelMatrix, computed once through its column cache.
+    The current model is kept as a thin QR factorization X = QR,
+    and every candidate as its component orthogonal to Q:
+    the decrease of the residual sum of squares by a candidate c is (c'e)^2 / c'c,
+    e being the residuals, so that a forward step scores all the candidates
+    in one matrix-vector product.
+    The increase by removing a term j is coef_j^2 / [(X'X)^-1]_jj, read from R^-1.
+    A term enters by Gram-Schmidt and leaves by Givens rotations of R,
+    which update Q, the residuals and the candidates in O(n p) and O(n n_candidate)
+    operations instead of a refit at every step.
+
+    Criteria, n and k being the numbers of runs and of selected terms:
+    "aicc": n log(SSE / n) + 2k + 2k (k + 1) / (n - k - 1)
+    "bic": n log(SSE / n) + k log(n)
+    "p_value": partial F test, a term enters if its p-value < alpha_enter
+    and leaves if its p-value > alpha_remove
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.analyzer import Stepwise
+    >>> from tagupy.design.generator import DSD
+    >>> exmatrix = DSD(n_rep=1).get_exmatrix(n_factor=6, n_fake=2)
+    >>> noise = np.random.default_rng(2).normal(scale=0.5, size=len(exmatrix))
+    >>> result = 3 * exmatrix[:, 0] - 2 * exmatrix[:, 3] + exmatrix[:, 0] ** 2 + noise
+    >>> Stepwise(criterion="p_value").analyze(exmatrix, result).labels
+    ['1', 'x0', 'x3', 'x0^2']
+    """
+
+    def __init__(
+        self,
+        criterion: str = "aicc",
+        terms: Union[str, Iterable[Iterable[int]]] = "quadratic",
+        direction: str = "both",
+        alpha_enter: float = 0.05,
+        alpha_remove: float = 0.10,
+        max_step: Optional[int] = None,
+    ):
+        """
+        Parameters
+        ----------
+        criterion: str
+            "aicc", "bic" or "p_value"
+        terms: Union[str, Iterable[Iterable[int]]]
+            candidate terms, "linear", "interaction", "quadratic" or explicit tuples
+            of factor indices, see also tagupy.utils.ModelMatrix,
+            the intercept is always in the model
+        direction: str
+            "forward" starts from the intercept and adds terms,
+            "backward" starts from every candidate and removes terms,
+            "both" starts from the intercept and tries a removal after every addition
+        alpha_enter: float
+            p-value for a term to enter with criterion="p_value"
+        alpha_remove: float
+            p-value for a term to leave with criterion="p_value", alpha_remove >= alpha_enter
+        max_step: Optional[int]
+            maximum number of steps, 2 * n_candidate by default
+        """
+        assert criterion in _CRITERIA, \
+            f"Invalid input: criterion expected one of {_CRITERIA}, " \
+            f"got {type(criterion)}::{criterion}"
+        assert direction in _DIRECTIONS, \
+            f"Invalid input: direction expected one of {_DIRECTIONS}, " \
+            f"got {type(direction)}::{direction}"
+        assert 0 < alpha_enter <= alpha_remove < 1, \
+            f"Invalid input: alpha expected 0 < alpha_enter <= alpha_remove < 1, " \
+            f"got {alpha_enter}, {alpha_remove}"
+        assert max_step is None or is_positive_int(max_step), \
+            f"Invalid input: max_step expected positive (>0) integer, " \
+            f"got {type(max_step)}::{max_step}"
+        self.criterion = criterion
+        self.terms = terms
+        self.direction = direction
+        self.alpha_enter = alpha_enter
+        self.alpha_remove = alpha_remove
+        self.max_step = max_step
+
+    def analyze(self, exmatrix: np.ndarray, result: np.ndarray) -> StepwiseResult:
+        """
+        Select the model terms of the response
+
+        Parameters
+        ----------
+        exmatrix: numpy.ndarray
+            Target experiment Matrix (n_experiment x n_factor)
+        result: numpy.ndarray
+            Target Result Matrix (n_experiment x 1)
+
+        Returns
+        -------
+        analysis_result: StepwiseResult
+            selected terms, their coefficients and the steps
+
+        Raises
+        ------
+        numpy.linalg.LinAlgError
+            if direction="backward" and the model of every candidate is rank deficient
+        """
+        exmatrix, result = _check_input(exmatrix, result)
+        assert result.shape[1] == 1, \
+            f"Invalid input: result expected (n_experiment x 1) array, got {result.shape}"
+        model = ModelMatrix(exmatrix, terms=self.terms)
+        terms = [term for term in model.terms if term]
+        path = _Path(
+            intercept=model.column(()),
+            candidates=model.columns(terms),
+            y=result[:, 0],
+        )
+        if self.direction == "backward":
+            assert len(terms) + 1 <= len(result), \
+                f"Invalid input: direction=\"backward\" expected at most {len(result)} terms " \
+                f"for {len(result)} runs, got {len(terms) + 1}"
+            for j in range(len(terms)):
+                path.add(j)
+
+        history: List[Tuple[str, str, float]] = []
+        max_step = 2 * len(terms) if self.max_step is None else self.max_step
+        changed = True
+        while changed and len(history) < max_step:
+            changed = False
+            if self.direction != "backward":
+                step = self._forward(path)
+                if step is not None:
+                    _do(path, step, terms, history)
+                    changed = True
+            if self.direction != "forward" and len(history) < max_step:
+                step = self._backward(path)
+                if step is not None:
+                    _do(path, step, terms, history)
+                    changed = True
+
+        selected = [terms[j] for j in path.selected]
+        return StepwiseResult(
+            labels=[_label(term) for term in [()] + selected],
+            terms=[()] + selected,
+            coef=path.coef(),
+            ss_error=path.ss_error,
+            criterion=np.nan if self.criterion == "p_value" else float(self._score(path, 0)),
+            history=history,
+        )
+
+    def _score(self, path: "_Path", delta: Union[float, np.ndarray], k: int = 0) -> np.ndarray:
+        """
+        criterion of the model whose residual sum of squares changes by delta
+        and whose number of terms by k
+        """
+        n = len(path.y)
+        k = len(path.selected) + 1 + k
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_sse = n * np.log(np.maximum(path.ss_error + delta, 1e-300) / n)
+            if self.criterion == "bic":
+                penalty = k * np.log(n)
+            else:
+                penalty = 2 * k + 2 * k * (k + 1) / (n - k - 1) if n - k - 1 > 0 else np.inf
+            score: np.ndarray = log_sse + penalty
+        return score
+
+    def _forward(self, path: "_Path") -> Optional[Tuple[str, int, float]]:
+        n, k = len(path.y), len(path.selected) + 1
+        gain, valid = path.gains()
+        if not valid.any() or n - k - 1 <= 0:
+            return None
+        if self.criterion == "p_value":
+            # the p-value decreases with the gain, only the best candidate is tested
+            j = int(np.argmax(np.where(valid, gain, -1.)))
+            df = n - k - 1
+            with np.errstate(divide="ignore"):
+                p_value = float(_f_sf(gain[j] / ((path.ss_error - gain[j]) / df), 1, df))
+            return ("add", j, p_value) if p_value < self.alpha_enter else None
+        score = np.where(valid, self._score(path, -gain, 1), np.inf)
+        j = int(np.argmin(score))
+        return ("add", j, float(score[j])) if score[j] < self._score(path, 0) else None
+
+    def _backward(self, path: "_Path") -> Optional[Tuple[str, int, float]]:
+        if not path.selected:
+            return None
+        n, k = len(path.y), len(path.selected) + 1
+        loss = path.losses()
+        if self.criterion == "p_value":
+            if n - k <= 0:
+                return None
+            i = int(np.argmin(loss))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                p_value = float(_f_sf(loss[i] / (path.ss_error / (n - k)), 1, n - k))
+            return ("remove", i, p_value) if p_value > self.alpha_remove else None
+        score = self._score(path, loss, -1)
+        i = int(np.argmin(score))
+        return ("remove", i, float(score[i])) if score[i] < self._score(path, 0) else None
+
+
+class _Path:
+    """
+    thin QR factorization of the intercept and the selected candidates,
+    with the residuals and the candidates orthogonalized against it
+    """
+
+    def __init__(self, intercept: np.ndarray, candidates: np.ndarray, y: np.ndarray):
+        self.y = y
+        self.candidates = candidates
+        norm = np.linalg.norm(intercept)
+        self.q = (intercept / norm)[:, None]
+        self.r = np.array([[norm]])
+        self.resid = y - self.q[:, 0] * (self.q[:, 0] @ y)
+        self.ortho = candidates - np.outer(self.q[:, 0], self.q[:, 0] @ candidates)
+        self.norm2 = (candidates * candidates).sum(axis=0)
+        self.selected: List[int] = []
+
+    @property
+    def ss_error(self) -> float:
+        return float(self.resid @ self.resid)
+
+    def gains(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        decrease of the residual sum of squares by each candidate, and which can enter
+        """
+        ortho2 = (self.ortho * self.ortho).sum(axis=0)
+        valid = ortho2 > _TOL * np.maximum(self.norm2, _TOL)
+        valid[self.selected] = False
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gain = np.where(valid, (self.resid @ self.ortho) ** 2 / ortho2, 0.)
+        return gain, valid
+
+    def losses(self) -> np.ndarray:
+        """
+        increase of the residual sum of squares by removing each selected term
+        """
+        r_inv = _back_substitution(self.r, np.eye(len(self.r)))
+        coef = r_inv @ (self.q.T @ self.y)
+        loss: np.ndarray = coef * coef / (r_inv * r_inv).sum(axis=1)
+        return loss[1:]
+
+    def add(self, j: int) -> None:
+        self.q, self.r = _qr_add_column(self.q, self.r, self.candidates[:, j])
+        u = self.q[:, -1]
+        self.resid = self.resid - u * (u @ self.resid)
+        self.ortho = self.ortho - np.outer(u, u @ self.ortho)
+        self.selected.append(j)
+
+    def remove(self, i: int) -> None:
+        self.q, self.r, u = _qr_delete_column(self.q, self.r, i + 1)
+        self.resid = self.resid + u * (u @ self.y)
+        self.ortho = self.ortho + np.outer(u, u @ self.candidates)
+        del self.selected[i]
+
+    def coef(self) -> np.ndarray:
+        return _back_substitution(self.r, self.q.T @ self.y)
+
+
+def _do(
+    path: _Path,
+    step: Tuple[str, int, float],
+    terms: List[Tuple[int, ...]],
+    history: List[Tuple[str, str, float]],
+) -> None:
+    action, index, value = step
+    if action == "add":
+        path.add(index)
+        term = terms[index]
+    else:
+        term = terms[path.selected[index]]
+        path.remove(index)
+    history.append((action, _label(term), value))
@@ -0,0 +1,224 @@
+"""
+_Analyzer Class of Two-stage Definitive Screening Design Analysis Module
+"""
+from itertools import combinations
+from typing import List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from tagupy.design.analyzer._replicate import _collapse
+from tagupy.design.analyzer._stepwise import _Path
+from tagupy.design.generator import ReplicatedDesign
+from tagupy.type import _Analyzer as Analyzer
+from tagupy.utils._model_matrix import _label
+from tagupy.utils._special import _f_sf, _t_sf2
+
+
+class TwoStageDSDResult(NamedTuple):
+    """
+    Model of a definitive screening design selected by a TwoStageDSD analysis
+
+    Attributes
+    ----------
+    labels: List[str]
+        names of the selected terms
+    terms: List[Tuple[int, ...]]
+        selected terms as tuples of factor indices: the intercept, the active main effects
+        and the second-order terms, see also tagupy.utils.ModelMatrix
+    coef: numpy.ndarray
+        regression coefficients of the selected terms (n_term)
+    main_coef: numpy.ndarray
+        coefficients of every main effect fitted on the odd part (n_factor)
+    main_p_value: numpy.ndarray
+        two-sided p-values of the main effects (n_factor), nan without error degrees of freedom
+    active: numpy.ndarray
+        bool, whether each factor is active (n_factor)
+    sigma2: float
+        residual variance of the selected model over every run,
+        the main effects being tested with that of the odd part and the replicates
+    df_error: int
+        degrees of freedom of sigma2
+    """
+    labels: List[str]
+    terms: List[Tuple[int, ...]]
+    coef: np.ndarray
+    main_coef: np.ndarray
+    main_p_value: np.ndarray
+    active: np.ndarray
+    sigma2: float
+    df_error: int
+
+
+class TwoStageDSD(Analyzer):
+    """
+    _Analyzer Class of Two-stage Definitive Screening Design Analysis Module
+
+    Method
+    ------
+    analyze(exmatrix: numpy.ndarray, result: numpy.ndarray) -> TwoStageDSDResult
+
+    Notes
+    -----
+    A DSD is made of fold-over pairs x, -x and center runs, [C; -C; 0].
+    Main effects are odd functions of the factors and second-order terms are even ones,
+    so the responses of a pair split into
+    the odd part (y(x) - y(-x)) / 2, which depends on the main effects only,
+    and the even part (y(x) + y(-x)) / 2, which depends on the second-order terms only.
+
+    1. the main effects are fitted on the odd part, by C'y / (C'C)_jj when the columns
+       of C are orthogonal as in a conference matrix, and tested with the error variance
+       of the odd residuals (fake factors) and of the replicates
+    2. second-order terms of the active factors (quadratic terms and interactions)
+       are added by forward selection on the even part and the center runs,
+       as long as their partial F test is significant
+
+    The two parts are orthogonal, so the coefficients are those of the least-squares fit
+    of the selected model on every run.
+    Replicated runs (n_rep > 1 or a ReplicatedDesign) are collapsed first.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.analyzer import TwoStageDSD
+    >>> from tagupy.design.generator import DSD
+    >>> exmatrix = DSD(n_rep=1).get_exmatrix(n_factor=6, n_fake=2)
+    >>> noise = np.random.default_rng(0).normal(scale=0.5, size=len(exmatrix))
+    >>> result = 3 * exmatrix[:, 0] - 2 * exmatrix[:, 3] + 2 * exmatrix[:, 0] ** 2 + noise
+    >>> TwoStageDSD().analyze(exmatrix, result).labels
+    ['1', 'x0', 'x3', 'x0^2']
+    """
+
+    def __init__(self, alpha_main: float = 0.05, alpha: float = 0.05):
+        """
+        Parameters
+        ----------
+        alpha_main: float
+            p-value below which a main effect is active
+        alpha: float
+            p-value below which a second-order term enters the model
+        """
+        for name, value in [("alpha_main", alpha_main), ("alpha", alpha)]:
+            assert isinstance(value, float) and 0 < value < 1, \
+                f"Invalid input: {name} expected float in (0, 1), got {type(value)}::{value}"
+        self.alpha_main = alpha_main
+        self.alpha = alpha
+
+    def analyze(
+        self,
+        exmatrix: Union[np.ndarray, ReplicatedDesign],
+        result: np.ndarray,
+    ) -> TwoStageDSDResult:
+        """
+        Select the model of a definitive screening design
+
+        Parameters
+        ----------
+        exmatrix: Union[numpy.ndarray, ReplicatedDesign]
+            Target experiment Matrix (n_experiment x n_factor) made of fold-over pairs
+            and center runs, e.g. the output of DSD.get_exmatrix
+        result: numpy.ndarray
+            Target Result Matrix (n_experiment x 1)
+
+        Returns
+        -------
+        analysis_result: TwoStageDSDResult
+            selected model, main effects and error variance
+        """
+        summary = _collapse(exmatrix, result)
+        assert summary.means.shape[1] == 1, \
+            f"Invalid input: result expected (n_experiment x 1) array, " \
+            f"got {summary.means.shape[1]} responses"
+        runs, counts = summary.exmatrix.astype(float), summary.counts
+        means = summary.means[:, 0]
+        plus, minus, center = _fold_over(runs, counts)
+        n_factor = runs.shape[1]
+        # pair means of c replicates have the variance sigma^2 / (2c)
+        weight = 2 * counts[plus]
+        odd = (means[plus] - means[minus]) / 2
+        even = (means[plus] + means[minus]) / 2
+        c_mat = runs[plus]
+
+        # stage 1: main effects on the odd part
+        sw = np.sqrt(weight)
+        xw, yw = c_mat * sw[:, None], odd * sw
+        gram = xw.T @ xw
+        diag = np.diag(gram)
+        is_orthogonal = np.allclose(gram, np.diag(diag)) and (diag > 0).all()
+        if is_orthogonal:
+            main_coef = xw.T @ yw / diag
+            inv_diag = 1 / diag
+        else:
+            main_coef = np.linalg.lstsq(xw, yw, rcond=None)[0]
+            inv_diag = np.diag(np.linalg.pinv(gram))
+        resid = yw - xw @ main_coef
+        ss_error = float(resid @ resid + summary.ss_within.sum())
+        df_error = len(plus) - n_factor + int(counts.sum()) - len(counts)
+        sigma2 = ss_error / df_error if df_error > 0 else np.nan
+        if df_error > 0:
+            main_p_value = _t_sf2(main_coef / np.sqrt(inv_diag * sigma2), df_error)
+            active = main_p_value < self.alpha_main
+        else:
+            main_p_value = np.full(n_factor, np.nan)
+            active = np.ones(n_factor, dtype=bool)
+
+        # stage 2: second-order terms of the active factors on the even part
+        factors = np.flatnonzero(active).tolist()
+        candidates: List[Tuple[int, ...]] = [(i, i) for i in factors]
+        candidates += combinations(factors, 2)
+        rows = np.concatenate([c_mat, runs[center]])
+        sw = np.sqrt(np.concatenate([weight, counts[center]]))
+        columns = np.stack([np.prod(rows[:, list(term)], axis=1) for term in candidates], axis=1) \
+            if candidates else np.empty((len(rows), 0))
+        path = _Path(intercept=sw, candidates=columns * sw[:, None],
+                     y=np.concatenate([even, means[center]]) * sw)
+        df_even = len(rows) - 1
+        while df_even > 0 and df_error + df_even > 1:
+            gain, valid = path.gains()
+            if not valid.any():
+                break
+            j = int(np.argmax(np.where(valid, gain, -1.)))
+            df_new = df_error + df_even - 1
+            ss_new = ss_error + path.ss_error - gain[j]
+            with np.errstate(divide="ignore"):
+                if _f_sf(gain[j] / (ss_new / df_new), 1, df_new) >= self.alpha:
+                    break
+            path.add(j)
+            df_even -= 1
+        # refit the active main effects, and the residual variance of the selected model
+        active_coef = main_coef[factors] if len(factors) == n_factor or is_orthogonal \
+            else np.linalg.lstsq(xw[:, factors], yw, rcond=None)[0]
+        resid = yw - xw[:, factors] @ active_coef
+        ss_error = float(resid @ resid + summary.ss_within.sum()) + path.ss_error
+        df_error = df_error + n_factor - len(factors) + df_even
+        sigma2 = ss_error / df_error if df_error > 0 else np.nan
+
+        second = [candidates[j] for j in path.selected]
+        even_coef = path.coef()
+        terms: List[Tuple[int, ...]] = [()]
+        terms += [(i,) for i in factors] + second
+        coef = np.concatenate([even_coef[:1], active_coef, even_coef[1:]])
+        return TwoStageDSDResult(
+            labels=[_label(term) for term in terms],
+            terms=terms,
+            coef=coef,
+            main_coef=main_coef,
+            main_p_value=main_p_value,
+            active=active,
+            sigma2=float(sigma2),
+            df_error=int(df_error),
+        )
+
+
+def _fold_over(runs: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    indices of the fold-over pairs (x, -x) and of the center runs of the distinct runs
+    """
+    key = {(row + 0.).tobytes(): i for i, row in enumerate(runs)}
+    center = np.flatnonzero(~runs.any(axis=1))
+    mirror = np.array([key.get((0. - row).tobytes(), -1) for row in runs])
+    plus = np.flatnonzero((mirror > np.arange(len(runs))))
+    assert (mirror >= 0).all() and len(center) <= 1, \
+        "Invalid input: exmatrix expected fold-over pairs (x, -x) and center runs"
+    assert (counts[plus] == counts[mirror[plus]]).all(), \
+        "Invalid input: exmatrix expected the same number of replicates of x and -x"
+    return plus, mirror[plus], center
@@ -0,0 +1,161 @@
+"""
+_Analyzer Class of Walsh-Hadamard Effect Estimation Module
+"""
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from tagupy.design.analyzer._input import _check_input
+from tagupy.design.generator._packed import _popcount
+from tagupy.type import _Analyzer as Analyzer
+
+
+class EffectEstimate(NamedTuple):
+    """
+    Effect estimates of a two-level design
+
+    Attributes
+    ----------
+    coef: numpy.ndarray
+        regression coefficients (1 + n_factor x n_response), the intercept first
+    effects: numpy.ndarray
+        effects of the factors (n_factor x n_response), 2 * coef[1:],
+        i.e. the difference of the mean responses between the high and the low levels
+    contrasts: Optional[numpy.ndarray]
+        coefficients of every term of a full factorial design (2^n_factor x n_response)
+        in Yates order, i.e. the row s is the term of the factors j with s >> j & 1,
+        None for other designs
+    method: str
+        "fwht", "orthogonal" or "lstsq", the way the coefficients were computed
+    """
+    coef: np.ndarray
+    effects: np.ndarray
+    contrasts: Optional[np.ndarray]
+    method: str
+
+
+class WalshHadamard(Analyzer):
+    """
+    _Analyzer Class of Walsh-Hadamard Effect Estimation Module
+
+    Method
+    ------
+    analyze(exmatrix: numpy.ndarray, result: numpy.ndarray) -> EffectEstimate
+
+    Notes
+    -----
+    Two-level factors are coded as -1 (low) and +1 (high), so that the coefficients
+    of FullFact (0, 1) and PlackettBurman (-1, 1) designs share the same scale.
+    Effects are estimated without a general least-squares solve when possible:
+
+    1. full factorial 2^k designs (in any run order, equally replicated)
+       are summed up per run and transformed by the fast Walsh-Hadamard transform,
+       which gives every contrast in O(2^k k) operations
+    2. orthogonal two-level designs such as Plackett-Burman designs
+       (X'X = nI with the intercept) give coef = X'y / n in one pass over the columns
+    3. any other design falls back to numpy.linalg.lstsq,
+       on the coded factors for two-level designs and on the raw exmatrix otherwise
+
+    Every response (column of result) is analyzed at once.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.analyzer import WalshHadamard
+    >>> from tagupy.design.generator import FullFact
+    >>> exmatrix = FullFact(n_rep=1).get_exmatrix(levels=[2, 2])
+    >>> result = 10 + 3 * (2 * exmatrix[:, 0] - 1) - (2 * exmatrix[:, 1] - 1)
+    >>> estimate = WalshHadamard().analyze(exmatrix, result[:, None])
+    >>> estimate.method
+    'fwht'
+    >>> estimate.effects
+    array([[ 6.],
+           [-2.]])
+    """
+
+    def __init__(self) -> None:
+        pass
+
+    def analyze(self, exmatrix: np.ndarray, result: np.ndarray) -> EffectEstimate:
+        """
+        Estimate the effects of the factors
+
+        Parameters
+        ----------
+        exmatrix: numpy.ndarray
+            Target experiment Matrix (n_experiment x n_factor)
+        result: numpy.ndarray
+            Target Result Matrix (n_experiment x n_response)
+
+        Returns
+        -------
+        analysis_result: EffectEstimate
+            coefficients and effects of every response
+        """
+        exmatrix, result = _check_input(exmatrix, result)
+        n_run, n_factor = exmatrix.shape
+
+        coded = _two_level_coding(exmatrix)
+        if coded is None:
+            x = np.hstack([np.ones((n_run, 1)), exmatrix])
+            coef = np.linalg.lstsq(x, result, rcond=None)[0]
+            return EffectEstimate(coef, 2 * coef[1:], None, "lstsq")
+
+        run_index = _full_factorial_index(coded)
+        if run_index is not None:
+            total = np.zeros((2 ** n_factor, result.shape[1]))
+            np.add.at(total, run_index, result)
+            contrasts = _fwht(total) / n_run
+            # bit j = 1 is the high level (+1), while the transform counts it with a minus sign
+            signs = (-1.) ** _popcount(np.arange(2 ** n_factor, dtype=np.uint64))
+            contrasts *= signs[:, None]
+            coef = contrasts[np.concatenate([[0], 1 << np.arange(n_factor)])]
+            return EffectEstimate(coef, 2 * coef[1:], contrasts, "fwht")
+
+        x = np.hstack([np.ones((n_run, 1), dtype=coded.dtype), coded])
+        if (x.T @ x == n_run * np.eye(n_factor + 1)).all():
+            coef = x.T @ result / n_run
+            return EffectEstimate(coef, 2 * coef[1:], None, "orthogonal")
+
+        coef = np.linalg.lstsq(x, result, rcond=None)[0]
+        return EffectEstimate(coef, 2 * coef[1:], None, "lstsq")
+
+
+def _two_level_coding(exmatrix: np.ndarray) -> Optional[np.ndarray]:
+    """
+    code every factor into -1 (low) and +1 (high), None if a factor does not have two levels
+    """
+    low, high = exmatrix.min(axis=0), exmatrix.max(axis=0)
+    if not ((exmatrix == low) | (exmatrix == high)).all() or (low == high).any():
+        return None
+    return np.where(exmatrix == high, 1, -1).astype(np.int64)
+
+
+def _full_factorial_index(coded: np.ndarray) -> Optional[np.ndarray]:
+    """
+    run index (sum of 2^j over the factors j at the high level) of each run,
+    None if the runs are not equally replicated combinations of all the levels
+    """
+    n_run, n_factor = coded.shape
+    if n_factor >= 63 or n_run % (2 ** n_factor):
+        return None
+    index = (coded > 0).astype(np.int64) @ (1 << np.arange(n_factor, dtype=np.int64))
+    counts = np.bincount(index, minlength=2 ** n_factor)
+    return index if (counts == n_run // 2 ** n_factor).all() else None
+
+
+def _fwht(values: np.ndarray) -> np.ndarray:
+    """
+    fast Walsh-Hadamard transform along the first axis of length 2^k,
+    res[s] = sum_i values[i] * (-1)^popcount(i & s)
+    """
+    res: np.ndarray = values.copy()
+    n = len(res)
+    h = 1
+    while h < n:
+        view = res.reshape(n // (2 * h), 2, h, -1)
+        low, high = view[:, 0].copy(), view[:, 1]
+        view[:, 0] += high
+        view[:, 1] = low - high
+        h *= 2
+    return res
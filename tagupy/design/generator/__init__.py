@@ -1,11 +1,19 @@
+from ._base_cache import base_matrix_cache
 from ._dsd import DSD
 from ._fullfact import FullFact
 from ._onehot import OneHot
+from ._packed import PackedDesign
 from ._plackettburman import PlackettBurman
+from ._replicated import ReplicatedDesign
+from ._sparse import SparseDesign
 
 __all__ = [
     "FullFact",
     "OneHot",
     "PlackettBurman",
     "DSD",
+    "ReplicatedDesign",
+    "PackedDesign",
+    "SparseDesign",
+    "base_matrix_cache",
 ]
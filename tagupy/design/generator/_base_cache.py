@@ -0,0 +1,40 @@
+"""
+Cache of base matrices shared by the Generators
+
+- base matrices (e.g. PB reference tables and DSD fold-over matrices) depend only on their size,
+  so they are built once and shared as read-only arrays
+- base_matrix_cache exposes the statistics and the size of the cache,
+  see also tagupy.utils.LRUCache
+"""
+from typing import Callable, Hashable
+
+import numpy as np
+
+from tagupy.utils import LRUCache
+
+base_matrix_cache = LRUCache(maxsize=64)
+
+
+def _cached_matrix(key: Hashable, factory: Callable[[], np.ndarray]) -> np.ndarray:
+    '''
+    return the base matrix of key from base_matrix_cache
+
+    Parameters
+    ----------
+    key: Hashable
+        key of the base matrix, e.g. ("pb", n_run)
+    factory: Callable[[], np.ndarray]
+        function which builds the base matrix on a cache miss
+
+    Returns
+    -------
+    matrix: np.ndarray
+        read-only base matrix
+    '''
+    def _build() -> np.ndarray:
+        matrix = np.array(factory())
+        matrix.flags.writeable = False
+        return matrix
+
+    matrix: np.ndarray = base_matrix_cache.get(key, _build)
+    return matrix
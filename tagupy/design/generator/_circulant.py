@@ -0,0 +1,65 @@
+"""
+Circulant matrix builders shared by the reference and construction modules
+
+- the i-th row of the circulant matrix of vec is np.roll(vec, i)
+- the back-circulant matrix is the circulant matrix with its columns reversed,
+  i.e. the product with the reversal matrix R
+"""
+import numpy as np
+import numpy.typing as npt
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _circulant(vec: npt.ArrayLike) -> np.ndarray:
+    '''
+    circulant matrix of vec built by a single index gather
+
+    Parameters
+    ----------
+    vec: numpy.typing.ArrayLike
+        first row of the circulant matrix
+
+    Returns
+    -------
+    mat: np.ndarray(len(vec) * len(vec))
+        mat[i, j] = vec[(j - i) % len(vec)]
+    '''
+    vec = np.asarray(vec)
+    n = len(vec)
+    mat: np.ndarray = vec[(np.arange(n) - np.arange(n)[:, None]) % n]
+    return mat
+
+
+def _circulant_view(vec: npt.ArrayLike) -> np.ndarray:
+    '''
+    circulant matrix of vec as a read-only strided view of the doubled vector
+
+    Parameters
+    ----------
+    vec: numpy.typing.ArrayLike
+        first row of the circulant matrix
+
+    Returns
+    -------
+    mat: np.ndarray(len(vec) * len(vec))
+        view with mat[i, j] = vec[(j - i) % len(vec)], backed by 2 * len(vec) - 1 elements
+    '''
+    vec = np.asarray(vec)
+    return sliding_window_view(np.concatenate([vec[1:], vec]), len(vec))[::-1]
+
+
+def _back_circulant_view(vec: npt.ArrayLike) -> np.ndarray:
+    '''
+    back-circulant matrix of vec as a read-only strided view
+
+    Parameters
+    ----------
+    vec: numpy.typing.ArrayLike
+        first row of the circulant matrix
+
+    Returns
+    -------
+    mat: np.ndarray(len(vec) * len(vec))
+        view equal to _circulant(vec) @ R, R being the reversal matrix
+    '''
+    return _circulant_view(vec)[:, ::-1]
@@ -0,0 +1,112 @@
+"""
+Construction engine of conference matrices
+
+- Paley: order q + 1, q odd prime power,
+  symmetric if q = 1 mod 4 and antisymmetric if q = 3 mod 4
+- doubling: an antisymmetric conference matrix of order 2m from one of order m,
+  through the skew Hadamard matrix S = I + C and the Kronecker-like block
+  ([S, S],
+   [-S', S'])
+  starting from the antisymmetric matrix of order 2
+
+_conference_plan picks the construction of each order, and the matrices are memoized
+in base_matrix_cache.
+"""
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from tagupy.design.generator._base_cache import _cached_matrix
+from tagupy.design.generator._galois import _jacobsthal, _prime_power
+
+
+def _paley_conference(q: int) -> np.ndarray:
+    '''
+    conference matrix of order q + 1, q odd prime power
+
+    Note
+    ----
+    C = ([0, j'],
+         [+/-j, Q])
+    Q is the Jacobsthal matrix of GF(q), j the all-ones vector,
+    and the sign of the first column makes C symmetric (q = 1 mod 4) or antisymmetric (q = 3 mod 4)
+    '''
+    c = np.zeros((q + 1, q + 1), dtype=np.int8)
+    c[0, 1:] = 1
+    c[1:, 0] = 1 if q % 4 == 1 else -1
+    c[1:, 1:] = _jacobsthal(q)
+    return c
+
+
+def _doubled_conference(c_mat: np.ndarray) -> np.ndarray:
+    '''
+    antisymmetric conference matrix of order 2m from an antisymmetric one of order m
+    '''
+    eye = np.eye(len(c_mat), dtype=np.int8)
+    skew = c_mat + eye
+    return np.block([[skew, skew], [-skew.T, skew.T]]) - np.eye(2 * len(c_mat), dtype=np.int8)
+
+
+@lru_cache(maxsize=None)
+def _conference_plan(order: int) -> Optional[Tuple[str, int]]:
+    '''
+    choose the construction of the conference matrix of order
+
+    Returns
+    -------
+    plan: Optional[Tuple[str, int]]
+        ("skew2", 2), ("paley", q) or ("double", order // 2),
+        or None if no construction is known to this module
+    '''
+    if order == 2:
+        return ("skew2", 2)
+    if order < 2 or order % 2:
+        return None
+    if _prime_power(order - 1):
+        return ("paley", order - 1)
+    if order % 4 == 0 and _is_antisymmetric(order // 2):
+        return ("double", order // 2)
+    return None
+
+
+def _is_antisymmetric(order: int) -> bool:
+    '''
+    whether the conference matrix of order built by this module is antisymmetric
+    '''
+    plan = _conference_plan(order)
+    return plan is not None and (plan[0] != "paley" or plan[1] % 4 == 3)
+
+
+def _conference(order: int) -> np.ndarray:
+    '''
+    conference matrix of order
+
+    Parameters
+    ----------
+    order: int
+        even order of the conference matrix
+
+    Returns
+    -------
+    c_mat: np.ndarray(order * order)
+        read-only (0, +/-1) int8 matrix with zero diagonal and c_mat @ c_mat.T = (order - 1) * I
+
+    Raises
+    ------
+    ValueError
+        if no construction of order is known to this module
+    '''
+    plan = _conference_plan(order)
+    if plan is None:
+        raise ValueError(f"conference matrix of order {order} is not supported")
+
+    def _build() -> np.ndarray:
+        kind, arg = plan
+        if kind == "skew2":
+            return np.array([[0, 1], [-1, 0]], dtype=np.int8)
+        if kind == "paley":
+            return _paley_conference(arg)
+        return _doubled_conference(_conference(arg))
+
+    return _cached_matrix(("conference", order), _build)
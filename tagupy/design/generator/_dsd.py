@@ -1,11 +1,16 @@
 '''
 _Generator Class of Definitive Screening Design Generator Module
 '''
+from typing import Optional, Union
+
 import numpy as np
+import numpy.typing as npt
 
 from tagupy.design.generator import _dsd_ref as ref
+from tagupy.design.generator._base_cache import _cached_matrix
+from tagupy.design.generator._replicated import ReplicatedDesign, _replicate
 from tagupy.type import _Generator as Generator
-from tagupy.utils import is_positive_int
+from tagupy.utils import get_int_dtype, is_positive_int
 
 
 class DSD(Generator):
@@ -14,7 +19,8 @@ class DSD(Generator):
 
     Method
     ------
-    get_exmatrix(self, n_factor: int, n_fake: int) -> np.ndarray
+    get_exmatrix(self, n_factor: int, n_fake: int, lazy: bool, dtype: Optional[npt.DTypeLike])
+        -> Union[np.ndarray, ReplicatedDesign]
 
     Note
     ----
@@ -50,7 +56,13 @@ class DSD(Generator):
             f"Invalid input: n_rep expected positive (>0) integer, got {type(n_rep)}::{n_rep}"
         self.n_rep = n_rep
 
-    def get_exmatrix(self, n_factor: int, n_fake: int) -> np.ndarray:
+    def get_exmatrix(
+        self,
+        n_factor: int,
+        n_fake: int,
+        lazy: bool = False,
+        dtype: Optional[npt.DTypeLike] = None,
+    ) -> Union[np.ndarray, ReplicatedDesign]:
         '''
         create a definitive screening design
 
@@ -60,6 +72,13 @@ class DSD(Generator):
             number of factors used in the experiment
         n_fake: int
             number of fake factors which enable better estimation
+        lazy: bool
+            if True, return ReplicatedDesign which holds a single replication
+            instead of stacking n_rep copies
+        dtype: Optional[numpy.typing.DTypeLike]
+            dtype of the experiment matrix, int8 is used by default.
+            Products and sums of int8 overflow without warning once they exceed 127,
+            e.g. X.T @ X of more than 127 runs, use X.astype(float) or pass dtype=int
 
         Returns
         -------
@@ -67,11 +86,16 @@ class DSD(Generator):
             experiment matrix
             if n_factor+n_fake is even, shape of ex_mat would be (2*(n_factor+n_fake)+1, n_factor)
             if n_factor+n_fake is odd, shape of ex_mat would be (2*(n_factor+n_fake)+3, n_factor)
+            if n_factor+n_fake > 50, shape of ex_mat would be (2*order+1, n_factor),
+            order being the smallest even number >= n_factor+n_fake
+            for which a conference matrix can be constructed
 
         Note
         ----
-        3 <= n_factor + n_fake <= 50 is expected
+        3 <= n_factor + n_fake is expected
         as for the number of fake factor, n_fake = 2 is used as standard
+        for n_factor + n_fake > 50, conference matrices are built by Paley constructions
+        and doubling, see also tagupy.design.generator._conference
 
         Example
         -------
@@ -111,7 +135,7 @@ class DSD(Generator):
                [-1,  1, -1,  1,  1,  0],
                [-1, -1,  1, -1,  1,  1],
                [-1, -1, -1,  1, -1,  1],
-               [ 0,  0,  0,  0,  0,  0]])
+               [ 0,  0,  0,  0,  0,  0]], dtype=int8)
         '''
         assert is_positive_int(n_factor),\
             f"Invalid input: n_factor expected positive (>0) integer,\
@@ -121,24 +145,14 @@ class DSD(Generator):
                  got {type(n_fake)}::{n_fake}"
 
         sum_fac = n_factor + n_fake
-        assert 3 <= sum_fac <= 50,\
-            f"Invalid input: sum of n_factor and n_fake expected 3 <= & <= 50, got {sum_fac}"
-        if sum_fac % 2:
-            sum_fac += 1
-        l_func = [
-            ((4, 6, 8, 12, 14, 18, 20, 24, 30, 32, 38, 42, 44, 48), ref._cmateq5),
-            ((10, 22, 26, 34, 50), ref._cmateq2),
-            ((16, 40), ref._dsddb),
-            ((28, 36), ref._dsdeq3),
-            ((46, 46), ref._dsd46),
-            ]
-
-        for num, func in l_func:
-            if sum_fac in num:
-                if sum_fac != 46:
-                    c_mat = func(sum_fac, ref._gen_vec)
-                else:
-                    c_mat = func()
-        ex_mat = ref._get_dsd(n_factor=n_factor, c_mat=c_mat)
+        assert 3 <= sum_fac,\
+            f"Invalid input: sum of n_factor and n_fake expected 3 <=, got {sum_fac}"
+        order = ref._dsd_order(sum_fac)
+        d_mat = _cached_matrix(
+            ("dsd", order),
+            lambda: ref._get_dsd(n_factor=order, c_mat=ref._cmat(order)),
+        )
+        dtype = get_int_dtype(-1, 1) if dtype is None else np.dtype(dtype)
+        ex_mat = d_mat[:, :n_factor].astype(dtype, copy=False)
 
-        return np.vstack([ex_mat] * self.n_rep)
+        return _replicate(ex_mat, self.n_rep, lazy)
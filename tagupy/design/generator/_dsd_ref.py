@@ -1,5 +1,10 @@
 import numpy as np
-from typing import Dict, List
+from itertools import count
+from typing import Any, Callable, Dict, List, Tuple
+
+from tagupy.design.generator._circulant import _back_circulant_view, _circulant_view
+from tagupy.design.generator._conference import _conference, _conference_plan
+from tagupy.design.generator._ref_store import _load_table
 
 _gen_vec = {
     4: [0, -1, 1],
@@ -52,12 +57,10 @@ def _cmateq5(sum_fac: int, gen_vec: Dict[int, List[int]]) -> np.ndarray:
      [ones(sum_fac - 1, 0), S])
     S is a circulant (0, ±1)-matrix of order(sum_fac - 1), which is generated by gen_vec
     '''
-    v = gen_vec[sum_fac]
-    s = np.concatenate([np.roll(v, i).reshape(1, -1) for i in range(len(v))], axis=0)
-    one_vec = np.array([1 for i in range(sum_fac-1)]).reshape(-1, 1)
-    temp0 = np.concatenate([np.array([0]), -one_vec.reshape(-1)]).reshape(1, -1)
-    temp1 = np.concatenate([one_vec, s], axis=1)
-    c_mat = np.concatenate([temp0, temp1], axis=0)
+    c_mat = np.zeros((sum_fac, sum_fac), dtype=int)
+    c_mat[0, 1:] = -1
+    c_mat[1:, 0] = 1
+    c_mat[1:, 1:] = _circulant_view(gen_vec[sum_fac])
 
     return c_mat
 
@@ -93,10 +96,7 @@ def _cmateq2(sum_fac: int, gen_vec: Dict[int, List[List[int]]]) -> np.ndarray:
     Journal of Statistical Theory and Practice.
     DOI: 10.1080/15598608.2013.781891
     '''
-    v0 = gen_vec[sum_fac][0]
-    v1 = gen_vec[sum_fac][1]
-    a = np.concatenate([np.roll(v0, i).reshape(1, -1) for i in range(len(v0))], axis=0)
-    b = np.concatenate([np.roll(v1, i).reshape(1, -1) for i in range(len(v1))], axis=0)
+    a, b = (_circulant_view(v) for v in gen_vec[sum_fac])
     c_mat = np.block([
         [a, b],
         [b.T, -a.T]
@@ -168,72 +168,81 @@ def _dsdeq3(sum_fac: int, gen_vec: Dict[int, List[int]]) -> np.ndarray:
      [-CR, -(D.T)R, A, (B.T)R],
      [-DR, (C.T)R, -(B.T)R, A])
     A, B, C, and D are four circulant matrices generated by gen_vec
+    and R is the reversal matrix, so that XR is the back-circulant matrix of X
+    and (X.T)R = RX is X with its rows reversed
     '''
-    a = np.concatenate([np.roll(gen_vec[sum_fac][0], i).reshape(1, -1) for i in range(len(gen_vec[sum_fac][0]))], axis=0)
-    b = np.concatenate([np.roll(gen_vec[sum_fac][1], i).reshape(1, -1) for i in range(len(gen_vec[sum_fac][1]))], axis=0)
-    c = np.concatenate([np.roll(gen_vec[sum_fac][2], i).reshape(1, -1) for i in range(len(gen_vec[sum_fac][2]))], axis=0)
-    d = np.concatenate([np.roll(gen_vec[sum_fac][3], i).reshape(1, -1) for i in range(len(gen_vec[sum_fac][3]))], axis=0)
-    r = np.eye(len(gen_vec[sum_fac][0]), dtype=int)[::-1]
+    v_a, v_b, v_c, v_d = (np.asarray(v) for v in gen_vec[sum_fac])
+    a = _circulant_view(v_a)
+    br, cr, dr = (_back_circulant_view(v) for v in (v_b, v_c, v_d))
+    btr, ctr, dtr = (_circulant_view(v)[::-1] for v in (v_b, v_c, v_d))
     c_mat = np.block([
-        [a, b @ r, c @ r, d @ r],
-        [-b @ r, a, d.T @ r, -c.T @ r],
-        [-c @ r, -d.T @ r, a, b.T @ r],
-        [-d @ r, c.T @ r, -b.T @ r, a]
+        [a, br, cr, dr],
+        [-br, a, dtr, -ctr],
+        [-cr, -dtr, a, btr],
+        [-dr, ctr, -btr, a]
     ])
 
     return c_mat
 
 
-def _dsd46():
-    cmat = np.array([
-        [ 0,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1,  1],
-        [ 1,  0,  1,  1, -1,  1, -1, -1, -1,  1,  1,  1, -1, -1,  1,  1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1,  1,  1,  1, -1, -1, -1,  1, -1,  1, -1,  1,  1,  1,  1, -1],
-        [ 1,  1,  0,  1, -1, -1,  1,  1, -1, -1, -1,  1,  1,  1, -1,  1,  1,  1, -1, -1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1,  -1, -1,  1,  1,  1,  1,  1, -1,  1, -1,  1, -1,  1,  1],
-        [ 1,  1,  1,  0,  1, -1, -1, -1,  1, -1,  1, -1,  1,  1,  1, -1,  -1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1,  1,  1,  1, -1,  -1, -1, -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1],
-        [ 1, -1, -1,  1,  0,  1,  1, -1,  1, -1, -1,  1,  1,  1, -1,  1,  1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1,  1,  1,  1, -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1],
-        [ 1,  1, -1, -1,  1,  0,  1, -1, -1,  1,  1, -1,  1,  1,  1, -1,  -1,  1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1, -1,  -1, -1,  1,  1,  1,  1, -1,  1, -1,  1,  1,  1,  1, -1],
-        [ 1, -1,  1, -1,  1,  1,  0,  1, -1, -1,  1,  1, -1, -1,  1,  1,  1, -1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1,  1,  1, -1,  -1, -1, -1, -1, -1,  1,  1, -1,  1, -1,  1, -1,  1,  1],
-        [ 1, -1,  1, -1, -1, -1,  1,  0,  1,  1,  1, -1,  1,  1,  1, -1,  -1,  1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1,  1,  1,  1, -1, -1, -1,  1,  1, -1,  1, -1,  1, -1,  1,  1],
-        [ 1, -1, -1,  1,  1, -1, -1,  1,  0,  1,  1,  1, -1, -1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1,  -1, -1,  1,  1,  1, -1,  1,  1,  1,  1, -1,  1, -1,  1],
-        [ 1,  1, -1, -1, -1,  1, -1,  1,  1,  0, -1,  1,  1,  1, -1,  1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1, -1,  1,  1,  1, -1,  -1, -1, -1, -1, -1,  1, -1,  1, -1,  1,  1,  1,  1, -1],
-        [ 1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  0,  1,  1, -1,  1, -1,  -1, -1,  1,  1,  1, -1, -1,  1,  1,  1, -1,  1, -1, -1,  1, -1,  -1,  1, -1, -1,  1, -1, -1, -1,  1,  1,  1, -1, -1, -1],
-        [ 1,  1,  1, -1,  1, -1,  1, -1,  1,  1,  1,  0,  1, -1, -1,  1,  1, -1, -1, -1,  1,  1,  1, -1,  1,  1,  1, -1, -1, -1,  1, -1,  -1,  1, -1, -1,  1, -1, -1, -1, -1, -1, -1,  1,  1,  1],
-        [ 1, -1,  1,  1,  1,  1, -1,  1, -1,  1,  1,  1,  0,  1, -1, -1,  -1,  1, -1,  1, -1,  1,  1,  1, -1, -1,  1,  1, -1, -1,  1, -1,  -1,  1, -1, -1,  1,  1,  1,  1, -1, -1, -1, -1, -1, -1],
-        [ 1, -1,  1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1,  0,  1,  1,  -1,  1, -1, -1,  1,  1,  1, -1,  1,  1,  1, -1,  1, -1, -1,  1,  -1, -1,  1, -1, -1, -1, -1, -1,  1,  1,  1, -1, -1, -1],
-        [ 1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  1, -1, -1,  1,  0,  1,  -1, -1,  1,  1, -1,  1,  1,  1, -1, -1,  1,  1,  1, -1, -1,  1,  -1, -1,  1, -1, -1, -1, -1, -1, -1, -1, -1,  1,  1,  1],
-        [ 1,  1,  1, -1,  1, -1,  1, -1,  1,  1, -1,  1, -1,  1,  1,  0,  1, -1, -1,  1,  1, -1, -1,  1,  1,  1, -1,  1,  1, -1, -1,  1,  -1, -1,  1, -1, -1,  1,  1,  1, -1, -1, -1, -1, -1, -1],
-        [ 1,  1,  1, -1,  1, -1,  1, -1,  1,  1, -1,  1, -1, -1, -1,  1,  0,  1,  1,  1, -1,  1,  1,  1, -1, -1,  1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1,  1,  1,  1, -1, -1, -1],
-        [ 1, -1,  1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1,  1, -1, -1,  1,  0,  1,  1,  1, -1, -1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1, -1, -1,  1,  1,  1],
-        [ 1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  1, -1, -1, -1,  1, -1,  1,  1,  0, -1,  1,  1,  1, -1,  1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1, -1,  1,  1,  1, -1, -1, -1, -1, -1, -1],
-        [ 1, -1, -1, -1,  1,  1,  1, -1, -1, -1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  0,  1,  1, -1,  1, -1, -1, -1,  1,  1,  1, -1, -1,  1,  1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1],
-        [ 1, -1, -1, -1, -1, -1, -1,  1,  1,  1,  1,  1, -1,  1, -1,  1,  -1,  1,  1,  1,  0,  1, -1, -1,  1,  1, -1, -1, -1,  1,  1,  1,  -1,  1,  1,  1, -1, -1, -1,  1, -1, -1,  1, -1, -1,  1],
-        [ 1,  1,  1,  1, -1, -1, -1, -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1,  1,  1,  0,  1, -1, -1, -1,  1, -1,  1, -1,  1,  1,  1, -1, -1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1],
-        [ 1, -1, -1, -1,  1,  1,  1, -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1,  0,  1,  1, -1,  1, -1, -1,  1,  1,  1,  -1,  1,  1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1],
-        [ 1, -1, -1, -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  1, -1, -1,  1,  0,  1, -1, -1,  1,  1, -1,  1,  1,  1, -1, -1,  1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1],
-        [ 1,  1,  1,  1, -1, -1, -1, -1, -1, -1,  1,  1, -1,  1, -1,  1,  -1,  1,  1, -1,  1, -1,  1,  1,  0,  1, -1, -1,  1,  1, -1, -1,  1,  1,  1, -1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1],
-        [ 1, -1, -1, -1,  1,  1,  1, -1, -1, -1,  1,  1, -1,  1, -1,  1,  -1,  1,  1, -1,  1, -1, -1, -1,  1,  0,  1,  1,  1, -1,  1,  1,  1, -1, -1,  1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1],
-        [ 1, -1, -1, -1, -1, -1, -1,  1,  1,  1, -1,  1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1,  1, -1, -1,  1,  0,  1,  1,  1, -1, -1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1],
-        [ 1,  1,  1,  1, -1, -1, -1, -1, -1, -1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  1, -1, -1, -1,  1, -1,  1,  1,  0, -1,  1,  1,  1,  -1,  1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1, -1],
-        [ 1, -1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1,  1,  1,  1,  -1, -1, -1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  0,  1,  1, -1,  1, -1, -1, -1,  1,  1,  1, -1, -1,  1,  1,  1, -1,  1],
-        [ 1, -1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1, -1,  1,  1,  1,  1,  1, -1,  1, -1,  1, -1,  1,  1,  1,  0,  1, -1,  -1,  1,  1, -1, -1, -1,  1,  1,  1, -1,  1,  1,  1, -1],
-        [ 1, -1, -1,  1, -1, -1,  1, -1, -1,  1,  1,  1,  1, -1, -1, -1,  -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1,  1,  1,  0,  1,  -1, -1, -1,  1, -1,  1, -1,  1,  1,  1, -1, -1,  1,  1],
-        [ 1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1,  1,  1,  1,  -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1,  0,  1,  1, -1,  1, -1, -1,  1,  1,  1, -1,  1,  1,  1, -1],
-        [ 1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  1, -1, -1,  1,  0,  1, -1, -1,  1,  1, -1,  1,  1,  1, -1, -1,  1,  1],
-        [ 1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1,  1,  1, -1, -1, -1,  -1, -1, -1,  1,  1, -1,  1, -1,  1, -1,  1,  1, -1,  1, -1,  1,  1,  0,  1, -1, -1,  1,  1, -1, -1,  1,  1,  1, -1,  1],
-        [ 1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1,  1,  1,  1,  -1, -1, -1,  1,  1, -1,  1, -1,  1, -1,  1,  1, -1,  1, -1, -1,  -1,  1,  0,  1,  1,  1, -1,  1,  1,  1, -1, -1,  1,  1],
-        [ 1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1, -1, -1,  1,  1,  1, -1,  1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1,  1,  -1, -1,  1,  0,  1,  1,  1, -1, -1,  1,  1,  1, -1,  1],
-        [ 1, -1,  1, -1, -1,  1, -1, -1,  1, -1,  1,  1,  1, -1, -1, -1,  -1, -1, -1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  1, -1, -1, -1,  1, -1,  1,  1,  0, -1,  1,  1,  1, -1,  1,  1,  1, -1],
-        [ 1,  1,  1, -1, -1,  1,  1,  1, -1,  1, -1, -1,  1, -1, -1,  1,  -1, -1,  1, -1, -1, -1,  1,  1,  1, -1, -1, -1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  0,  1,  1, -1,  1, -1, -1, -1,  1],
-        [ 1, -1,  1,  1,  1, -1,  1,  1,  1, -1, -1, -1,  1, -1, -1,  1,  -1, -1,  1, -1, -1, -1, -1, -1, -1,  1,  1,  1,  1,  1, -1,  1,  -1,  1, -1,  1,  1,  1,  0,  1, -1, -1,  1,  1, -1, -1],
-        [ 1,  1, -1,  1,  1,  1, -1, -1,  1,  1, -1, -1,  1, -1, -1,  1,  -1, -1,  1,  1,  1,  1, -1, -1, -1, -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1,  1,  1,  0,  1, -1, -1, -1,  1, -1],
-        [ 1, -1,  1,  1,  1, -1,  1,  1,  1, -1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1,  1,  1,  1, -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1,  0,  1,  1, -1,  1, -1],
-        [ 1,  1, -1,  1,  1,  1, -1, -1,  1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1, -1, -1, -1, -1, -1, -1,  1,  1,  1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  1, -1, -1,  1,  0,  1, -1, -1,  1],
-        [ 1,  1,  1, -1, -1,  1,  1,  1, -1,  1,  1, -1, -1,  1, -1, -1,  1, -1, -1,  1,  1,  1, -1, -1, -1, -1, -1, -1,  1,  1, -1,  1,  -1,  1, -1,  1,  1, -1,  1, -1,  1,  1,  0,  1, -1, -1],
-        [ 1,  1, -1,  1,  1,  1, -1, -1,  1,  1, -1,  1, -1, -1,  1, -1,  -1,  1, -1, -1, -1, -1,  1,  1,  1, -1, -1, -1,  1,  1, -1,  1,  -1,  1, -1,  1,  1, -1,  1, -1, -1, -1,  1,  0,  1,  1],
-        [ 1,  1,  1, -1, -1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1, -1,  -1,  1, -1, -1, -1, -1, -1, -1, -1,  1,  1,  1, -1,  1,  1,  1,  1, -1,  1, -1,  1, -1, -1,  1,  1, -1, -1,  1,  0,  1],
-        [ 1, -1,  1,  1,  1, -1,  1,  1,  1, -1, -1,  1, -1, -1,  1, -1,  -1,  1, -1,  1,  1,  1, -1, -1, -1, -1, -1, -1,  1, -1,  1, -1,  1,  1,  1,  1, -1,  1, -1, -1, -1,  1, -1,  1,  1,  0]
-        ])
-    return cmat
+def _dsd46() -> np.ndarray:
+    '''
+    load the conference matrix of sum_fac: 46 from the bit-packed store (see _ref_store)
+    '''
+    return _load_table("dsd46", (46, 46))
+
+
+def _dsd_order(sum_fac: int) -> int:
+    '''
+    choose the order of the conference matrix for sum_fac factors
+
+    Parameters
+    ----------
+    sum_fac: int
+        sum of the number of factors(n_factor) and the number of fake factor
+
+    returns
+    -------
+    order: int
+        sum_fac rounded up to even if it is <= 50, otherwise the smallest even order >= sum_fac
+        supported by the conference matrix engine (see _conference)
+    '''
+    sum_fac += sum_fac % 2
+    if sum_fac <= 50:
+        return sum_fac
+    return next(order for order in count(sum_fac, 2) if _conference_plan(order))
+
+
+def _cmat(sum_fac: int) -> np.ndarray:
+    '''
+    create a conference matrix of even sum_fac >= 4
+
+    Parameters
+    ----------
+    sum_fac: int
+        sum of the number of factors(n_factor) and the number of fake factor
+
+    returns
+    -------
+    cmat: np.ndarray(sum_fac * sum_fac)
+        conference matrix built by the construction suited for sum_fac,
+        the conference matrix engine (see _conference) is used for sum_fac > 50
+    '''
+    l_func: List[Tuple[Tuple[int, ...], Callable[[int, Dict[int, Any]], np.ndarray]]] = [
+        ((4, 6, 8, 12, 14, 18, 20, 24, 30, 32, 38, 42, 44, 48), _cmateq5),
+        ((10, 22, 26, 34, 50), _cmateq2),
+        ((16, 40), _dsddb),
+        ((28, 36), _dsdeq3),
+        ]
+
+    if sum_fac > 50:
+        return _conference(sum_fac)
+    if sum_fac == 46:
+        return _dsd46()
+    for num, func in l_func:
+        if sum_fac in num:
+            return func(sum_fac, _gen_vec)
+    raise ValueError(f"conference matrix of order {sum_fac} is not supported")
 
 
 def _get_dsd(n_factor: int, c_mat: np.ndarray) -> np.ndarray:
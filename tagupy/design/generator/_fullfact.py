@@ -2,11 +2,13 @@
 _Generator Class of FullFactorial Design Generator Module
 """
 import numpy as np
+import numpy.typing as npt
 
-from typing import Iterable
+from typing import Iterable, Iterator, Optional, Union
 
+from tagupy.design.generator._replicated import ReplicatedDesign, _replicate
 from tagupy.type import _Generator as Generator
-from tagupy.utils import is_positive_int, is_positive_int_list
+from tagupy.utils import get_int_dtype, is_positive_int, is_positive_int_list
 
 
 class FullFact(Generator):
@@ -15,7 +17,14 @@ class FullFact(Generator):
 
     Method
     ------
-    get_exmatrix(self, levels: Iterable[int]) -> np.ndarray
+    get_exmatrix(self, levels: Iterable[int], lazy: bool, dtype: Optional[npt.DTypeLike])
+        -> Union[np.ndarray, ReplicatedDesign]
+    iter_exmatrix(self, levels: Iterable[int], chunk_size: int, dtype: Optional[npt.DTypeLike])
+        -> Iterator[np.ndarray]
+    get_runs(self, levels: Iterable[int], index: Union[int, slice, Iterable[int]],
+             dtype: Optional[npt.DTypeLike]) -> np.ndarray
+    shard(self, levels: Iterable[int], rank: int, world_size: int,
+          dtype: Optional[npt.DTypeLike]) -> np.ndarray
 
     Notes
     -----
@@ -45,7 +54,12 @@ class FullFact(Generator):
             f"Invalid input: n_rep expected positive (>0) integer, got {type(n_rep)}::{n_rep}"
         self.n_rep = n_rep
 
-    def get_exmatrix(self, levels: Iterable[int]) -> np.ndarray:
+    def get_exmatrix(
+        self,
+        levels: Iterable[int],
+        lazy: bool = False,
+        dtype: Optional[npt.DTypeLike] = None,
+    ) -> Union[np.ndarray, ReplicatedDesign]:
         '''
         create a full-factorial design
 
@@ -53,6 +67,14 @@ class FullFact(Generator):
         ----------
         levels : Iterable[int]
             a list of integers which shows the number of level of each input factor
+        lazy: bool
+            if True, return ReplicatedDesign which holds a single replication
+            instead of stacking n_rep copies
+        dtype: Optional[numpy.typing.DTypeLike]
+            dtype of the experiment matrix,
+            the narrowest integer dtype holding every level code is used by default.
+            It holds the codes but not their products or sums, which wrap around silently,
+            e.g. X.T @ X of int8 codes overflows past 127, use X.astype(float) or pass dtype=int
 
         Returns
         -------
@@ -67,7 +89,7 @@ class FullFact(Generator):
         -------
         >>> from tagupy.design.generator import FullFact
         >>> _model = FullFact(n_rep=2)
-        >>> _model.get_exmatrix([2,3,2])
+        >>> _model.get_exmatrix([2,3,2], dtype=int)
         array([[0, 0, 0],
                [0, 0, 1],
                [0, 1, 0],
@@ -92,11 +114,205 @@ class FullFact(Generator):
                [1, 1, 1],
                [1, 2, 0],
                [1, 2, 1]])
+        >>> _model.get_exmatrix([2,3,2]).dtype
+        dtype('int8')
         '''
         assert is_positive_int_list(levels), \
             f'Invalid input: levels is List of positive (>0) integer, got {type(levels)}::{levels}'
 
-        ary = [np.arange(i, dtype=np.int8) for i in levels]
-        exmatrix = np.indices(list(levels)).reshape(len(ary), -1).T
+        levels = list(levels)
+        exmatrix = np.indices(levels, dtype=_get_dtype(levels, dtype)).reshape(len(levels), -1).T
 
-        return np.vstack([exmatrix] * self.n_rep)
+        return _replicate(exmatrix, self.n_rep, lazy)
+
+    def iter_exmatrix(
+        self,
+        levels: Iterable[int],
+        chunk_size: int = 65536,
+        dtype: Optional[npt.DTypeLike] = None,
+    ) -> Iterator[np.ndarray]:
+        '''
+        iterate over a full-factorial design in chunks of rows
+
+        Parameters
+        ----------
+        levels : Iterable[int]
+            a list of integers which shows the number of level of each input factor
+        chunk_size : int
+            maximum number of rows (experiments) in each yielded block
+        dtype: Optional[numpy.typing.DTypeLike]
+            dtype of the blocks, see also get_exmatrix
+
+        Yields
+        ------
+        chunk : np.ndarray(min(chunk_size, n_rest) * n_factor)
+            consecutive rows of the experiment matrix returned by get_exmatrix(levels)
+
+        Note
+        ----
+        Rows are decoded straight from their run index read as a mixed-radix number,
+        so peak memory is bounded by chunk_size, not by the size of the design.
+
+        Example
+        -------
+        >>> from tagupy.design.generator import FullFact
+        >>> _model = FullFact(n_rep=2)
+        >>> for chunk in _model.iter_exmatrix([2, 2], chunk_size=3):
+        ...     print(chunk.tolist())
+        [[0, 0], [0, 1], [1, 0]]
+        [[1, 1], [0, 0], [0, 1]]
+        [[1, 0], [1, 1]]
+        '''
+        assert is_positive_int_list(levels), \
+            f'Invalid input: levels is List of positive (>0) integer, got {type(levels)}::{levels}'
+        assert is_positive_int(chunk_size), \
+            f"Invalid input: chunk_size expected positive (>0) integer, \
+                got {type(chunk_size)}::{chunk_size}"
+
+        levels = list(levels)
+        n_run = int(np.prod(levels, dtype=object))
+        n_total = n_run * self.n_rep
+        for start in range(0, n_total, chunk_size):
+            stop = min(start + chunk_size, n_total)
+            yield _decode_runs(np.arange(start, stop) % n_run, levels, _get_dtype(levels, dtype))
+
+    def get_runs(
+        self,
+        levels: Iterable[int],
+        index: Union[int, slice, Iterable[int]],
+        dtype: Optional[npt.DTypeLike] = None,
+    ) -> np.ndarray:
+        '''
+        pick runs of a full-factorial design without creating the whole design
+
+        Parameters
+        ----------
+        levels : Iterable[int]
+            a list of integers which shows the number of level of each input factor
+        index : Union[int, slice, Iterable[int]]
+            run index, slice (contiguous or strided) or list of run indices
+            of the experiment matrix returned by get_exmatrix(levels).
+            negative indices count from the end, as for np.ndarray.
+        dtype: Optional[numpy.typing.DTypeLike]
+            dtype of the runs, see also get_exmatrix
+
+        Returns
+        -------
+        runs : np.ndarray
+            get_exmatrix(levels)[index]
+
+        Example
+        -------
+        >>> from tagupy.design.generator import FullFact
+        >>> _model = FullFact(n_rep=2)
+        >>> _model.get_runs([2, 3, 2], 13)
+        array([0, 0, 1], dtype=int8)
+        >>> _model.get_runs([2, 3, 2], slice(0, 24, 5), dtype=int)
+        array([[0, 0, 0],
+               [0, 2, 1],
+               [1, 2, 0],
+               [0, 1, 1],
+               [1, 1, 0]])
+        '''
+        assert is_positive_int_list(levels), \
+            f'Invalid input: levels is List of positive (>0) integer, got {type(levels)}::{levels}'
+
+        levels = list(levels)
+        n_run = int(np.prod(levels, dtype=object))
+        n_total = n_run * self.n_rep
+        if isinstance(index, slice):
+            ary = np.arange(*index.indices(n_total), dtype=np.int64)
+        else:
+            ary = np.asarray(index)
+            assert ary.dtype.kind in 'iu' and ary.ndim <= 1, \
+                f"Invalid input: index expected int, slice or list of int, \
+                    got {type(index)}::{index}"
+            assert ((-n_total <= ary) & (ary < n_total)).all(), \
+                f"Invalid input: index out of range for {n_total} runs, got {index}"
+            ary = ary.astype(np.int64) % n_total
+
+        runs = _decode_runs(np.atleast_1d(ary) % n_run, levels, _get_dtype(levels, dtype))
+        return runs.reshape(ary.shape + (len(levels),))
+
+    def shard(
+        self,
+        levels: Iterable[int],
+        rank: int,
+        world_size: int,
+        dtype: Optional[npt.DTypeLike] = None,
+    ) -> np.ndarray:
+        '''
+        return the share of a full-factorial design assigned to one worker
+
+        Parameters
+        ----------
+        levels : Iterable[int]
+            a list of integers which shows the number of level of each input factor
+        rank : int
+            index of the worker, 0 <= rank < world_size
+        world_size : int
+            number of workers sharing the design
+        dtype: Optional[numpy.typing.DTypeLike]
+            dtype of the runs, see also get_exmatrix
+
+        Returns
+        -------
+        runs : np.ndarray
+            contiguous block of rows of get_exmatrix(levels);
+            blocks of rank 0, 1, ..., world_size - 1 are disjoint, cover the whole design
+            in order and differ in length by at most one row.
+
+        Example
+        -------
+        >>> from tagupy.design.generator import FullFact
+        >>> _model = FullFact(n_rep=1)
+        >>> _model.shard([2, 3], rank=1, world_size=4)
+        array([[0, 1],
+               [0, 2]], dtype=int8)
+        '''
+        assert is_positive_int(world_size), \
+            f"Invalid input: world_size expected positive (>0) integer, \
+                got {type(world_size)}::{world_size}"
+        assert isinstance(rank, int) and 0 <= rank < world_size, \
+            f"Invalid input: rank expected integer in [0, {world_size}), got {type(rank)}::{rank}"
+        assert is_positive_int_list(levels), \
+            f'Invalid input: levels is List of positive (>0) integer, got {type(levels)}::{levels}'
+
+        n_total = int(np.prod(list(levels), dtype=object)) * self.n_rep
+        start = n_total * rank // world_size
+        stop = n_total * (rank + 1) // world_size
+        return self.get_runs(levels, slice(start, stop), dtype)
+
+
+def _get_dtype(levels: Iterable[int], dtype: Optional[npt.DTypeLike]) -> np.dtype:
+    '''
+    return dtype if given, otherwise the narrowest integer dtype holding every level code
+    '''
+    return get_int_dtype(0, max(levels) - 1) if dtype is None else np.dtype(dtype)
+
+
+def _decode_runs(index: np.ndarray, levels: Iterable[int], dtype: np.dtype) -> np.ndarray:
+    '''
+    decode run indices of a single replication into factor levels
+
+    Parameters
+    ----------
+    index : np.ndarray
+        1-d array of run indices within [0, prod(levels))
+    levels : Iterable[int]
+        a list of integers which shows the number of level of each input factor
+    dtype : np.dtype
+        dtype of the decoded rows
+
+    Returns
+    -------
+    rows : np.ndarray(len(index) * n_factor)
+        levels of each factor, the last factor being the fastest digit
+        as in np.indices(levels)
+    '''
+    levels = list(levels)
+    rows = np.empty((len(index), len(levels)), dtype=dtype)
+    rest = np.array(index, dtype=np.int64)
+    for col in range(len(levels) - 1, -1, -1):
+        rest, rows[:, col] = np.divmod(rest, levels[col])
+    return rows
@@ -0,0 +1,132 @@
+"""
+Finite field arithmetic for Paley constructions
+
+- elements of GF(q), q = p^m, are encoded as integers in [0, q)
+  whose base-p digits are the coefficients of a polynomial over GF(p) (lowest degree first)
+- multiplication is done modulo a monic irreducible polynomial of degree m
+"""
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from tagupy.design.generator._circulant import _circulant
+
+
+def _prime_power(q: int) -> Optional[Tuple[int, int]]:
+    '''
+    factorize q as p^m
+
+    Parameters
+    ----------
+    q: int
+        order of the field
+
+    Returns
+    -------
+    pm: Optional[Tuple[int, int]]
+        (p, m) if q is a power of a prime p, otherwise None
+    '''
+    if q < 2:
+        return None
+    p = next((i for i in range(2, int(q ** 0.5) + 1) if q % i == 0), q)
+    m = 0
+    while q % p == 0:
+        q //= p
+        m += 1
+    return (p, m) if q == 1 else None
+
+
+def _split_prime_power(q: int) -> Tuple[int, int]:
+    '''
+    (p, m) of a prime power q = p^m
+    '''
+    pm = _prime_power(q)
+    assert pm is not None, f"Invalid input: q expected prime power, got {q}"
+    return pm
+
+
+def _poly_mod(num: List[int], den: List[int], p: int) -> List[int]:
+    '''
+    remainder of polynomials over GF(p), coefficients lowest degree first, den is monic
+    '''
+    num = list(num)
+    for top in range(len(num) - 1, len(den) - 2, -1):
+        c = num[top] % p
+        if c:
+            for i, d in enumerate(den):
+                num[top - len(den) + 1 + i] -= c * d
+    return [c % p for c in num[:len(den) - 1]]
+
+
+def _monic_polys(p: int, deg: int) -> List[List[int]]:
+    return [[(k // p ** i) % p for i in range(deg)] + [1] for k in range(p ** deg)]
+
+
+@lru_cache(maxsize=None)
+def _irreducible_poly(p: int, m: int) -> Tuple[int, ...]:
+    '''
+    find the monic irreducible polynomial of degree m over GF(p) with the smallest encoding
+
+    Returns
+    -------
+    poly: Tuple[int, ...]
+        m + 1 coefficients, lowest degree first
+    '''
+    factors = [f for deg in range(1, m // 2 + 1) for f in _monic_polys(p, deg)]
+    for poly in _monic_polys(p, m):
+        if all(any(_poly_mod(poly, f, p)) for f in factors):
+            return tuple(poly)
+    raise ValueError(f"no irreducible polynomial of degree {m} over GF({p})")
+
+
+def _digits(q: int) -> np.ndarray:
+    '''
+    base-p digits of every element of GF(q), (q x m) array
+    '''
+    p, m = _split_prime_power(q)
+    return (np.arange(q)[:, None] // p ** np.arange(m)) % p
+
+
+def _quadratic_character(q: int) -> np.ndarray:
+    '''
+    quadratic character of every element of GF(q), q odd prime power
+
+    Returns
+    -------
+    chi: np.ndarray(q)
+        0 for the zero element, 1 for non-zero squares, -1 otherwise (int8)
+    '''
+    p, m = _split_prime_power(q)
+    poly = _irreducible_poly(p, m)
+    dig = _digits(q)
+    prod = np.zeros((q, 2 * m - 1), dtype=np.int64)
+    for i in range(m):
+        prod[:, i:i + m] += dig[:, i:i + 1] * dig
+    for top in range(2 * m - 2, m - 1, -1):
+        prod[:, top - m:top] -= prod[:, top:top + 1] * np.array(poly[:m])
+    squares = (prod[:, :m] % p) @ (p ** np.arange(m))
+    chi = -np.ones(q, dtype=np.int8)
+    chi[squares] = 1
+    chi[0] = 0
+    return chi
+
+
+def _jacobsthal(q: int) -> np.ndarray:
+    '''
+    Jacobsthal matrix of GF(q), q odd prime power
+
+    Returns
+    -------
+    jmat: np.ndarray(q * q)
+        jmat[a, b] = chi(a - b), symmetric if q = 1 mod 4 and antisymmetric if q = 3 mod 4
+    '''
+    p, m = _split_prime_power(q)
+    chi = _quadratic_character(q)
+    if m == 1:
+        return _circulant(chi[-np.arange(q) % q])
+    dig = _digits(q)
+    diff = np.zeros((q, q), dtype=np.int64)
+    for i in range(m):
+        diff += ((dig[:, None, i] - dig[None, :, i]) % p) * p ** i
+    return chi[diff]
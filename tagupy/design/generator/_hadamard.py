@@ -0,0 +1,212 @@
+"""
+Construction engine of Hadamard matrices
+
+- Sylvester: order 2^k
+- Paley I: order q + 1, q = 3 mod 4 prime power
+- Paley II: order 2(q + 1), q = 1 mod 4 prime power
+- Williamson: order 4n from four symmetric circulant matrices of order n,
+  whose generating rows are searched by _williamson_search and kept in the store (see _ref_build)
+- Kronecker product of two constructible orders
+
+_hadamard_plan picks the construction of each order, preferring the direct ones,
+and the matrices are memoized in base_matrix_cache.
+"""
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from tagupy.design.generator._base_cache import _cached_matrix
+from tagupy.design.generator._circulant import _circulant_view
+from tagupy.design.generator._galois import _jacobsthal, _prime_power
+from tagupy.design.generator._ref_store import _load_table
+
+_WILLIAMSON = (23, 29)
+
+
+def _sylvester(order: int) -> np.ndarray:
+    '''
+    Hadamard matrix of order 2^k by Sylvester doubling
+    '''
+    h = np.ones((1, 1), dtype=np.int8)
+    while len(h) < order:
+        h = np.block([[h, h], [h, -h]])
+    return h
+
+
+def _paley1(q: int) -> np.ndarray:
+    '''
+    skew Hadamard matrix of order q + 1, q = 3 mod 4 prime power
+
+    Note
+    ----
+    H = I + S, S = ([0, j'],
+                    [-j, Q])
+    Q is the Jacobsthal matrix of GF(q) and j the all-ones vector
+    '''
+    s = np.zeros((q + 1, q + 1), dtype=np.int8)
+    s[0, 1:] = 1
+    s[1:, 0] = -1
+    s[1:, 1:] = _jacobsthal(q)
+    return s + np.eye(q + 1, dtype=np.int8)
+
+
+def _paley2(q: int) -> np.ndarray:
+    '''
+    Hadamard matrix of order 2(q + 1), q = 1 mod 4 prime power
+
+    Note
+    ----
+    H = C x ([1, 1], [1, -1]) + I x ([1, -1], [-1, -1]), x is the Kronecker product
+    C = ([0, j'],
+         [j, Q]) is the symmetric conference matrix of order q + 1
+    '''
+    c = np.zeros((q + 1, q + 1), dtype=np.int8)
+    c[0, 1:] = 1
+    c[1:, 0] = 1
+    c[1:, 1:] = _jacobsthal(q)
+    one = np.array([[1, 1], [1, -1]], dtype=np.int8)
+    eye = np.array([[1, -1], [-1, -1]], dtype=np.int8)
+    return np.kron(c, one) + np.kron(np.eye(q + 1, dtype=np.int8), eye)
+
+
+def _williamson(n: int) -> np.ndarray:
+    '''
+    Hadamard matrix of order 4n from the stored Williamson matrices of order n
+
+    Note
+    ----
+    H = ([A, B, C, D],
+         [-B, A, -D, C],
+         [-C, D, A, -B],
+         [-D, -C, B, A])
+    A, B, C and D are symmetric circulant matrices with AA' + BB' + CC' + DD' = 4nI
+    '''
+    a, b, c, d = (_circulant_view(v) for v in _load_table(f"williamson{n}", (4, n)))
+    return np.block([
+        [a, b, c, d],
+        [-b, a, -d, c],
+        [-c, d, a, -b],
+        [-d, -c, b, a],
+    ])
+
+
+def _williamson_search(n: int) -> Optional[np.ndarray]:
+    '''
+    search generating rows of Williamson matrices of odd order n
+
+    Parameters
+    ----------
+    n: int
+        odd order of the Williamson matrices
+
+    Returns
+    -------
+    rows: Optional[np.ndarray(4 * n)]
+        symmetric first rows of A, B, C and D, or None if not found
+
+    Note
+    ----
+    Every symmetric (+/-1) sequence with a leading 1 and a power spectral density <= 4n
+    is a candidate. For each decomposition of 4n into four odd squares (the row sums),
+    pairs (A, B) and (C, D) are matched so that their periodic autocorrelations cancel out.
+    The cost grows as 2^n, it is meant to be run by _ref_build, not at runtime.
+    '''
+    m = (n - 1) // 2
+    bits = ((np.arange(2 ** m)[:, None] >> np.arange(m)) & 1) * 2 - 1
+    seq = np.hstack([np.ones((len(bits), 1), dtype=int), bits, bits[:, ::-1]])
+    keep = (np.abs(np.fft.fft(seq, axis=1)) ** 2 <= 4 * n + 1e-6).all(axis=1)
+    seq = seq[keep]
+    paf = np.stack([(seq * np.roll(seq, -k, axis=1)).sum(axis=1) for k in range(1, m + 1)], axis=1)
+    row_sum = np.abs(seq.sum(axis=1))
+
+    odd = range(1, int((4 * n) ** 0.5) + 1, 2)
+    for sums in combinations_with_replacement(odd, 4):
+        if sum(s * s for s in sums) != 4 * n:
+            continue
+        ia, ib, ic, id_ = (np.flatnonzero(row_sum == s) for s in sums)
+        pairs: Dict[bytes, Tuple[int, int]] = {}
+        for i in ia:
+            for j, key in zip(ib, paf[i] + paf[ib]):
+                pairs.setdefault(key.tobytes(), (int(i), int(j)))
+        for k in ic:
+            for l_, key in zip(id_, -(paf[k] + paf[id_])):
+                if key.tobytes() in pairs:
+                    return seq[[*pairs[key.tobytes()], int(k), int(l_)]]
+    return None
+
+
+class _Plan(NamedTuple):
+    '''
+    construction of a Hadamard matrix, the name of the construction and its parameters
+    '''
+    kind: str
+    args: Tuple[int, ...]
+
+
+@lru_cache(maxsize=None)
+def _hadamard_plan(order: int) -> Optional[_Plan]:
+    '''
+    choose the construction of the Hadamard matrix of order
+
+    Returns
+    -------
+    plan: Optional[_Plan]
+        ("sylvester", (order,)), ("paley1", (q,)), ("paley2", (q,)), ("williamson", (n,)),
+        ("kron", (a, b)) or None if no construction is known to this module
+    '''
+    if order < 1 or (order > 2 and order % 4):
+        return None
+    if order & (order - 1) == 0:
+        return _Plan("sylvester", (order,))
+    pm = _prime_power(order - 1)
+    if pm and (order - 1) % 4 == 3:
+        return _Plan("paley1", (order - 1,))
+    pm = _prime_power(order // 2 - 1)
+    if pm and (order // 2 - 1) % 4 == 1:
+        return _Plan("paley2", (order // 2 - 1,))
+    if order // 4 in _WILLIAMSON:
+        return _Plan("williamson", (order // 4,))
+    for a in range(2, int(order ** 0.5) + 1):
+        if order % a == 0 and _hadamard_plan(a) and _hadamard_plan(order // a):
+            return _Plan("kron", (a, order // a))
+    return None
+
+
+def _hadamard(order: int) -> np.ndarray:
+    '''
+    Hadamard matrix of order
+
+    Parameters
+    ----------
+    order: int
+        order of the Hadamard matrix, 1, 2 or a multiple of 4
+
+    Returns
+    -------
+    hmat: np.ndarray(order * order)
+        read-only (+/-1) int8 matrix with hmat @ hmat.T = order * I
+
+    Raises
+    ------
+    ValueError
+        if no construction of order is known to this module
+    '''
+    plan = _hadamard_plan(order)
+    if plan is None:
+        raise ValueError(f"Hadamard matrix of order {order} is not supported")
+
+    kind, args = plan
+
+    def _build() -> np.ndarray:
+        if kind == "kron":
+            return np.kron(_hadamard(args[0]), _hadamard(args[1]))
+        return {
+            "sylvester": _sylvester,
+            "paley1": _paley1,
+            "paley2": _paley2,
+            "williamson": _williamson,
+        }[kind](*args)
+
+    return _cached_matrix(("hadamard", order), _build)
@@ -2,10 +2,15 @@
 _Generator Class of One Hot Design Generator Module
 """
 
+from typing import Optional, Union
+
 import numpy as np
+import numpy.typing as npt
 
+from tagupy.design.generator._replicated import ReplicatedDesign, _replicate
+from tagupy.design.generator._sparse import SparseDesign
 from tagupy.type import _Generator as Generator
-from tagupy.utils import is_positive_int
+from tagupy.utils import get_int_dtype, is_positive_int
 
 
 class OneHot(Generator):
@@ -14,7 +19,8 @@ class OneHot(Generator):
 
     Method
     ------
-    get_exmatrix(self, n_factor: int) -> np.ndarray:
+    get_exmatrix(self, n_factor: int, lazy: bool, dtype: Optional[npt.DTypeLike], sparse: bool)
+        -> Union[np.ndarray, ReplicatedDesign, SparseDesign]:
 
     Notes
     -----
@@ -56,7 +62,13 @@ class OneHot(Generator):
             f"Invalid input: n_rep expected positive (>0) integer, got {type(n_rep)}::{n_rep}"
         self.n_rep = n_rep
 
-    def get_exmatrix(self, n_factor: int) -> np.ndarray:
+    def get_exmatrix(
+        self,
+        n_factor: int,
+        lazy: bool = False,
+        dtype: Optional[npt.DTypeLike] = None,
+        sparse: bool = False,
+    ) -> Union[np.ndarray, ReplicatedDesign, SparseDesign]:
         """
         Generate One Hot Design Matrix
 
@@ -66,10 +78,18 @@ class OneHot(Generator):
             number of factors you use in this experiment
             As this method is limited for multifactorial experiment,
             n_factor expects integer >= 1
+        lazy: bool
+            if True, return ReplicatedDesign which holds a single replication
+            instead of stacking n_rep copies
+        dtype: Optional[numpy.typing.DTypeLike]
+            dtype of the experiment matrix, int8 is used by default
+        sparse: bool
+            if True, return SparseDesign which holds only the n_rep * n_factor ones,
+            instead of the dense matrix of O(n_factor^2) elements
 
         Return
         ------
-        exmatrix: np.ndarray
+        exmatrix: Union[np.ndarray, ReplicatedDesign, SparseDesign]
             Experiment Matrix (n_experiment x n_factor)
 
         Example
@@ -82,10 +102,21 @@ class OneHot(Generator):
                [0, 0],
                [1, 0],
                [0, 1],
-               [0, 0]])
+               [0, 0]], dtype=int8)
+        >>> model.get_exmatrix(n_factor=50000, sparse=True)
+        SparseDesign(shape=(100002, 50000), nnz=100000, dtype=int8)
         """
         assert is_positive_int(n_factor), \
             f"Invalid input: n_factor expected positive (>0) int, got {type(n_factor)}::{n_factor}"
 
-        res = np.vstack([np.identity(n_factor, int), np.zeros(n_factor, int)] * self.n_rep)
-        return res
+        assert not (lazy and sparse), \
+            "Invalid input: lazy and sparse cannot be set at the same time"
+
+        dtype = get_int_dtype(0, 1) if dtype is None else np.dtype(dtype)
+        if sparse:
+            cols = np.tile(np.arange(n_factor), self.n_rep)
+            rows = cols + np.repeat(np.arange(self.n_rep) * (n_factor + 1), n_factor)
+            shape = ((n_factor + 1) * self.n_rep, n_factor)
+            return SparseDesign(rows, cols, np.ones(len(cols), dtype), shape=shape)
+        base = np.vstack([np.identity(n_factor, dtype), np.zeros(n_factor, dtype)])
+        return _replicate(base, self.n_rep, lazy)
@@ -0,0 +1,234 @@
+"""
+Bit-packed Two-level Experiment Matrix Module
+"""
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from tagupy.utils import is_positive_int
+
+_GRAM_WORDS = 1 << 22
+_POPCOUNT_LUT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    '''
+    number of set bits of each uint64 word, through np.bitwise_count if available
+    '''
+    counts: np.ndarray
+    if hasattr(np, "bitwise_count"):
+        counts = np.bitwise_count(words)
+    else:
+        byte_counts = _POPCOUNT_LUT[words.view(np.uint8)].reshape(words.shape + (8,))
+        counts = byte_counts.sum(axis=-1, dtype=np.uint8)
+    return counts
+
+
+class PackedDesign:
+    """
+    Two-level (+/-1) Experiment Matrix packed into one bit per element
+
+    Attributes
+    ----------
+    words: numpy.ndarray
+        read-only uint64 words (n_factor x n_word), the bit k of the column j is set
+        if exmatrix[k, j] == 1, and the padding bits are zero
+    shape: Tuple[int, int]
+        shape of the materialized experiment matrix (n_experiment, n_factor)
+
+    Notes
+    -----
+    Each column is stored as ceil(n_experiment / 64) words, 64 times less memory
+    than an int64 matrix. For (+/-1) columns x and y,
+    x'y = n_experiment - 2 * popcount(x XOR y),
+    so that the Gram matrix, the correlation matrix and the orthogonality check
+    are computed by XOR and popcount kernels without unpacking the design.
+    get_corr_matrix consumes PackedDesign without materializing it.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.generator import PackedDesign
+    >>> design = PackedDesign(np.array([[1, 1], [-1, 1], [1, -1], [-1, -1]]))
+    >>> design.words.shape
+    (2, 1)
+    >>> design.gram()
+    array([[4, 0],
+           [0, 4]])
+    >>> design.is_orthogonal()
+    True
+    >>> np.asarray(design)
+    array([[ 1,  1],
+           [-1,  1],
+           [ 1, -1],
+           [-1, -1]], dtype=int8)
+    """
+
+    def __init__(self, exmatrix: npt.ArrayLike):
+        """
+        Parameters
+        ----------
+        exmatrix: numpy.typing.ArrayLike
+            (+/-1) experiment matrix (n_experiment x n_factor)
+        """
+        exmatrix = np.asarray(exmatrix)
+        assert exmatrix.ndim == 2, \
+            f"Invalid input: exmatrix expected 2-d array, got {exmatrix.ndim}-d array"
+        assert ((exmatrix == 1) | (exmatrix == -1)).all(), \
+            "Invalid input: exmatrix expected to consist of -1 and 1"
+        n_run, n_factor = exmatrix.shape
+        n_word = -(-n_run // 64)
+        packed = np.zeros((n_factor, 8 * n_word), dtype=np.uint8)
+        packed[:, :-(-n_run // 8)] = np.packbits(exmatrix.T == 1, axis=1, bitorder="little")
+        words = packed.view("<u8").astype(np.uint64, copy=False)
+        self._set_words(words, n_run)
+
+    def _set_words(self, words: np.ndarray, n_run: int) -> None:
+        words.flags.writeable = False
+        self.words: np.ndarray = words
+        self.shape: Tuple[int, int] = (n_run, len(words))
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def size(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.int8)
+
+    @property
+    def nbytes(self) -> int:
+        return self.words.nbytes
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return f"PackedDesign(shape={self.shape}, nbytes={self.nbytes})"
+
+    def __array__(self, dtype: Optional[Any] = None, copy: Optional[bool] = None) -> np.ndarray:
+        if copy is False:
+            raise ValueError("PackedDesign cannot be converted to ndarray without a copy")
+        res = self.toarray()
+        return res if dtype is None else res.astype(dtype, copy=False)
+
+    def sum(self, axis: Optional[int] = None) -> Union[np.ndarray, np.integer]:
+        """
+        Sum of the elements over the columns
+
+        Parameters
+        ----------
+        axis: Optional[int]
+            0 for column sums, None for the total
+
+        Return
+        ------
+        total: Union[numpy.ndarray, numpy.integer]
+            2 * (number of +1) - n_experiment of each column
+        """
+        assert axis in (0, -2, None), \
+            f"Invalid input: axis expected 0 or None, got {type(axis)}::{axis}"
+        res: np.ndarray = 2 * _popcount(self.words).sum(axis=1, dtype=np.int64) - self.shape[0]
+        return res if axis is not None else res.sum()
+
+    def gram(self, block_size: Optional[int] = None) -> np.ndarray:
+        """
+        Gram matrix of the columns, exmatrix.T @ exmatrix
+
+        Parameters
+        ----------
+        block_size: Optional[int]
+            number of columns XORed against all the columns at once,
+            which bounds the working memory to n_factor * block_size * n_word words,
+            by default chosen to keep it around 2^22 words
+
+        Return
+        ------
+        gram: numpy.ndarray
+            (n_factor x n_factor) int64 matrix of the column inner products
+        """
+        n_run, n_factor = self.shape
+        if block_size is None:
+            block_size = max(1, _GRAM_WORDS // max(1, n_factor * self.words.shape[1]))
+        res = np.empty((n_factor, n_factor), dtype=np.int64)
+        for start in range(0, n_factor, block_size):
+            block = self.words[start:start + block_size]
+            diff = _popcount(block[:, None, :] ^ self.words[None, :, :])
+            diff = diff.sum(axis=-1, dtype=np.int64)
+            res[start:start + block_size] = n_run - 2 * diff
+        return res
+
+    def is_orthogonal(self) -> bool:
+        """
+        Whether every pair of different columns is orthogonal
+
+        Return
+        ------
+        orthogonal: bool
+            True if exmatrix.T @ exmatrix = n_experiment * I
+        """
+        return bool((self.gram() == self.shape[0] * np.eye(self.shape[1], dtype=np.int64)).all())
+
+    def tile(self, n_rep: int) -> "PackedDesign":
+        """
+        Stack n_rep copies of the experiment matrix without unpacking it
+
+        Parameters
+        ----------
+        n_rep: int
+            number of copies, positive integer
+
+        Return
+        ------
+        design: PackedDesign
+            packed experiment matrix (n_rep * n_experiment x n_factor)
+
+        Notes
+        -----
+        The copy r starts at the bit r * n_experiment, so that its words are shifted
+        by (r * n_experiment) % 64 bits and ORed into two consecutive output words.
+        The copies sharing a shift are written at once, at most 64 passes in total.
+        """
+        assert is_positive_int(n_rep), \
+            f"Invalid input: n_rep expected positive (>0) int, got {type(n_rep)}::{n_rep}"
+        n_run, n_factor = self.shape
+        n_word = self.words.shape[1]
+        words: np.ndarray
+        if n_run % 64 == 0:
+            words = np.tile(self.words, (1, n_rep))
+        else:
+            n_total = -(-n_rep * n_run // 64)
+            out = np.zeros((n_factor, n_total + n_word + 1), dtype=np.uint64)
+            offset = np.arange(n_rep, dtype=np.int64) * n_run
+            for shift in np.unique(offset % 64):
+                start = offset[offset % 64 == shift] // 64
+                index = (start[:, None] + np.arange(n_word)).reshape(-1)
+                # ORed along the rows of the transposed view, the copies may share a word
+                low = self.words << np.uint64(shift)
+                np.bitwise_or.at(out.T, index, np.tile(low, (1, len(start))).T)
+                if shift:
+                    high = self.words >> np.uint64(64 - shift)
+                    np.bitwise_or.at(out.T, index + 1, np.tile(high, (1, len(start))).T)
+            words = out[:, :n_total].copy()
+        res = PackedDesign.__new__(PackedDesign)
+        res._set_words(words, n_rep * n_run)
+        return res
+
+    def toarray(self) -> np.ndarray:
+        """
+        Materialize the (+/-1) experiment matrix
+
+        Return
+        ------
+        exmatrix: numpy.ndarray
+            writable int8 experiment matrix (n_experiment x n_factor)
+        """
+        bits = np.unpackbits(
+            self.words.view(np.uint8), axis=1, count=self.shape[0], bitorder="little")
+        exmatrix: np.ndarray = 2 * bits.T.astype(np.int8) - 1
+        return exmatrix
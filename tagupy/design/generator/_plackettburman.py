@@ -2,10 +2,16 @@
 _Generator Class of Plackett-Burman Design Generator Module
 """
 
+from typing import Optional, Union
+
 import numpy as np
+import numpy.typing as npt
 
+from tagupy.design.generator._base_cache import _cached_matrix
+from tagupy.design.generator._packed import PackedDesign
+from tagupy.design.generator._replicated import ReplicatedDesign, _replicate
 from tagupy.type import _Generator as Generator
-from tagupy.utils import is_positive_int
+from tagupy.utils import get_int_dtype, is_positive_int
 from tagupy.design.generator._pb_ref import _pb
 
 
@@ -15,14 +21,19 @@ class PlackettBurman(Generator):
 
     Method
     ------
-    get_exmatrix(n_factor: int) -> numpy.ndarray
+    get_exmatrix(n_factor: int, lazy: bool, dtype: Optional[numpy.typing.DTypeLike], packed: bool)
+        -> Union[numpy.ndarray, ReplicatedDesign, PackedDesign]
 
     Notes
     -----
     get_exmatrix function returns experiment matrix of Plackett-Burman design
     Although Plackett-Burman (PB) design requires single runs for all conditions,
     this module supports replicated design for experiments deal with instable results.
-    PB design supports experiments with 4 to 99 factors expect 92.
+    PB design supports experiments with n_factor factors whenever a Hadamard matrix
+    of order n_run = 4 * (n_factor // 4 + 1) can be constructed:
+    reference tables are used for n_run <= 100, and Sylvester, Paley I/II, Williamson
+    constructions and their Kronecker products for larger n_run.
+    This covers every n_factor < 152 and most of larger ones (e.g. 80% of n_run <= 1000).
 
     see also:
     https://en.wikipedia.org/wiki/Plackett%E2%80%93Burman_design
@@ -44,7 +55,13 @@ class PlackettBurman(Generator):
             f"Invalid input: n_rep expected positive (>0) integer, got {type(n_rep)}::{n_rep}"
         self.n_rep = n_rep
 
-    def get_exmatrix(self, n_factor: int) -> np.ndarray:
+    def get_exmatrix(
+        self,
+        n_factor: int,
+        lazy: bool = False,
+        dtype: Optional[npt.DTypeLike] = None,
+        packed: bool = False,
+    ) -> Union[np.ndarray, ReplicatedDesign, PackedDesign]:
         """
         Generate Plakett-Burman Design Matrix
 
@@ -54,12 +71,28 @@ class PlackettBurman(Generator):
             number of factors you use in this experiment
             As this method is limited for multifactorial experiment,
             n_factor expects integer >= 1
+        lazy: bool
+            if True, return ReplicatedDesign which holds a single replication
+            instead of stacking n_rep copies
+        dtype: Optional[numpy.typing.DTypeLike]
+            dtype of the experiment matrix, int8 is used by default.
+            Arithmetic keeps the dtype and wraps around silently,
+            e.g. (X.T @ X)[0, 0] is -124 instead of 132 for n_factor=130,
+            so cast with X.astype(float) or pass dtype=int before computing products or sums
+        packed: bool
+            if True, return PackedDesign which holds one bit per element,
+            dtype is ignored then
 
         Return
         ------
-        exmatrix: numpy.ndarray
+        exmatrix: Union[numpy.ndarray, ReplicatedDesign, PackedDesign]
             Experiment Matrix (n_experiment x n_factor)
 
+        Raises
+        ------
+        ValueError
+            if no Hadamard matrix of order n_run can be constructed
+
         Example
         -------
         >>> from tagupy.design import PlackettBurman
@@ -72,12 +105,17 @@ class PlackettBurman(Generator):
                [ 1,  1, -1],
                [-1,  1,  1],
                [ 1, -1,  1],
-               [-1, -1, -1]])
+               [-1, -1, -1]], dtype=int8)
+        >>> model.get_exmatrix(n_factor=3, packed=True).is_orthogonal()
+        True
         """
         assert is_positive_int(n_factor), \
             f"Invalid input: n_factor expected positive (>0) int, got {type(n_factor)}::{n_factor}"
-        assert n_factor < 100, \
-            f"Invalid input: n_factor is supported for int < 100, got {n_factor}"
+        assert not (lazy and packed), \
+            "Invalid input: lazy and packed cannot be set at the same time"
         n_run = 4 * (n_factor // 4 + 1)
-        res = np.vstack([_pb(n_run)[:, :n_factor]] * self.n_rep)
-        return res
+        dtype = get_int_dtype(-1, 1) if dtype is None else np.dtype(dtype)
+        base = _cached_matrix(("pb", n_run), lambda: _pb(n_run))
+        if packed:
+            return PackedDesign(base[:, :n_factor]).tile(self.n_rep)
+        return _replicate(base[:, :n_factor].astype(dtype, copy=False), self.n_rep, lazy)
@@ -0,0 +1,64 @@
+"""
+Build script of the bit-packed reference tables
+
+Usage
+-----
+python -m tagupy.design.generator._ref_build
+
+regenerates _ref_data from the literal tables in _ref_literals
+and the Williamson matrices searched by _hadamard._williamson_search,
+and verifies that every stored table is restored exactly.
+"""
+from typing import Dict
+
+import numpy as np
+
+from tagupy.design.generator._hadamard import _WILLIAMSON, _williamson_search
+from tagupy.design.generator._pb_ref import _PB_CIRCULANT, _PB_TABLE
+from tagupy.design.generator._ref_store import _DATA_DIR, _load_table, _pack_table, _table_path
+
+
+def _literal_tables() -> Dict[str, np.ndarray]:
+    '''
+    evaluate the literal tables and search the Williamson matrices
+
+    Returns
+    -------
+    tables: Dict[str, np.ndarray]
+        reference tables by their name in the store
+    '''
+    from tagupy.design.generator import _ref_literals as lit
+
+    tables = {f"pb{n}": getattr(lit, f"_pb{n}")() for n in _PB_TABLE}
+    tables.update({f"pbvec{n}": lit.vec_dict[n] for n in _PB_CIRCULANT})
+    tables["dsd46"] = lit._dsd46()
+    tables.update({f"williamson{n}": _williamson_search(n) for n in _WILLIAMSON})
+    return tables
+
+
+def build() -> None:
+    '''
+    write every literal table into the store
+    '''
+    _DATA_DIR.mkdir(exist_ok=True)
+    for name, table in _literal_tables().items():
+        np.save(_table_path(name), _pack_table(table))
+
+
+def verify() -> None:
+    '''
+    check every stored table against its literal table
+
+    Raises
+    ------
+    ValueError
+        if a stored table differs from its literal table
+    '''
+    for name, table in _literal_tables().items():
+        if not np.array_equal(_load_table(name, table.shape), table):
+            raise ValueError(f"stored table {name} differs from the literal table")
+
+
+if __name__ == "__main__":
+    build()
+    verify()
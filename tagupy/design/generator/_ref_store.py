@@ -0,0 +1,82 @@
+"""
+Bit-packed store of the reference tables of PB and DSD
+
+- each table of {-1, 1} is saved as a single bit plane (1 for +1),
+  and each table of {-1, 0, 1} as two bit planes (non-zero, +1),
+  packed along the last axis by np.packbits into _ref_data/<name>.npy
+- tables are loaded lazily through a read-only memory map
+- the files are generated and verified from _ref_literals by _ref_build
+"""
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+_DATA_DIR = Path(__file__).parent / "_ref_data"
+
+
+def _table_path(name: str) -> Path:
+    return _DATA_DIR / f"{name}.npy"
+
+
+def _pack_table(table: np.ndarray) -> np.ndarray:
+    '''
+    pack a table of {-1, 0, 1} into bit planes
+
+    Parameters
+    ----------
+    table: np.ndarray
+        1-d or 2-d reference table
+
+    Returns
+    -------
+    packed: np.ndarray(n_plane * n_row * ceil(n_col / 8))
+        uint8 bit planes, n_plane = 1 if table has no zero, otherwise 2
+    '''
+    table = np.atleast_2d(table)
+    assert np.isin(table, (-1, 0, 1)).all(), \
+        f"Invalid input: table expected elements in (-1, 0, 1), got {np.unique(table)}"
+    planes = [table > 0] if (table != 0).all() else [table != 0, table > 0]
+    return np.packbits(np.stack(planes), axis=-1)
+
+
+def _unpack_table(packed: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+    '''
+    restore a table of {-1, 0, 1} from its bit planes
+
+    Parameters
+    ----------
+    packed: np.ndarray
+        bit planes created by _pack_table
+    shape: Tuple[int, ...]
+        shape of the original table
+
+    Returns
+    -------
+    table: np.ndarray(shape)
+        int8 reference table
+    '''
+    bits = np.unpackbits(packed, axis=-1, count=shape[-1]).view(np.int8)
+    table: np.ndarray = 2 * bits[-1] - 1
+    if len(bits) == 2:
+        table *= bits[0]
+    return table.reshape(shape)
+
+
+def _load_table(name: str, shape: Tuple[int, ...]) -> np.ndarray:
+    '''
+    load a reference table from the store
+
+    Parameters
+    ----------
+    name: str
+        name of the table, e.g. "pb28", "pbvec4" or "dsd46"
+    shape: Tuple[int, ...]
+        shape of the table
+
+    Returns
+    -------
+    table: np.ndarray(shape)
+        int8 reference table
+    '''
+    return _unpack_table(np.load(_table_path(name), mmap_mode='r'), shape)
@@ -0,0 +1,154 @@
+"""
+Replicated Experiment Matrix Module
+"""
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+
+from tagupy.utils import is_positive_int
+
+
+class ReplicatedDesign:
+    """
+    Experiment Matrix made of n_rep identical blocks, stored as a single block
+
+    Attributes
+    ----------
+    base: numpy.ndarray
+        read-only experiment matrix of a single replication (n_run x n_factor)
+    n_rep: int
+        number of replications
+    replicates: numpy.ndarray
+        read-only broadcast view of the replicates (n_rep x n_run x n_factor)
+    shape: Tuple[int, int]
+        shape of the materialized experiment matrix (n_rep * n_run, n_factor)
+
+    Notes
+    -----
+    ReplicatedDesign behaves like the stacked matrix np.vstack([base] * n_rep)
+    through np.asarray() and indexing, while it holds only one block in memory.
+    The stacked matrix is created only when toarray() or np.asarray() is called.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.generator import ReplicatedDesign
+    >>> design = ReplicatedDesign(np.array([[1, 0], [0, 1]]), n_rep=3)
+    >>> design.shape
+    (6, 2)
+    >>> design[3]
+    array([0, 1])
+    >>> design[1:5, 0]
+    array([0, 1, 0, 1])
+    >>> np.asarray(design)
+    array([[1, 0],
+           [0, 1],
+           [1, 0],
+           [0, 1],
+           [1, 0],
+           [0, 1]])
+    """
+
+    def __init__(self, base: np.ndarray, n_rep: int):
+        """
+        Parameters
+        ----------
+        base: numpy.ndarray
+            experiment matrix of a single replication (n_run x n_factor)
+        n_rep: int
+            number of replications
+        """
+        assert is_positive_int(n_rep), \
+            f"Invalid input: n_rep expected positive (>0) integer, got {type(n_rep)}::{n_rep}"
+        base = np.asarray(base)
+        assert base.ndim == 2, \
+            f"Invalid input: base expected 2-d array, got {base.ndim}-d array"
+        if base.flags.writeable:
+            base = base.copy()
+            base.flags.writeable = False
+        self.base = base
+        self.n_rep = n_rep
+
+    @property
+    def replicates(self) -> np.ndarray:
+        return np.broadcast_to(self.base, (self.n_rep,) + self.base.shape)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.n_rep * self.base.shape[0], self.base.shape[1])
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def size(self) -> int:
+        return self.n_rep * self.base.size
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.base.dtype
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return f"ReplicatedDesign(base={self.base!r}, n_rep={self.n_rep})"
+
+    def __array__(self, dtype: Optional[Any] = None, copy: Optional[bool] = None) -> np.ndarray:
+        if copy is False:
+            raise ValueError("ReplicatedDesign cannot be converted to ndarray without a copy")
+        res = self.toarray()
+        return res if dtype is None else res.astype(dtype, copy=False)
+
+    def __getitem__(self, key: Any) -> Union[np.ndarray, np.generic]:
+        row, col = (key[0], key[1:]) if isinstance(key, tuple) else (key, ())
+        n_run = self.base.shape[0]
+        if isinstance(row, slice):
+            idx = np.arange(*row.indices(len(self))) % n_run
+        elif isinstance(row, (int, np.integer)) or (
+                isinstance(row, (list, np.ndarray)) and np.asarray(row).dtype.kind in 'iu'):
+            idx = np.asarray(row)
+            if ((idx < -len(self)) | (idx >= len(self))).any():
+                raise IndexError(f"index {row} is out of bounds for axis 0 with size {len(self)}")
+            idx = idx % len(self) % n_run
+        else:
+            res: Union[np.ndarray, np.generic] = self.toarray()[key]
+            return res
+        res = self.base[idx][(slice(None),) * idx.ndim + col]
+        return res
+
+    def toarray(self) -> np.ndarray:
+        """
+        Materialize the stacked experiment matrix
+
+        Return
+        ------
+        exmatrix: numpy.ndarray
+            writable experiment matrix (n_rep * n_run x n_factor)
+        """
+        return np.tile(self.base, (self.n_rep, 1))
+
+
+def _replicate(base: np.ndarray, n_rep: int, lazy: bool) -> Union[np.ndarray, ReplicatedDesign]:
+    """
+    Stack n_rep replications of base, lazily if required
+
+    Parameters
+    ----------
+    base: numpy.ndarray
+        experiment matrix of a single replication (n_run x n_factor)
+    n_rep: int
+        number of replications
+    lazy: bool
+        if True, return ReplicatedDesign holding base only
+
+    Return
+    ------
+    exmatrix: Union[numpy.ndarray, ReplicatedDesign]
+        experiment matrix (n_rep * n_run x n_factor)
+    """
+    if lazy:
+        return ReplicatedDesign(base, n_rep)
+    exmatrix: np.ndarray = np.tile(base, (n_rep, 1))
+    return exmatrix
@@ -0,0 +1,193 @@
+"""
+Sparse Experiment Matrix Module
+"""
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+
+class SparseDesign:
+    """
+    Experiment Matrix stored as coordinates of its non-zero elements (COO format)
+
+    Attributes
+    ----------
+    rows: numpy.ndarray
+        row indices of the non-zero elements (nnz)
+    cols: numpy.ndarray
+        column indices of the non-zero elements (nnz)
+    data: numpy.ndarray
+        values of the non-zero elements (nnz)
+    shape: Tuple[int, int]
+        shape of the materialized experiment matrix (n_experiment, n_factor)
+
+    Notes
+    -----
+    SparseDesign holds O(nnz) memory instead of O(n_experiment x n_factor).
+    Matrix products (design @ x, y @ design), column sums and the Gram matrix
+    design.T @ design are computed from the coordinates, and get_corr_matrix
+    consumes SparseDesign without materializing it.
+    The dense matrix is created only when toarray() or np.asarray() is called.
+    Duplicated coordinates are summed up as in the usual COO format.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.generator import SparseDesign
+    >>> design = SparseDesign([0, 1, 2], [0, 1, 1], [1, 1, 2], shape=(4, 2))
+    >>> design.nnz
+    3
+    >>> design @ np.array([1, 10])
+    array([ 1, 10, 20,  0])
+    >>> design.gram()
+    array([[1, 0],
+           [0, 5]])
+    >>> np.asarray(design)
+    array([[1, 0],
+           [0, 1],
+           [0, 2],
+           [0, 0]])
+    """
+
+    def __init__(
+        self,
+        rows: npt.ArrayLike,
+        cols: npt.ArrayLike,
+        data: npt.ArrayLike,
+        shape: Tuple[int, int],
+    ):
+        """
+        Parameters
+        ----------
+        rows: numpy.typing.ArrayLike
+            row indices of the non-zero elements
+        cols: numpy.typing.ArrayLike
+            column indices of the non-zero elements
+        data: numpy.typing.ArrayLike
+            values of the non-zero elements
+        shape: Tuple[int, int]
+            shape of the experiment matrix (n_experiment, n_factor)
+        """
+        assert isinstance(shape, tuple) and len(shape) == 2 and all(
+            isinstance(el, (int, np.integer)) and el >= 0 for el in shape), \
+            f"Invalid input: shape expected pair of non-negative int, got {type(shape)}::{shape}"
+        rows, cols, data = (np.asarray(el) for el in (rows, cols, data))
+        assert rows.ndim == cols.ndim == data.ndim == 1 and len(rows) == len(cols) == len(data), \
+            f"Invalid input: rows, cols and data expected 1-d arrays of the same length, " \
+            f"got {rows.shape}, {cols.shape} and {data.shape}"
+        assert len(rows) == 0 or (
+            rows.dtype.kind in 'iu' and cols.dtype.kind in 'iu'
+            and 0 <= rows.min() and rows.max() < shape[0]
+            and 0 <= cols.min() and cols.max() < shape[1]), \
+            f"Invalid input: rows and cols expected integer indices within {shape}"
+        self.rows = rows.astype(np.intp, copy=False)
+        self.cols = cols.astype(np.intp, copy=False)
+        self.data = data
+        self.shape = (int(shape[0]), int(shape[1]))
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def size(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.data.dtype
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return f"SparseDesign(shape={self.shape}, nnz={self.nnz}, dtype={self.dtype})"
+
+    def __array__(self, dtype: Optional[Any] = None, copy: Optional[bool] = None) -> np.ndarray:
+        res = self.toarray()
+        return res if dtype is None else res.astype(dtype, copy=False)
+
+    def __matmul__(self, other: npt.ArrayLike) -> np.ndarray:
+        other = np.asarray(other)
+        assert other.ndim in (1, 2) and other.shape[0] == self.shape[1], \
+            f"Invalid input: operand expected {self.shape[1]} rows, got shape {other.shape}"
+        res = np.zeros((self.shape[0],) + other.shape[1:], np.result_type(self.data, other))
+        np.add.at(res, self.rows, _scale(self.data, other[self.cols]))
+        return res
+
+    def __rmatmul__(self, other: npt.ArrayLike) -> np.ndarray:
+        other = np.asarray(other)
+        assert other.ndim in (1, 2) and other.shape[-1] == self.shape[0], \
+            f"Invalid input: operand expected {self.shape[0]} columns, got shape {other.shape}"
+        res = np.zeros(other.shape[:-1] + (self.shape[1],), np.result_type(self.data, other))
+        np.add.at(res.T, self.cols, _scale(self.data, other.T[self.rows]))
+        return res
+
+    def sum(self, axis: Optional[int] = None) -> Union[np.ndarray, np.generic]:
+        """
+        Sum of the elements over the given axis
+
+        Parameters
+        ----------
+        axis: Optional[int]
+            0 for column sums, 1 for row sums, None for the total
+
+        Return
+        ------
+        total: Union[numpy.ndarray, numpy.generic]
+            sums computed from the non-zero elements only
+        """
+        if axis is None:
+            total: np.generic = self.data.sum()
+            return total
+        assert axis in (0, 1, -1, -2), \
+            f"Invalid input: axis expected 0, 1 or None, got {type(axis)}::{axis}"
+        idx = self.cols if axis in (0, -2) else self.rows
+        res = np.zeros(self.shape[1 if axis in (0, -2) else 0], np.result_type(self.data, np.int64))
+        np.add.at(res, idx, self.data)
+        return res
+
+    def gram(self) -> np.ndarray:
+        """
+        Gram matrix of the columns, design.T @ design
+
+        Return
+        ------
+        gram: numpy.ndarray
+            (n_factor x n_factor) matrix accumulated over the pairs of non-zero elements
+            sharing a row, in O(sum of squared row counts) time
+        """
+        order = np.argsort(self.rows, kind="stable")
+        rows, cols, data = self.rows[order], self.cols[order], self.data[order]
+        counts = np.bincount(rows, minlength=self.shape[0])
+        start = np.cumsum(counts) - counts
+        n_pair = counts[rows]
+        left = np.repeat(np.arange(len(rows)), n_pair)
+        right = np.repeat(start[rows], n_pair) + np.arange(n_pair.sum()) \
+            - np.repeat(np.cumsum(n_pair) - n_pair, n_pair)
+        res = np.zeros((self.shape[1], self.shape[1]), np.result_type(self.data, np.int64))
+        np.add.at(res, (cols[left], cols[right]), data[left] * data[right])
+        return res
+
+    def toarray(self) -> np.ndarray:
+        """
+        Materialize the dense experiment matrix
+
+        Return
+        ------
+        exmatrix: numpy.ndarray
+            writable experiment matrix (n_experiment x n_factor)
+        """
+        res = np.zeros(self.shape, self.dtype)
+        np.add.at(res, (self.rows, self.cols), self.data)
+        return res
+
+
+def _scale(data: np.ndarray, values: np.ndarray) -> np.ndarray:
+    res: np.ndarray = data.reshape((-1,) + (1,) * (values.ndim - 1)) * values
+    return res
@@ -7,6 +7,8 @@ from typing import Any, Dict
 
 import numpy as np
 
+from tagupy.utils import get_alias_matrix
+
 
 class _Generator(ABC):
     """
@@ -52,3 +54,21 @@ class _Generator(ABC):
             Experiment Matrix (n_experiment x n_factor)
         """
         pass
+
+    def get_alias_matrix(self, max_dim: int, **info: Dict[str, Any]) -> np.ndarray:
+        """
+        Return Alias Matrix of the generated Experiment Matrix
+
+        Parameters
+        ----------
+        max_dim: int
+            maximum dimension of the alias terms, only 2 is supported
+        info: Dict[str, Any]
+            arguments of get_exmatrix
+
+        Return
+        ------
+        alias matrix: np.ndarray
+            Alias Matrix (1 + n_factor x n_term), see also tagupy.utils.get_alias_matrix
+        """
+        return get_alias_matrix(np.asarray(self.get_exmatrix(**info)), max_dim)
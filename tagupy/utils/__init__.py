@@ -1,10 +1,22 @@
+from . import _alias
+from . import _cache
 from . import _functions
+from . import _metrics
+from . import _model_matrix
 from . import _validators
 
+from ._alias import *       # noqa: F401, F403
+from ._cache import *       # noqa: F401, F403
 from ._functions import *   # noqa: F401, F403
+from ._metrics import *     # noqa: F401, F403
+from ._model_matrix import *  # noqa: F401, F403
 from ._validators import *  # noqa: F401, F403
 
 __all__ = []
 
+__all__.extend(_alias.__all__.copy())
+__all__.extend(_cache.__all__.copy())
 __all__.extend(_functions.__all__.copy())
+__all__.extend(_metrics.__all__.copy())
+__all__.extend(_model_matrix.__all__.copy())
 __all__.extend(_validators.__all__.copy())
@@ -0,0 +1,95 @@
+"""
+Utility alias matrix
+"""
+from typing import Tuple
+
+import numpy as np
+
+from ._cache import LRUCache, _design_digest
+from ._linalg import _back_substitution
+from ._model_matrix import ModelMatrix
+
+__all__ = [
+    "alias_factor_cache",
+    "get_alias_matrix",
+]
+
+alias_factor_cache = LRUCache(maxsize=128)
+
+
+def get_alias_matrix(exmatrix: np.ndarray, max_dim: int) -> np.ndarray:
+    """
+    Return Alias Matrix
+
+    Parameters
+    ----------
+    exmatrix: numpy.ndarray
+        Experiment Matrix (n_experiment x n_factor)
+    max_dim: int
+        maximum dimension of the alias terms, only 2 is supported
+
+    Returns
+    -------
+    alias matrix: numpy.ndarray
+        A = (X1'X1)^-1 X1'X2 (1 + n_factor x n_term),
+        X1 is the model matrix of the intercept and the main effects,
+        X2 the one of the two-factor interactions and the quadratic terms
+        ordered as in ModelMatrix(exmatrix, terms="quadratic")
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        if X1 does not have full column rank
+
+    Notes
+    -----
+    The factorization of X1 is computed once per design and kept in alias_factor_cache,
+    keyed by the digest of exmatrix.
+    If the columns of X1 are exactly orthogonal, e.g. PB designs (Hadamard matrices)
+    and DSDs (fold-over of conference matrices), X1'X1 is diagonal and A is obtained
+    by scaling the rows of X1'X2. Otherwise X1 = QR and A = R^-1 Q'X2 is
+    computed by a back substitution, without forming any inverse.
+
+    Example
+    -------
+    >>> from tagupy.design.generator import PlackettBurman
+    >>> from tagupy.utils import get_alias_matrix
+    >>> exmatrix = PlackettBurman(n_rep=1).get_exmatrix(n_factor=3)
+    >>> get_alias_matrix(exmatrix, max_dim=2)
+    array([[ 0.,  0.,  0.],
+           [ 0.,  0., -1.],
+           [ 0., -1.,  0.],
+           [-1.,  0.,  0.]])
+    """
+    if max_dim != 2:
+        raise NotImplementedError('Support only max_dim = 2')
+    exmatrix = np.asarray(exmatrix)
+    assert exmatrix.ndim == 2, \
+        f"Invalid input: exmatrix expected 2-d array, got {exmatrix.ndim}-d array"
+
+    model = ModelMatrix(exmatrix, terms="quadratic")
+    x1, x2 = model[:, :exmatrix.shape[1] + 1], model[:, exmatrix.shape[1] + 1:]
+    kind, *factor = alias_factor_cache.get(
+        ("main", _design_digest(exmatrix)), lambda: _main_effect_factor(x1))
+    if kind == "diag":
+        diag, = factor
+        alias: np.ndarray = (x1.T @ x2) / diag[:, None]
+        return alias
+    q, r = factor
+    return _back_substitution(r, q.T @ x2)
+
+
+def _main_effect_factor(x1: np.ndarray) -> Tuple:
+    """
+    ("diag", diag(X1'X1)) if X1 has orthogonal columns, otherwise ("qr", Q, R)
+    """
+    gram = x1.T @ x1
+    diag = np.diag(gram).copy()
+    if (gram == np.diag(diag)).all():
+        if (diag == 0).any():
+            raise np.linalg.LinAlgError("model matrix of the main effects is singular")
+        return ("diag", diag)
+    q, r = np.linalg.qr(x1)
+    if (np.abs(np.diag(r)) <= 1e-10 * np.abs(r).max()).any():
+        raise np.linalg.LinAlgError("model matrix of the main effects is singular")
+    return ("qr", q, r)
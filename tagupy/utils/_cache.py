@@ -0,0 +1,165 @@
+"""
+Utility cache
+"""
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from typing import Any, Callable, Hashable, NamedTuple
+
+import numpy as np
+
+from ._validators import is_positive_int
+
+__all__ = [
+    "CacheInfo",
+    "LRUCache",
+]
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of LRUCache
+
+    Attributes
+    ----------
+    hits: int
+        number of lookups served from the cache
+    misses: int
+        number of lookups which called the factory
+    maxsize: int
+        maximum number of entries
+    currsize: int
+        current number of entries
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    Size-limited, thread-safe, least-recently-used cache
+
+    Methods
+    -------
+    get(key: Hashable, factory: Callable[[], Any]) -> Any
+    info() -> CacheInfo
+    clear() -> None
+    resize(maxsize: int) -> None
+
+    Notes
+    -----
+    When two threads miss the same key at the same time,
+    both call the factory and the first stored value is returned to both of them.
+
+    Example
+    -------
+    >>> from tagupy.utils import LRUCache
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache.get("a", lambda: 1)
+    1
+    >>> cache.get("a", lambda: 2)
+    1
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Parameters
+        ----------
+        maxsize: int
+            maximum number of entries, the least recently used one is evicted beyond that
+        """
+        assert is_positive_int(maxsize), \
+            f"Invalid input: maxsize expected positive (>0) integer, got {type(maxsize)}::{maxsize}"
+        self._maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value of key, calling factory on a miss
+
+        Parameters
+        ----------
+        key: Hashable
+            key of the entry
+        factory: Callable[[], Any]
+            function which creates the value of key
+
+        Return
+        ------
+        value: Any
+            cached value
+        """
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._misses += 1
+
+        value = factory()
+        with self._lock:
+            value = self._data.setdefault(key, value)
+            self._data.move_to_end(key)
+            self._evict()
+        return value
+
+    def info(self) -> CacheInfo:
+        """
+        Return statistics of the cache
+
+        Return
+        ------
+        info: CacheInfo
+            hits, misses, maxsize and currsize of the cache
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the statistics
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum number of entries
+
+        Parameters
+        ----------
+        maxsize: int
+            new maximum number of entries
+        """
+        assert is_positive_int(maxsize), \
+            f"Invalid input: maxsize expected positive (>0) integer, got {type(maxsize)}::{maxsize}"
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+def _design_digest(exmatrix: np.ndarray) -> Hashable:
+    """
+    key identifying the contents of exmatrix, shared by the caches of derived matrices
+    """
+    data = np.ascontiguousarray(exmatrix)
+    return (data.shape, data.dtype.str, blake2b(data.tobytes(), digest_size=16).hexdigest())
@@ -1,31 +1,65 @@
 """
 Utility functions
 """
+from typing import Tuple
+
 import numpy as np
+import numpy.typing as npt
 
 __all__ = [
     "get_corr_matrix",
+    "get_int_dtype",
 ]
 
+_INT_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
 
-def get_corr_matrix(exmatrix: np.ndarray, max_dim: int) -> np.ndarray:
+def get_corr_matrix(
+    exmatrix: np.ndarray,
+    max_dim: int,
+    dtype: npt.DTypeLike = np.float64,
+    condensed: bool = False,
+    block_size: int = 256,
+) -> np.ndarray:
     """
     Return Correlation Matrix
 
     Parameters
     ----------
+    exmatrix: numpy.ndarray
+        Experiment Matrix (n_experiment x n_factor),
+        or a sparse design exposing gram() and sum(axis=0) such as SparseDesign
     max_dim: int
-        maximum dimension in Correlation Matrix
+        maximum dimension in Correlation Matrix,
+        1 for main effects only, 2 for main effects, two-factor interactions and quadratic terms
+    dtype: numpy.typing.DTypeLike
+        float dtype of the correlations, float32 halves the memory
+    condensed: bool
+        if True, return only the upper triangle above the diagonal as a 1-d array,
+        in the row-major order of numpy.triu_indices(n_term, k=1)
+    block_size: int
+        number of model terms expanded at once when max_dim = 2
 
     Returns
     -------
     correlation matrix: numpy.ndarray
-        Correlation Matrix, if you want more details, see also Notes.
+        Correlation Matrix (n_term x n_term), or its condensed form (n_term * (n_term - 1) / 2),
+        if you want more details, see also Notes.
 
     Notes
     -----
     https://www.jmp.com/support/help/en/16.1/index.shtml#page/jmp/color-map-on-correlations.shtml
 
+    Sparse designs are not materialized, the correlations are computed
+    from their Gram matrix and column sums.
+
+    The model terms of max_dim = 2 are ordered as
+    main effects x_i, two-factor interactions x_i * x_j (i < j)
+    and quadratic terms x_i^2 of the factors with more than two levels.
+    The term columns are built and standardized block by block,
+    so that the whole expanded model matrix is never held in memory.
+    Constant terms have no correlation and give nan.
+
     Example
     -------
     >>> from tagupy.design import generator
@@ -36,16 +70,138 @@ def get_corr_matrix(exmatrix: np.ndarray, max_dim: int) -> np.ndarray:
     array([[ 1.        , -0.33333333, -0.33333333],
            [-0.33333333,  1.        , -0.33333333],
            [-0.33333333, -0.33333333,  1.        ]])
-    >>> # You can only set max_dim = 1
-    >>> get_corr_matrix(exmatrix, max_dim=2)
+    >>> get_corr_matrix(model.get_exmatrix(n_factor=3, sparse=True), max_dim=1)
+    array([[ 1.        , -0.33333333, -0.33333333],
+           [-0.33333333,  1.        , -0.33333333],
+           [-0.33333333, -0.33333333,  1.        ]])
+    >>> exmatrix = generator.PlackettBurman(n_rep=1).get_exmatrix(n_factor=3)
+    >>> get_corr_matrix(exmatrix, max_dim=2, condensed=True)
+    array([ 0.,  0.,  0.,  0., -1.,  0.,  0., -1.,  0., -1.,  0.,  0.,  0.,
+            0.,  0.])
+    >>> # You can only set max_dim = 1 or 2
+    >>> get_corr_matrix(exmatrix, max_dim=3)
     Traceback (most recent call last):
       ...
-    NotImplementedError: Support only max_dim = 1
+    NotImplementedError: Support only max_dim = 1 or 2
+    """
+    if max_dim not in (1, 2):
+        raise NotImplementedError('Support only max_dim = 1 or 2')
+    dtype = np.dtype(dtype)
+    assert dtype.kind == 'f', \
+        f"Invalid input: dtype expected float dtype, got {type(dtype)}::{dtype}"
+    assert isinstance(block_size, int) and block_size > 0, \
+        "Invalid input: block_size expected positive (>0) int, " \
+        f"got {type(block_size)}::{block_size}"
+
+    if max_dim == 1:
+        if hasattr(exmatrix, "gram"):
+            corr = _corr_from_gram(exmatrix.gram(), exmatrix.sum(axis=0), len(exmatrix))
+        else:
+            corr = np.corrcoef(np.asarray(exmatrix).T)
+        corr = corr.astype(dtype, copy=False)
+        return corr[np.triu_indices(len(corr), k=1)] if condensed else corr
+
+    exmatrix = np.asarray(exmatrix)
+    left, right = _interaction_terms(exmatrix)
+    return _blockwise_corr(exmatrix, left, right, dtype, condensed, block_size)
+
+
+def _corr_from_gram(gram: np.ndarray, col_sum: np.ndarray, n_row: int) -> np.ndarray:
+    """
+    correlation matrix of the columns from their Gram matrix and sums, as np.corrcoef
+    """
+    cov = gram - np.outer(col_sum, col_sum) / n_row
+    std = np.sqrt(np.diag(cov))
+    return np.clip(cov / std[:, None] / std[None, :], -1, 1)
+
+
+def _interaction_terms(exmatrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    factor pairs (left, right) of the terms up to the second order,
+    the term column is exmatrix[:, left] * exmatrix[:, right]
+    and the index n_factor stands for the constant column of ones
+    """
+    n_factor = exmatrix.shape[1]
+    row, col = np.triu_indices(n_factor, k=1)
+    quad = np.array([i for i in range(n_factor) if len(np.unique(exmatrix[:, i])) > 2], dtype=int)
+    left = np.concatenate([np.arange(n_factor), row, quad])
+    right = np.concatenate([np.full(n_factor, n_factor), col, quad])
+    return left, right
+
+
+def _blockwise_corr(
+    exmatrix: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    dtype: np.dtype,
+    condensed: bool,
+    block_size: int,
+) -> np.ndarray:
+    """
+    correlation matrix of the product terms, computed over pairs of term blocks
+    """
+    ext = np.hstack([exmatrix, np.ones((len(exmatrix), 1))]).astype(dtype, copy=False)
+
+    def _standardized(start: int) -> np.ndarray:
+        cols = ext[:, left[start:start + block_size]] * ext[:, right[start:start + block_size]]
+        cols -= cols.mean(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            standardized: np.ndarray = cols / np.sqrt((cols * cols).sum(axis=0))
+        return standardized
+
+    n_term = len(left)
+    res = np.empty(n_term * (n_term - 1) // 2 if condensed else (n_term, n_term), dtype)
+    starts = range(0, n_term, block_size)
+    for r0 in starts:
+        z_row = _standardized(r0)
+        for c0 in starts[r0 // block_size:]:
+            z_col = z_row if c0 == r0 else _standardized(c0)
+            blk = np.clip(z_row.T @ z_col, -1, 1)
+            if not condensed:
+                res[r0:r0 + blk.shape[0], c0:c0 + blk.shape[1]] = blk
+                res[c0:c0 + blk.shape[1], r0:r0 + blk.shape[0]] = blk.T
+                continue
+            i, j = np.nonzero(np.arange(r0, r0 + blk.shape[0])[:, None]
+                              < np.arange(c0, c0 + blk.shape[1])[None, :])
+            row, col = i + r0, j + c0
+            res[row * (2 * n_term - row - 1) // 2 + col - row - 1] = blk[i, j]
+    return res
+
+
+def get_int_dtype(low: int, high: int) -> np.dtype:
     """
-    # TODO: Check the if the definition is right
-    # TODO: Generalize max_dim
-    pass
-    if max_dim != 1:
-        raise NotImplementedError('Support only max_dim = 1')
+    Return the narrowest signed integer dtype which holds every value in [low, high]
+
+    Parameters
+    ----------
+    low: int
+        minimum value to be stored
+    high: int
+        maximum value to be stored
 
-    return np.corrcoef(exmatrix.T)
+    Returns
+    -------
+    dtype: numpy.dtype
+        one of int8, int16, int32 and int64
+
+    Notes
+    -----
+    This is the default dtype policy of the experiment matrices in tagupy.
+    Signed types are used even for non-negative level codes,
+    so that centering or negating a matrix never wraps around.
+    The dtype only bounds the stored values: sums and products such as X.T @ X
+    keep it and overflow silently, cast to float or int64 before computing them.
+
+    Example
+    -------
+    >>> from tagupy.utils import get_int_dtype
+    >>> get_int_dtype(-1, 1)
+    dtype('int8')
+    >>> get_int_dtype(0, 200)
+    dtype('int16')
+    """
+    for dtype in _INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    raise ValueError(f"Invalid input: no integer dtype holds [{low}, {high}]")
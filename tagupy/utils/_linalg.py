@@ -0,0 +1,189 @@
+"""
+Utility linear algebra shared by the alias matrix and the analyzers
+
+numpy has no triangular solver nor factorization updates, those are implemented here
+"""
+from typing import Tuple
+
+import numpy as np
+
+__all__ = []
+
+
+def _back_substitution(r: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    solve r @ x = b for an upper triangular r, row by row over all the right-hand sides
+    """
+    x = np.empty(b.shape, dtype=np.result_type(r, b, np.float64))
+    for i in range(len(r) - 1, -1, -1):
+        x[i] = (b[i] - r[i, i + 1:] @ x[i + 1:]) / r[i, i]
+    return x
+
+
+def _qr_add_row(r: np.ndarray, z: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    update in place the triangular factor r of X and z = Q'Y when the row (x, y) is appended
+
+    Parameters
+    ----------
+    r: numpy.ndarray
+        upper triangular factor (p x p), possibly rank deficient
+    z: numpy.ndarray
+        rotated responses Q'Y (p x m)
+    x: numpy.ndarray
+        new row of X (p)
+    y: numpy.ndarray
+        new row of Y (m)
+
+    Return
+    ------
+    e: numpy.ndarray
+        part of y out of the span of r (m), e^2 is the increase of the residual sum of squares
+
+    Note
+    ----
+    p Givens rotations zero x against the diagonal of r, in O(p (p + m)) operations
+    """
+    x, y = np.array(x, dtype=float), np.array(y, dtype=float)
+    for i in range(len(r)):
+        a, b = r[i, i], x[i]
+        if b == 0:
+            continue
+        h = np.hypot(a, b)
+        c, s = a / h, b / h
+        ri, zi = r[i, i:].copy(), z[i].copy()
+        r[i, i:] = c * ri + s * x[i:]
+        x[i:] = c * x[i:] - s * ri
+        z[i] = c * zi + s * y
+        y = c * y - s * zi
+    return y
+
+
+def _qr_delete_row(r: np.ndarray, z: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    downdate in place the triangular factor r of X and z = Q'Y when the row (x, y) is removed
+
+    Parameters are those of _qr_add_row
+
+    Return
+    ------
+    e: numpy.ndarray
+        (m) e^2 is the decrease of the residual sum of squares
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        if X without the row does not have full column rank
+
+    Note
+    ----
+    p hyperbolic rotations, applied in the mixed form which is stable in practice,
+    remove x from r^T r = X^T X, in O(p (p + m)) operations
+    """
+    x, y = np.array(x, dtype=float), np.array(y, dtype=float)
+    for i in range(len(r)):
+        a, b = r[i, i], x[i]
+        if b == 0:
+            continue
+        if abs(b) >= abs(a) * (1 - 1e-12):
+            raise np.linalg.LinAlgError(
+                "model matrix does not have full column rank after downdate")
+        t = b / a
+        c = 1 / np.sqrt((1 - t) * (1 + t))
+        s = c * t
+        r[i, i:] = c * r[i, i:] - s * x[i:]
+        x[i:] = (x[i:] - s * r[i, i:]) / c
+        z[i] = c * z[i] - s * y
+        y = (y - s * z[i]) / c
+    return y
+
+
+def _qr_add_column(
+    q: np.ndarray,
+    r: np.ndarray,
+    x: np.ndarray,
+    tol: float = 1e-10,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    thin QR factorization of [X x] from that of X = QR
+
+    Parameters
+    ----------
+    q: numpy.ndarray
+        orthonormal columns (n x k)
+    r: numpy.ndarray
+        upper triangular factor (k x k)
+    x: numpy.ndarray
+        new column (n), out of the span of q
+    tol: float
+        relative norm of the component of x orthogonal to q below which x is in the span of q
+
+    Return
+    ------
+    q, r: Tuple[numpy.ndarray, numpy.ndarray]
+        factors (n x k + 1) and (k + 1 x k + 1)
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        if x is numerically in the span of q, i.e. [X x] is rank deficient
+
+    Note
+    ----
+    classical Gram-Schmidt with one reorthogonalization, in O(n k) operations
+    """
+    w = q.T @ x
+    v = x - q @ w
+    w2 = q.T @ v
+    v, w = v - q @ w2, w + w2
+    rho = float(np.linalg.norm(v))
+    if rho <= tol * np.linalg.norm(x):
+        raise np.linalg.LinAlgError("new column expected out of the span of q")
+    k = len(r)
+    r_new = np.zeros((k + 1, k + 1))
+    r_new[:k, :k], r_new[:k, k], r_new[k, k] = r, w, rho
+    return np.column_stack([q, v / rho]), r_new
+
+
+def _qr_delete_column(
+    q: np.ndarray,
+    r: np.ndarray,
+    j: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    thin QR factorization of X without its column j from that of X = QR
+
+    Parameters
+    ----------
+    q: numpy.ndarray
+        orthonormal columns (n x k)
+    r: numpy.ndarray
+        upper triangular factor (k x k)
+    j: int
+        index of the column to delete
+
+    Return
+    ------
+    q, r, dropped: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        factors (n x k - 1) and (k - 1 x k - 1),
+        and the unit vector (n) of the span of the old q orthogonal to the new q
+
+    Note
+    ----
+    k - 1 - j Givens rotations restore the triangular form of r without the column,
+    in O(k (n + k)) operations
+    """
+    q, r = q.copy(), np.delete(r, j, axis=1)
+    for i in range(j, len(r) - 1):
+        a, b = r[i, i], r[i + 1, i]
+        h = np.hypot(a, b)
+        if h == 0:
+            continue
+        c, s = a / h, b / h
+        ri = r[i, i:].copy()
+        r[i, i:] = c * ri + s * r[i + 1, i:]
+        r[i + 1, i:] = c * r[i + 1, i:] - s * ri
+        qi = q[:, i].copy()
+        q[:, i] = c * qi + s * q[:, i + 1]
+        q[:, i + 1] = c * q[:, i + 1] - s * qi
+    return q[:, :-1], r[:-1], q[:, -1]
@@ -0,0 +1,243 @@
+"""
+Utility design metrics
+"""
+from typing import NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = [
+    "DesignMetrics",
+    "get_design_metrics",
+    "get_prediction_variance",
+    "get_vif",
+]
+
+_RCOND = 1e-10
+
+
+class DesignMetrics(NamedTuple):
+    """
+    Efficiency and prediction variance of designs
+
+    Attributes
+    ----------
+    d_efficiency: Union[float, numpy.ndarray]
+        100 * det(X'X)^(1/p) / n
+    a_efficiency: Union[float, numpy.ndarray]
+        100 * p / (n * trace((X'X)^-1))
+    g_efficiency: Union[float, numpy.ndarray]
+        100 * p / (n * max_variance)
+    i_efficiency: Union[float, numpy.ndarray]
+        100 * p / (n * average prediction variance over the region), nan without region
+    max_variance: Union[float, numpy.ndarray]
+        maximum of the scaled prediction variance x'(X'X)^-1 x over the design points
+    mean_variance: Union[float, numpy.ndarray]
+        average of the scaled prediction variance over the region, nan without region
+
+    Notes
+    -----
+    n and p are the number of runs and of model terms.
+    Every efficiency is 100 for an orthogonal design with X'X = nI,
+    and 0 for a design whose X'X is singular.
+    """
+    d_efficiency: Union[float, np.ndarray]
+    a_efficiency: Union[float, np.ndarray]
+    g_efficiency: Union[float, np.ndarray]
+    i_efficiency: Union[float, np.ndarray]
+    max_variance: Union[float, np.ndarray]
+    mean_variance: Union[float, np.ndarray]
+
+
+def get_design_metrics(
+    model_matrix: npt.ArrayLike,
+    region: Optional[npt.ArrayLike] = None,
+) -> DesignMetrics:
+    """
+    Return D-, A-, G- and I-efficiency and prediction variance summaries
+
+    Parameters
+    ----------
+    model_matrix: numpy.typing.ArrayLike
+        Model Matrix X (n_run x n_term) of a design,
+        or a stack of candidate designs (batch x n_run x n_term)
+    region: Optional[numpy.typing.ArrayLike]
+        Model Matrix of the points (n_point x n_term) the prediction variance
+        is averaged over for I-efficiency, e.g. a grid of the design region
+
+    Returns
+    -------
+    metrics: DesignMetrics
+        float fields for a design, (batch) arrays for a stack of designs
+
+    Notes
+    -----
+    X'X of every design is decomposed at once by numpy.linalg.eigh,
+    so that a batch of designs is scored without a Python loop,
+    and singular designs get zero efficiencies instead of raising.
+    I-efficiency uses the moment matrix M = R'R / n_point of the region R,
+    as the average prediction variance is trace(M (X'X)^-1).
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.design.generator import PlackettBurman
+    >>> from tagupy.utils import get_design_metrics
+    >>> exmatrix = PlackettBurman(n_rep=1).get_exmatrix(n_factor=3)
+    >>> x = np.hstack([np.ones((4, 1)), exmatrix])
+    >>> metrics = get_design_metrics(x)
+    >>> float(metrics.d_efficiency), float(metrics.g_efficiency)
+    (100.0, 100.0)
+    >>> batch = np.stack([x, x[[0, 0, 1, 2]]])
+    >>> get_design_metrics(batch).d_efficiency
+    array([100.,   0.])
+    """
+    x = _as_batch(model_matrix)
+    n_run, n_term = x.shape[-2:]
+    singular, w, inv = _inverse_gram(np.swapaxes(x, -2, -1) @ x)
+
+    with np.errstate(divide="ignore"):
+        d_eff = 100 * np.exp(np.log(w).sum(axis=-1) / n_term) / n_run
+        a_eff = 100 * n_term / (n_run * np.trace(inv, axis1=-2, axis2=-1))
+        max_var = _scaled_variance(x, inv).max(axis=-1)
+        g_eff = 100 * n_term / (n_run * max_var)
+        if region is None:
+            mean_var = np.full(len(x), np.nan)
+        else:
+            region = np.asarray(region, dtype=float)
+            assert region.ndim == 2 and region.shape[1] == n_term, \
+                f"Invalid input: region expected (n_point x {n_term}) array, got {region.shape}"
+            moment = region.T @ region / len(region)
+            mean_var = (moment * inv).sum(axis=(-2, -1))
+        i_eff = 100 * n_term / (n_run * mean_var)
+
+    d_eff, a_eff, g_eff = (np.where(singular, 0., el) for el in (d_eff, a_eff, g_eff))
+    max_var = np.where(singular, np.inf, max_var)
+    i_eff = np.where(singular & ~np.isnan(mean_var), 0., i_eff)
+    mean_var = np.where(singular & ~np.isnan(mean_var), np.inf, mean_var)
+    return DesignMetrics(*(_unbatch(el, model_matrix) for el in (
+        d_eff, a_eff, g_eff, i_eff, max_var, mean_var)))
+
+
+def get_prediction_variance(
+    model_matrix: npt.ArrayLike,
+    points: Optional[npt.ArrayLike] = None,
+) -> np.ndarray:
+    """
+    Return the scaled prediction variance x'(X'X)^-1 x
+
+    Parameters
+    ----------
+    model_matrix: numpy.typing.ArrayLike
+        Model Matrix X (n_run x n_term) or a stack of them (batch x n_run x n_term)
+    points: Optional[numpy.typing.ArrayLike]
+        Model Matrix of the points (n_point x n_term) to evaluate,
+        the design points by default
+
+    Returns
+    -------
+    variance: numpy.ndarray
+        (n_point) or (batch x n_point) scaled prediction variance, inf for singular designs
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.utils import get_prediction_variance
+    >>> x = np.array([[1, -1], [1, 1], [1, 1]])
+    >>> get_prediction_variance(x)
+    array([1. , 0.5, 0.5])
+    """
+    x = _as_batch(model_matrix)
+    singular, _, inv = _inverse_gram(np.swapaxes(x, -2, -1) @ x)
+    if points is None:
+        var = _scaled_variance(x, inv)
+    else:
+        points = np.asarray(points, dtype=float)
+        assert points.ndim == 2 and points.shape[1] == x.shape[-1], \
+            f"Invalid input: points expected (n_point x {x.shape[-1]}) array, got {points.shape}"
+        var = _scaled_variance(np.broadcast_to(points, (len(x),) + points.shape), inv)
+    var = np.where(singular[:, None], np.inf, var)
+    return var if np.ndim(model_matrix) == 3 else var[0]
+
+
+def get_vif(exmatrix: npt.ArrayLike) -> np.ndarray:
+    """
+    Return Variance Inflation Factors
+
+    Parameters
+    ----------
+    exmatrix: numpy.typing.ArrayLike
+        Matrix of the model terms without the intercept (n_run x n_term),
+        or a stack of them (batch x n_run x n_term)
+
+    Returns
+    -------
+    vif: numpy.ndarray
+        (n_term) or (batch x n_term) VIF_j = 1 / (1 - R_j^2),
+        R_j^2 being the coefficient of determination of the term j on the other terms,
+        inf for terms in an exact linear dependency and nan for constant terms
+
+    Notes
+    -----
+    VIF is the diagonal of the inverse of the correlation matrix of the terms.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.utils import get_vif
+    >>> get_vif(np.array([[-1, -1], [1, -1], [-1, 1], [1, 1]]))
+    array([1., 1.])
+    >>> get_vif(np.array([[-1, -1], [1, -1], [1, 1], [1, 1]]))
+    array([1.5, 1.5])
+    """
+    x = _as_batch(exmatrix)
+    x = x - x.mean(axis=-2, keepdims=True)
+    gram = np.swapaxes(x, -2, -1) @ x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = 1 / np.sqrt(np.diagonal(gram, axis1=-2, axis2=-1))
+        corr = np.nan_to_num(gram * scale[..., :, None] * scale[..., None, :])
+    const = ~np.isfinite(scale)
+    diag = np.arange(x.shape[-1])
+    corr[..., diag, diag] = np.where(const, 1., corr[..., diag, diag])
+    singular, _, inv = _inverse_gram(corr)
+    vif: np.ndarray = np.diagonal(inv, axis1=-2, axis2=-1).copy()
+    vif[singular] = np.inf
+    vif[const] = np.nan
+    return vif if np.ndim(exmatrix) == 3 else vif[0]
+
+
+def _as_batch(matrix: npt.ArrayLike) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=float)
+    assert matrix.ndim in (2, 3), \
+        f"Invalid input: model matrix expected 2-d or 3-d array, got {matrix.ndim}-d array"
+    return matrix if matrix.ndim == 3 else matrix[None]
+
+
+def _unbatch(value: np.ndarray, original: npt.ArrayLike) -> Union[float, np.ndarray]:
+    return value if np.ndim(original) == 3 else float(value[0])
+
+
+def _inverse_gram(gram: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    eigen-decompose the batch of symmetric matrices and invert the non-singular ones
+
+    Returns
+    -------
+    singular: numpy.ndarray
+        (batch) bool, whether the smallest eigenvalue is negligible
+    w: numpy.ndarray
+        (batch x p) eigenvalues, those of singular matrices replaced by 1
+    inv: numpy.ndarray
+        (batch x p x p) inverse, identity for singular matrices
+    """
+    w, v = np.linalg.eigh(gram)
+    singular = w[..., 0] <= _RCOND * np.maximum(w[..., -1], _RCOND)
+    w = np.where(singular[..., None], 1., w)
+    v = np.where(singular[..., None, None], np.eye(w.shape[-1]), v)
+    inv = (v / w[..., None, :]) @ np.swapaxes(v, -2, -1)
+    return singular, w, inv
+
+
+def _scaled_variance(points: np.ndarray, inv: np.ndarray) -> np.ndarray:
+    variance: np.ndarray = np.einsum("bij,bjk,bik->bi", points, inv, points)
+    return variance
@@ -0,0 +1,231 @@
+"""
+Utility model matrix
+"""
+from itertools import combinations
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from ._cache import LRUCache, _design_digest
+
+__all__ = [
+    "ModelMatrix",
+    "model_column_cache",
+]
+
+model_column_cache = LRUCache(maxsize=4096)
+
+Term = Tuple[int, ...]
+
+_SPECS = ("linear", "interaction", "quadratic")
+
+
+class ModelMatrix:
+    """
+    Model Matrix of an Experiment Matrix, whose term columns are computed on demand
+
+    Attributes
+    ----------
+    exmatrix: numpy.ndarray
+        read-only Experiment Matrix (n_experiment x n_factor)
+    terms: Tuple[Tuple[int, ...], ...]
+        model terms as tuples of factor indices,
+        () is the intercept, (i,) the main effect, (i, j) the interaction
+        and (i, i) the quadratic term of the factors
+    labels: List[str]
+        names of the terms, e.g. "1", "x0", "x0*x1", "x0^2"
+    shape: Tuple[int, int]
+        shape of the model matrix (n_experiment, n_term)
+
+    Notes
+    -----
+    A term column is computed the first time it is accessed,
+    as the product of the cached column of its leading factors and its last factor,
+    and kept in model_column_cache keyed by the digest of exmatrix.
+    The cache is bounded (least recently used columns are evicted)
+    and shared by every ModelMatrix of the same design,
+    so that correlation maps, alias matrices and analyses reuse the same products.
+
+    terms is given either explicitly or by one of the specifications:
+    "linear": intercept and main effects
+    "interaction": "linear" and two-factor interactions
+    "quadratic": "interaction" and quadratic terms of the factors with more than two levels
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from tagupy.utils import ModelMatrix
+    >>> mm = ModelMatrix(np.array([[-1, 0], [1, 1], [0, -1]]), terms="quadratic")
+    >>> mm.labels
+    ['1', 'x0', 'x1', 'x0*x1', 'x0^2', 'x1^2']
+    >>> mm.column((0, 0))
+    array([1., 1., 0.])
+    >>> mm[:, [1, 4]]
+    array([[-1.,  1.],
+           [ 1.,  1.],
+           [ 0.,  0.]])
+    """
+
+    def __init__(
+        self,
+        exmatrix: npt.ArrayLike,
+        terms: Union[str, Iterable[Iterable[int]]] = "linear",
+        cache: LRUCache = model_column_cache,
+    ):
+        """
+        Parameters
+        ----------
+        exmatrix: numpy.typing.ArrayLike
+            Experiment Matrix (n_experiment x n_factor), e.g. the output of get_exmatrix
+        terms: Union[str, Iterable[Iterable[int]]]
+            "linear", "interaction", "quadratic" or an explicit list of terms
+        cache: LRUCache
+            store of the term columns, model_column_cache by default
+        """
+        exmatrix = np.array(exmatrix)
+        assert exmatrix.ndim == 2, \
+            f"Invalid input: exmatrix expected 2-d array, got {exmatrix.ndim}-d array"
+        exmatrix.flags.writeable = False
+        self.exmatrix = exmatrix
+        self.terms = _expand_terms(exmatrix, terms)
+        self._index = {term: i for i, term in enumerate(self.terms)}
+        self._cache = cache
+        self._digest = _design_digest(exmatrix)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (len(self.exmatrix), len(self.terms))
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def labels(self) -> List[str]:
+        return [_label(term) for term in self.terms]
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return f"ModelMatrix(shape={self.shape}, terms={self.terms})"
+
+    def __array__(self, dtype: Optional[Any] = None, copy: Optional[bool] = None) -> np.ndarray:
+        res = self.toarray()
+        return res if dtype is None else res.astype(dtype, copy=False)
+
+    def __getitem__(self, key: Tuple[slice, Union[int, slice, List[int]]]) -> np.ndarray:
+        row, col = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(col, (int, np.integer)):
+            return self.column(self.terms[col])[row]
+        idx = range(len(self.terms))[col] if isinstance(col, slice) else col
+        return self.columns([self.terms[i] for i in idx])[row]
+
+    def index(self, term: Iterable[int]) -> int:
+        """
+        Return the column index of term
+        """
+        return self._index[_normalize(term)]
+
+    def column(self, term: Iterable[int]) -> np.ndarray:
+        """
+        Return the column of term, computing and caching it on the first access
+
+        Parameters
+        ----------
+        term: Iterable[int]
+            factor indices of the term, it does not need to be in terms
+
+        Return
+        ------
+        column: numpy.ndarray
+            read-only float column (n_experiment)
+        """
+        term = _normalize(term)
+        assert all(0 <= i < self.exmatrix.shape[1] for i in term), \
+            f"Invalid input: term expected factor indices < {self.exmatrix.shape[1]}, got {term}"
+        col: np.ndarray = self._cache.get((self._digest, term), lambda: self._compute(term))
+        return col
+
+    def columns(self, terms: Iterable[Iterable[int]]) -> np.ndarray:
+        """
+        Return the stacked columns of terms (n_experiment x len(terms))
+        """
+        terms = list(terms)
+        if not terms:
+            return np.empty((len(self.exmatrix), 0))
+        return np.stack([self.column(term) for term in terms], axis=1)
+
+    def iter_blocks(self, block_size: int = 256) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Iterate over the model matrix by blocks of columns
+
+        Parameters
+        ----------
+        block_size: int
+            number of terms in a block
+
+        Return
+        ------
+        blocks: Iterator[Tuple[int, numpy.ndarray]]
+            index of the first term and columns (n_experiment x block_size) of each block
+        """
+        for start in range(0, len(self.terms), block_size):
+            yield start, self.columns(self.terms[start:start + block_size])
+
+    def toarray(self) -> np.ndarray:
+        """
+        Materialize the model matrix
+
+        Return
+        ------
+        model_matrix: numpy.ndarray
+            writable float matrix (n_experiment x n_term)
+        """
+        return self.columns(self.terms)
+
+    def _compute(self, term: Term) -> np.ndarray:
+        col: np.ndarray
+        if term:
+            col = self.column(term[:-1]) * self.exmatrix[:, term[-1]]
+        else:
+            col = np.ones(len(self.exmatrix))
+        col.flags.writeable = False
+        return col
+
+
+def _normalize(term: Iterable[int]) -> Term:
+    return tuple(sorted(int(i) for i in term))
+
+
+def _label(term: Term) -> str:
+    if not term:
+        return "1"
+    names = []
+    for i in sorted(set(term)):
+        power = term.count(i)
+        names.append(f"x{i}" if power == 1 else f"x{i}^{power}")
+    return "*".join(names)
+
+
+def _expand_terms(
+    exmatrix: np.ndarray,
+    terms: Union[str, Iterable[Iterable[int]]],
+) -> Tuple[Term, ...]:
+    """
+    list the terms of a specification, or normalize the explicit ones
+    """
+    if not isinstance(terms, str):
+        return tuple(_normalize(term) for term in terms)
+    assert terms in _SPECS, \
+        f"Invalid input: terms expected one of {_SPECS} or list of terms, " \
+        f"got {type(terms)}::{terms}"
+    n_factor = exmatrix.shape[1]
+    res: List[Term] = [()]
+    res += [(i,) for i in range(n_factor)]
+    if terms != "linear":
+        res += combinations(range(n_factor), 2)
+    if terms == "quadratic":
+        res += [(i, i) for i in range(n_factor) if len(np.unique(exmatrix[:, i])) > 2]
+    return tuple(res)
@@ -0,0 +1,180 @@
+"""
+Utility special functions for the statistical tests of the analyzers
+
+- distribution functions are implemented on numpy only (no scipy dependency)
+- every function is vectorized over its array arguments
+"""
+from math import lgamma
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = []
+
+_MAXIT = 300
+_EPS = 1e-15
+_TINY = 1e-300
+
+_lgamma = np.vectorize(lgamma, otypes=[float])
+
+
+def _betacf(a: np.ndarray, b: np.ndarray, x: np.ndarray) -> np.ndarray:
+    '''
+    continued fraction of the incomplete beta function (modified Lentz's method)
+    '''
+    qab, qap, qam = a + b, a + 1, a - 1
+    c = np.ones_like(x)
+    d = 1 - qab * x / qap
+    d = 1 / np.where(np.abs(d) < _TINY, _TINY, d)
+    h: np.ndarray = d.copy()
+    for m in range(1, _MAXIT + 1):
+        m2 = 2 * m
+        for aa in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                   -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+            d = 1 + aa * d
+            d = 1 / np.where(np.abs(d) < _TINY, _TINY, d)
+            c = 1 + aa / c
+            c = np.where(np.abs(c) < _TINY, _TINY, c)
+            delta = d * c
+            h *= delta
+        if (np.abs(delta - 1) < _EPS).all():
+            break
+    return h
+
+
+def _betainc(a: npt.ArrayLike, b: npt.ArrayLike, x: npt.ArrayLike) -> np.ndarray:
+    '''
+    regularized incomplete beta function I_x(a, b)
+
+    Parameters
+    ----------
+    a, b: numpy.typing.ArrayLike
+        positive shape parameters
+    x: numpy.typing.ArrayLike
+        values in [0, 1]
+
+    Returns
+    -------
+    value: numpy.ndarray
+        I_x(a, b) broadcast over the arguments, nan where x is nan
+    '''
+    a, b, x = np.broadcast_arrays(*(np.asarray(el, dtype=float) for el in (a, b, x)))
+    inner = (x > 0) & (x < 1)
+    xi = np.where(inner, x, 0.5)
+    with np.errstate(divide="ignore"):
+        log_bt = _lgamma(a + b) - _lgamma(a) - _lgamma(b) + a * np.log(xi) + b * np.log1p(-xi)
+    bt = np.exp(log_bt)
+    # the continued fraction converges for x < (a + 1) / (a + b + 2), otherwise use the symmetry
+    swap = xi >= (a + 1) / (a + b + 2)
+    aa, bb, xx = np.where(swap, b, a), np.where(swap, a, b), np.where(swap, 1 - xi, xi)
+    frac = bt * _betacf(aa, bb, xx) / aa
+    res = np.where(swap, 1 - frac, frac)
+    res = np.where(x <= 0, 0., np.where(x >= 1, 1., res))
+    return np.where(np.isnan(x), np.nan, res)
+
+
+def _f_sf(f: npt.ArrayLike, dfn: npt.ArrayLike, dfd: npt.ArrayLike) -> np.ndarray:
+    '''
+    survival function (upper tail probability) of the F distribution
+    '''
+    f = np.asarray(f, dtype=float)
+    with np.errstate(invalid="ignore", over="ignore"):
+        x = np.where(np.isinf(f), 0., dfd / (dfd + dfn * np.maximum(f, 0)))
+    return _betainc(np.asarray(dfd, dtype=float) / 2, np.asarray(dfn, dtype=float) / 2, x)
+
+
+def _t_sf2(t: npt.ArrayLike, df: npt.ArrayLike) -> np.ndarray:
+    '''
+    two-sided p-value P(|T| > |t|) of the Student t distribution
+    '''
+    t = np.asarray(t, dtype=float)
+    with np.errstate(invalid="ignore", over="ignore"):
+        x = np.where(np.isinf(t), 0., df / (df + t * t))
+    return _betainc(np.asarray(df, dtype=float) / 2, 0.5, x)
+
+
+def _t_isf2(p: npt.ArrayLike, df: npt.ArrayLike) -> np.ndarray:
+    '''
+    positive t with two-sided p-value p, i.e. the 1 - p / 2 quantile of the Student t distribution
+
+    Note
+    ----
+    I_x(df / 2, 1 / 2) = p is solved for x = df / (df + t^2) by bisection,
+    which is monotone and converges to the float precision in a fixed number of steps
+    '''
+    p, df = np.broadcast_arrays(np.asarray(p, dtype=float), np.asarray(df, dtype=float))
+    low, high = np.zeros(p.shape), np.ones(p.shape)
+    for _ in range(100):
+        mid = (low + high) / 2
+        below = _betainc(df / 2, 0.5, mid) < p
+        low, high = np.where(below, mid, low), np.where(below, high, mid)
+    x = (low + high) / 2
+    with np.errstate(divide="ignore"):
+        return np.sqrt(df * (1 - x) / x)
+
+
+def _norm_cdf(z: npt.ArrayLike) -> np.ndarray:
+    '''
+    cumulative distribution function of the standard normal distribution
+    '''
+    z = np.asarray(z, dtype=float)
+    # P(|Z| > |z|) = P(Z^2 > z^2) = Q(1 / 2, z^2 / 2)
+    tail = _gammaincc_half(z * z / 2) / 2
+    return np.where(z < 0, tail, 1 - tail)
+
+
+def _gammaincc_half(x: np.ndarray) -> np.ndarray:
+    '''
+    regularized upper incomplete gamma function Q(1 / 2, x) = erfc(sqrt(x))
+    '''
+    x = np.asarray(x, dtype=float)
+    # erfc by the continued fraction for large x and the series of erf for small x
+    small = x < 1.5
+    xs = np.where(small, x, 1.)
+    term = np.sqrt(xs)
+    total = term.copy()
+    for n in range(1, 60):
+        term = term * -xs / n
+        total = total + term / (2 * n + 1)
+    erf_small = 2 / np.sqrt(np.pi) * total
+    xl = np.where(small, 2., x)
+    z = np.sqrt(xl)
+    frac = np.zeros_like(z)
+    for n in range(60, 0, -1):
+        frac = n / 2 / (z + frac)
+    erfc_large = np.exp(-xl) / np.sqrt(np.pi) / (z + frac)
+    erfc: np.ndarray = np.where(small, 1 - erf_small, erfc_large)
+    return erfc
+
+
+def _norm_ppf(q: npt.ArrayLike) -> np.ndarray:
+    '''
+    quantile function of the standard normal distribution
+
+    Note
+    ----
+    rational approximation of P. J. Acklam (relative error < 1.2e-9),
+    refined by one step of Halley's method
+    '''
+    q = np.asarray(q, dtype=float)
+    a = [-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+         1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00]
+    b = [-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+         6.680131188771972e+01, -1.328068155288572e+01]
+    c = [-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+         -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00]
+    d = [7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+         3.754408661907416e+00]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        qs = np.minimum(q, 1 - q)
+        r = np.sqrt(-2 * np.log(qs))
+        tail = np.polyval(c, r) / np.polyval(d + [1.], r)
+        u = q - 0.5
+        s = u * u
+        center = u * np.polyval(a, s) / np.polyval(b + [1.], s)
+        z = np.where(qs < 0.02425, np.where(q < 0.5, tail, -tail), center)
+        err = _norm_cdf(z) - q
+        step = err * np.sqrt(2 * np.pi) * np.exp(z * z / 2)
+        z = z - step / (1 + z * step / 2)
+    z = np.where(q == 0, -np.inf, np.where(q == 1, np.inf, z))
+    return np.where((q < 0) | (q > 1) | np.isnan(q), np.nan, z)
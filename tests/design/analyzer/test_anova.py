@@ -0,0 +1,137 @@
+"""
+Test for Multi-response Regression and ANOVA Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer import Anova, AnovaResult
+from tagupy.design.generator import FullFact, PlackettBurman
+from tagupy.utils import ModelMatrix
+from tagupy.utils._special import _f_sf, _t_sf2
+
+
+@pytest.fixture
+def result_block():
+    return np.random.default_rng(0).normal(size=(96, 50))
+
+
+def test_analyze_invalid_input():
+    model = Anova()
+    for exmatrix, result in [(np.ones(4), np.ones(4)), (np.ones((4, 2)), np.ones((3, 1)))]:
+        with pytest.raises(AssertionError):
+            model.analyze(exmatrix, result)
+    with pytest.raises(AssertionError):
+        Anova(terms="cubic").analyze(np.ones((4, 2)), np.ones(4))
+
+
+def test_analyze_output(result_block):
+    exmatrix = FullFact(n_rep=2).get_exmatrix(levels=[2, 3, 2])
+    result = result_block[:len(exmatrix)]
+    ret = Anova(terms="interaction").analyze(exmatrix, result)
+    x = ModelMatrix(exmatrix, terms="interaction").toarray()
+    n_run, n_term = x.shape
+    assert isinstance(ret, AnovaResult), \
+        f"output expected AnovaResult, got {type(ret)}"
+    assert ret.labels == ModelMatrix(exmatrix, terms="interaction").labels, \
+        f"labels expected to be those of ModelMatrix, got {ret.labels}"
+
+    coef = np.linalg.lstsq(x, result, rcond=None)[0]
+    assert ret.coef.shape == (n_term, result.shape[1]) and np.allclose(ret.coef, coef), \
+        f"coef expected {coef}, got {ret.coef}"
+    resid = result - x @ coef
+    ss_error = (resid ** 2).sum(axis=0)
+    ss_total = ((result - result.mean(axis=0)) ** 2).sum(axis=0)
+    df_error = n_run - n_term
+    ms_error = ss_error / df_error
+    std_err = np.sqrt(np.diag(np.linalg.inv(x.T @ x))[:, None] * ms_error)
+    assert (ret.df_model, ret.df_error) == (n_term - 1, df_error), \
+        f"degrees of freedom expected {(n_term - 1, df_error)}, got {(ret.df_model, ret.df_error)}"
+    assert np.allclose(ret.ss_error, ss_error) and np.allclose(ret.ss_model, ss_total - ss_error), \
+        "sums of squares expected to match the residuals"
+    assert np.allclose(ret.std_err, std_err) and np.allclose(ret.t_value, coef / std_err), \
+        "standard errors expected sqrt(diag((X'X)^-1) * ms_error)"
+    assert np.allclose(ret.p_value, _t_sf2(coef / std_err, df_error)), \
+        "p_value expected to be the two-sided t test"
+    assert np.allclose(ret.ss_term / ms_error, ret.t_value ** 2), \
+        "F statistics of the terms expected to equal t_value^2"
+    f_value = (ss_total - ss_error) / (n_term - 1) / ms_error
+    assert np.allclose(ret.f_value, f_value) and \
+        np.allclose(ret.f_p_value, _f_sf(f_value, n_term - 1, df_error)), \
+        f"f_value expected {f_value}, got {ret.f_value}"
+    assert np.allclose(ret.r2, 1 - ss_error / ss_total), \
+        f"r2 expected {1 - ss_error / ss_total}, got {ret.r2}"
+
+
+def test_analyze_single_response(result_block):
+    exmatrix = PlackettBurman(n_rep=1).get_exmatrix(n_factor=7)
+    block = Anova().analyze(exmatrix, result_block[:8, :3])
+    for i in range(3):
+        ret = Anova().analyze(exmatrix, result_block[:8, i])
+        assert np.allclose(ret.coef[:, 0], block.coef[:, i]), \
+            "responses expected to be analyzed independently"
+
+
+def test_analyze_saturated(result_block):
+    exmatrix = PlackettBurman(n_rep=1).get_exmatrix(n_factor=7)
+    ret = Anova().analyze(exmatrix, result_block[:8])
+    assert ret.df_error == 0 and np.isnan(ret.p_value).all() and np.isnan(ret.f_value).all(), \
+        "statistics needing the residual variance expected to be nan when df_error = 0"
+    assert np.allclose(ret.ss_error, 0) and np.allclose(ret.r2, 1), \
+        "saturated model expected to fit exactly"
+
+
+def test_analyze_without_intercept(result_block):
+    exmatrix = FullFact(n_rep=2).get_exmatrix(levels=[2, 2])
+    result = result_block[:len(exmatrix)]
+    ret = Anova(terms=[(0,), (1,)]).analyze(exmatrix, result)
+    ss_total = (result ** 2).sum(axis=0)
+    assert ret.df_model == 2 and np.allclose(ret.ss_model, ss_total - ret.ss_error), \
+        "model without intercept expected uncentered sums of squares"
+
+
+def test_analyze_singular():
+    exmatrix = np.array([[0, 0], [1, 1], [0, 0], [1, 1]])
+    with pytest.raises(np.linalg.LinAlgError):
+        Anova().analyze(exmatrix, np.arange(4.))
+
+
+def test_analyze_collapse(result_block):
+    exmatrix = FullFact(n_rep=4).get_exmatrix(levels=[3, 2])
+    result = result_block[:len(exmatrix)]
+    full = Anova(terms="linear").analyze(exmatrix, result)
+    ret = Anova(terms="linear", collapse=True).analyze(exmatrix, result)
+    for name in ["coef", "std_err", "p_value", "ss_term", "ss_model", "ss_error",
+                 "f_value", "f_p_value", "r2"]:
+        assert np.allclose(getattr(ret, name), getattr(full, name)), \
+            f"{name} expected to be the same as without collapse"
+    assert (ret.df_model, ret.df_error) == (full.df_model, full.df_error), \
+        "degrees of freedom expected to be the same as without collapse"
+    assert full.ss_pure_error is None, \
+        "pure error expected None without collapse"
+
+    means = result.reshape(4, 6, -1).mean(axis=0)
+    ss_pure_error = ((result.reshape(4, 6, -1) - means) ** 2).sum(axis=(0, 1))
+    assert (ret.df_pure_error, ret.df_lack_of_fit) == (18, 3), \
+        f"degrees of freedom expected (18, 3), got {(ret.df_pure_error, ret.df_lack_of_fit)}"
+    assert np.allclose(ret.ss_pure_error, ss_pure_error) and \
+        np.allclose(ret.ss_lack_of_fit, ret.ss_error - ss_pure_error), \
+        "residuals expected to split into pure error and lack of fit"
+    lof_f_value = (ret.ss_lack_of_fit / 3) / (ss_pure_error / 18)
+    assert np.allclose(ret.lof_f_value, lof_f_value) and \
+        np.allclose(ret.lof_p_value, _f_sf(lof_f_value, 3, 18)), \
+        f"lof_f_value expected {lof_f_value}, got {ret.lof_f_value}"
+
+    design = FullFact(n_rep=4).get_exmatrix(levels=[3, 2], lazy=True)
+    lazy = Anova(terms="linear", collapse=True).analyze(design, result)
+    assert np.allclose(lazy.coef, ret.coef) and np.allclose(lazy.ss_pure_error, ss_pure_error), \
+        "ReplicatedDesign expected to give the same analysis"
+
+
+def test_analyze_collapse_without_replicates(result_block):
+    exmatrix = PlackettBurman(n_rep=1).get_exmatrix(n_factor=3)
+    ret = Anova(collapse=True).analyze(exmatrix, result_block[:4])
+    assert ret.df_pure_error == 0 and np.isnan(ret.lof_p_value).all(), \
+        "lack-of-fit test expected nan without replicates"
+    with pytest.raises(AssertionError):
+        Anova(collapse=1)
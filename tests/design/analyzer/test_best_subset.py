@@ -0,0 +1,83 @@
+"""
+Test for Best-subset Regression Module
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer import BestSubset, BestSubsetResult
+from tagupy.design.generator import DSD, PlackettBurman
+from tagupy.utils import ModelMatrix
+
+
+def _exhaustive(exmatrix, result, terms, max_size, n_best):
+    model = ModelMatrix(exmatrix, terms=terms)
+    candidates = [term for term in model.terms if term]
+    res = {}
+    for size in range(1, max_size + 1):
+        rss = []
+        for subset in combinations(candidates, size):
+            x = model.columns([()] + list(subset))
+            coef = np.linalg.lstsq(x, result, rcond=None)[0]
+            rss.append(((result - x @ coef) ** 2).sum())
+        res[size] = np.sort(rss)[:n_best]
+    return res
+
+
+@pytest.fixture
+def data():
+    exmatrix = DSD(n_rep=1).get_exmatrix(n_factor=5, n_fake=3)
+    noise = np.random.default_rng(0).normal(size=len(exmatrix))
+    result = 3 * exmatrix[:, 0] - 2 * exmatrix[:, 3] + 2 * exmatrix[:, 0] * exmatrix[:, 3] + noise
+    return exmatrix, result
+
+
+def test_init_invalid_input():
+    for kwargs in [dict(max_size=0), dict(n_best=1.5), dict(n_jobs=0)]:
+        with pytest.raises(AssertionError):
+            BestSubset(**kwargs)
+    with pytest.raises(AssertionError):
+        BestSubset().analyze(np.ones((4, 2)), np.ones((4, 2)))
+
+
+def test_analyze(data):
+    exmatrix, result = data
+    ret = BestSubset(terms="interaction", max_size=4, n_best=3).analyze(exmatrix, result)
+    assert isinstance(ret, BestSubsetResult), \
+        f"output expected BestSubsetResult, got {type(ret)}"
+    exp = _exhaustive(exmatrix, result, "interaction", 4, 3)
+    for size in range(1, 5):
+        found = ret.ss_error[ret.sizes == size]
+        assert np.allclose(found, exp[size]), \
+            f"best models of size {size} expected {exp[size]}, got {found}"
+    for terms, labels, ss_error in zip(ret.terms, ret.labels, ret.ss_error):
+        x = ModelMatrix(exmatrix, terms=terms).toarray()
+        coef = np.linalg.lstsq(x, result, rcond=None)[0]
+        assert np.isclose(((result - x @ coef) ** 2).sum(), ss_error), \
+            f"ss_error of {labels} expected to be its residual sum of squares"
+    assert ret.terms[ret.sizes.tolist().index(3)] == [(), (0,), (3,), (0, 3)], \
+        f"best model of size 3 expected the active terms, got {ret.labels}"
+    n_subset = sum(len(list(combinations(range(15), k))) for k in range(1, 4))
+    assert ret.n_node < n_subset, \
+        f"search expected to be pruned below {n_subset} nodes, got {ret.n_node}"
+
+
+def test_analyze_saturated():
+    exmatrix = PlackettBurman(n_rep=1).get_exmatrix(n_factor=7)
+    result = np.random.default_rng(1).normal(size=8)
+    ret = BestSubset(terms="linear", max_size=10).analyze(exmatrix, result)
+    assert ret.sizes.max() == 6, \
+        f"model size expected to be capped by n_experiment - 2, got {ret.sizes.max()}"
+    exp = _exhaustive(exmatrix, result, "linear", 6, 1)
+    assert np.allclose(ret.ss_error, [exp[size][0] for size in range(1, 7)]), \
+        f"best models expected {exp}, got {ret.ss_error}"
+
+
+def test_analyze_parallel(data):
+    exmatrix, result = data
+    serial = BestSubset(terms="interaction", max_size=3, n_best=2).analyze(exmatrix, result)
+    ret = BestSubset(terms="interaction", max_size=3, n_best=2, n_jobs=2).analyze(exmatrix, result)
+    assert np.allclose(ret.ss_error, serial.ss_error) and ret.terms == serial.terms, \
+        "process pool expected to find the same models"
@@ -0,0 +1,76 @@
+"""
+Test for Lenth's Method for Unreplicated Designs Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer import Lenth, LenthResult, WalshHadamard, lenth_critical_cache
+from tagupy.design.generator import FullFact, PlackettBurman
+
+
+def _pse(effects):
+    abs_effects = np.abs(effects)
+    s0 = 1.5 * np.median(abs_effects)
+    return 1.5 * np.median(abs_effects[abs_effects < 2.5 * s0])
+
+
+def test_init_invalid_input():
+    for alpha in [0, 1., 1, "0.05"]:
+        with pytest.raises(AssertionError):
+            Lenth(alpha=alpha)
+
+
+def test_analyze_invalid_input():
+    with pytest.raises(AssertionError):
+        Lenth().analyze(np.array([[0, 0], [1, 0], [0, 1], [1, 1], [1, 1]]), np.ones(5))
+    with pytest.raises(AssertionError):
+        Lenth().analyze_effects(np.ones(1))
+
+
+def test_analyze_effects():
+    effects = np.random.default_rng(0).normal(size=(15, 2000))
+    effects[:3, ::2] += 10
+    ret = Lenth(alpha=0.05).analyze_effects(effects)
+    assert isinstance(ret, LenthResult), \
+        f"output expected LenthResult, got {type(ret)}"
+    pse = np.array([_pse(col) for col in effects.T])
+    assert np.allclose(ret.pse, pse), \
+        "pse expected to be Lenth's pseudo standard error of every response"
+    # Lenth (1989), Table 1: m = 15 gives t = 2.57 for ME and 5.22 for SME
+    t_me, t_sme = ret.me / ret.pse, ret.sme / ret.pse
+    assert np.allclose(t_me, 2.57, atol=5e-3) and np.allclose(t_sme, 5.22, atol=5e-3), \
+        f"critical values expected (2.57, 5.22), got {t_me[0], t_sme[0]}"
+    assert (ret.active == (np.abs(effects) > ret.me)).all() and \
+        ret.active[:3, ::2].mean() > 0.99, \
+        "large effects expected to be active"
+
+    order = np.argsort(np.abs(effects[:, 0]))
+    assert (np.diff(ret.half_normal[order, 0]) > 0).all() and (ret.half_normal > 0).all(), \
+        "half-normal quantiles expected to increase with |effects|"
+
+
+def test_critical_cache():
+    lenth_critical_cache.clear()
+    model = Lenth(alpha=0.1)
+    effects = np.random.default_rng(1).normal(size=(7, 3))
+    model.analyze_effects(effects)
+    model.analyze_effects(effects)
+    info = lenth_critical_cache.info()
+    assert (info.hits, info.misses) == (1, 1), \
+        f"critical values expected to be computed once per (n_effect, alpha), got {info}"
+
+
+def test_analyze():
+    rng = np.random.default_rng(2)
+    exmatrix = PlackettBurman(n_rep=1).get_exmatrix(n_factor=11)
+    result = rng.normal(size=(12, 4))
+    ret = Lenth().analyze(exmatrix, result)
+    effects = WalshHadamard().analyze(exmatrix, result).effects
+    assert ret.labels == [f"x{i}" for i in range(11)] and np.allclose(ret.effects, effects), \
+        "main effects of a PB design expected"
+
+    exmatrix = FullFact(n_rep=1).get_exmatrix(levels=[2, 2, 2])
+    ret = Lenth().analyze(exmatrix, rng.normal(size=8))
+    assert ret.labels == ["x0", "x1", "x0*x1", "x2", "x0*x2", "x1*x2", "x0*x1*x2"], \
+        f"every term of a full factorial design expected in Yates order, got {ret.labels}"
@@ -0,0 +1,97 @@
+"""
+Test for Recursive Least-squares Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer import RecursiveFit, RecursiveLeastSquares
+from tagupy.design.generator import FullFact
+from tagupy.utils import ModelMatrix
+
+
+def _lstsq(exmatrix, result, terms):
+    x = ModelMatrix(exmatrix, terms=terms).toarray()
+    coef = np.linalg.lstsq(x, result, rcond=None)[0]
+    return coef, ((result - x @ coef) ** 2).sum(axis=0)
+
+
+@pytest.fixture
+def data():
+    exmatrix = FullFact(n_rep=3).get_exmatrix(levels=[3, 2, 2])
+    result = np.random.default_rng(0).normal(size=(len(exmatrix), 5))
+    return exmatrix, result
+
+
+def test_analyze_invalid_input():
+    model = RecursiveLeastSquares()
+    for exmatrix, result in [(np.ones(4), np.ones(4)), (np.ones((4, 2)), np.ones((3, 1)))]:
+        with pytest.raises(AssertionError):
+            model.analyze(exmatrix, result)
+    with pytest.raises(AssertionError):
+        model.get_fit()
+    model.analyze(np.eye(3), np.ones((3, 2)))
+    for run_row, response in [(np.ones(2), np.ones(2)), (np.ones(3), np.ones(3)),
+                              (np.ones((2, 3)), np.ones((3, 2)))]:
+        with pytest.raises(AssertionError):
+            model.update(run_row, response)
+
+
+def test_analyze(data):
+    exmatrix, result = data
+    ret = RecursiveLeastSquares(terms="quadratic").analyze(exmatrix, result)
+    coef, ss_error = _lstsq(exmatrix, result, "quadratic")
+    assert isinstance(ret, RecursiveFit), \
+        f"output expected RecursiveFit, got {type(ret)}"
+    assert ret.labels == ModelMatrix(exmatrix, terms="quadratic").labels, \
+        f"labels expected to be those of ModelMatrix, got {ret.labels}"
+    assert np.allclose(ret.coef, coef) and np.allclose(ret.ss_error, ss_error), \
+        f"coef expected {coef}, got {ret.coef}"
+    assert (ret.n_run, ret.df_error) == (36, 36 - len(ret.labels)), \
+        f"runs expected (36, {36 - len(ret.labels)}), got {(ret.n_run, ret.df_error)}"
+
+
+def test_update(data):
+    exmatrix, result = data
+    terms = [(), (0,), (1,), (2,), (0, 1), (0, 0)]
+    model = RecursiveLeastSquares(terms=terms)
+    ret = model.update(exmatrix[0], result[0])
+    assert np.isnan(ret.coef).all() and ret.n_run == 1, \
+        "coef expected nan while the runs do not determine every term"
+    for i in range(1, len(exmatrix)):
+        ret = model.update(exmatrix[i], result[i])
+        if i >= 12:
+            coef, ss_error = _lstsq(exmatrix[:i + 1], result[:i + 1], terms)
+            assert np.allclose(ret.coef, coef) and np.allclose(ret.ss_error, ss_error), \
+                f"coef after {i + 1} runs expected {coef}, got {ret.coef}"
+
+    batch = RecursiveLeastSquares(terms="linear")
+    batch.analyze(exmatrix[:20], result[:20])
+    ret = batch.update(exmatrix[20:], result[20:])
+    coef, ss_error = _lstsq(exmatrix, result, "linear")
+    assert np.allclose(ret.coef, coef) and np.allclose(ret.ss_error, ss_error), \
+        "several runs expected to be added at once"
+
+
+def test_downdate(data):
+    exmatrix, result = data
+    model = RecursiveLeastSquares(terms="interaction")
+    model.analyze(exmatrix, result)
+    ret = model.downdate(exmatrix[[3, 17]], result[[3, 17]])
+    keep = np.setdiff1d(np.arange(len(exmatrix)), [3, 17])
+    coef, ss_error = _lstsq(exmatrix[keep], result[keep], "interaction")
+    assert np.allclose(ret.coef, coef) and np.allclose(ret.ss_error, ss_error), \
+        f"coef without the runs expected {coef}, got {ret.coef}"
+    assert ret.n_run == len(keep), \
+        f"n_run expected {len(keep)}, got {ret.n_run}"
+
+
+def test_downdate_rank_deficient():
+    exmatrix = FullFact(n_rep=1).get_exmatrix(levels=[2, 2])[:3]
+    model = RecursiveLeastSquares()
+    fit = model.analyze(exmatrix, np.arange(3.))
+    with pytest.raises(np.linalg.LinAlgError):
+        model.downdate(exmatrix[0], [0.])
+    ret = model.get_fit()
+    assert np.allclose(ret.coef, fit.coef) and ret.n_run == 3, \
+        "fit expected to be left unchanged by a failed downdate"
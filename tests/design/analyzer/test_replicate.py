@@ -0,0 +1,58 @@
+"""
+Test for Replicate structure of the experiment
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer._replicate import ReplicateSummary, _collapse
+from tagupy.design.generator import OneHot, PlackettBurman
+
+
+def _expected(exmatrix, result):
+    unique, inverse = np.unique(exmatrix, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    counts = np.bincount(inverse)
+    means = np.stack([result[inverse == i].mean(axis=0) for i in range(len(unique))])
+    ss = np.stack([((result[inverse == i] - means[i]) ** 2).sum(axis=0)
+                   for i in range(len(unique))])
+    return unique, counts, means, ss
+
+
+def test_collapse_invalid_input():
+    design = PlackettBurman(n_rep=2).get_exmatrix(n_factor=3, lazy=True)
+    for exmatrix in [np.ones((8, 3)), design]:
+        with pytest.raises(AssertionError):
+            _collapse(exmatrix, np.ones((7, 1)))
+
+
+def test_collapse_array():
+    rng = np.random.default_rng(0)
+    exmatrix = rng.integers(0, 3, size=(60, 2))
+    result = rng.normal(size=(60, 4))
+    ret = _collapse(exmatrix, result)
+    assert isinstance(ret, ReplicateSummary), \
+        f"output expected ReplicateSummary, got {type(ret)}"
+    for actual, exp in zip(ret, _expected(exmatrix, result)):
+        assert np.allclose(actual, exp), f"summary expected {exp}, got {actual}"
+
+
+def test_collapse_replicated_design():
+    rng = np.random.default_rng(1)
+    for model, kwargs in [(OneHot(n_rep=5), dict(n_factor=4)),
+                          (PlackettBurman(n_rep=3), dict(n_factor=5))]:
+        design = model.get_exmatrix(**kwargs, lazy=True)
+        exmatrix = model.get_exmatrix(**kwargs)
+        result = rng.normal(size=(len(exmatrix), 3))
+        for ret in [_collapse(design, result), _collapse(exmatrix, result)]:
+            for actual, exp in zip(ret, _expected(exmatrix, result)):
+                assert np.allclose(actual, exp), f"summary expected {exp}, got {actual}"
+
+
+def test_collapse_distinct_runs():
+    exmatrix = np.array([[1, 0], [0, 0], [0, 1]])
+    ret = _collapse(exmatrix, np.arange(3.))
+    assert (ret.counts == 1).all() and np.allclose(ret.ss_within, 0), \
+        "distinct runs expected to be kept with a single replicate"
+    assert np.allclose(ret.means[:, 0], [1, 2, 0]), \
+        f"means expected to follow the sorted runs, got {ret.means[:, 0]}"
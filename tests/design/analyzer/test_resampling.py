@@ -0,0 +1,86 @@
+"""
+Test for Permutation and Bootstrap Inference Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer import Resampling, ResamplingResult
+from tagupy.design.generator import FullFact
+
+
+@pytest.fixture
+def data():
+    exmatrix = 2 * FullFact(n_rep=2).get_exmatrix(levels=[2, 2, 2]) - 1
+    rng = np.random.default_rng(0)
+    noise = rng.normal(scale=0.3, size=(len(exmatrix), 2))
+    result = np.stack([1 + exmatrix[:, 0], 2 - exmatrix[:, 1]], axis=1) + noise
+    return exmatrix, result
+
+
+def test_init_invalid_input():
+    for kwargs in [
+        {"method": "jackknife"},
+        {"n_resample": 0},
+        {"batch_size": 1.},
+        {"n_jobs": -1},
+        {"alpha": 1.},
+        {"alpha": 0},
+    ]:
+        with pytest.raises(AssertionError):
+            Resampling(**kwargs)
+
+
+def test_analyze_rank_deficient():
+    exmatrix = FullFact(n_rep=1).get_exmatrix(levels=[2, 2])
+    with pytest.raises(np.linalg.LinAlgError):
+        Resampling(terms="interaction").analyze(exmatrix, np.arange(4.))
+
+
+def test_permutation(data):
+    exmatrix, result = data
+    ret = Resampling(method="permutation", n_resample=999, seed=0).analyze(exmatrix, result)
+    assert isinstance(ret, ResamplingResult), \
+        f"output expected ResamplingResult, got {type(ret)}"
+    assert ret.std_err is None and ret.ci_low is None and ret.ci_high is None
+    x = np.column_stack([np.ones(len(exmatrix)), exmatrix])
+    assert np.allclose(ret.coef, np.linalg.lstsq(x, result, rcond=None)[0]), \
+        "coef expected to be the least-squares coefficients"
+    assert ret.p_value.shape == (4, 2)
+    assert np.all(np.isnan(ret.p_value[0])), \
+        "p_value of the intercept expected to be nan, permutations keep the mean"
+    assert ret.p_value[1, 0] < 0.01 and ret.p_value[2, 1] < 0.01
+    assert ret.p_value[3, 0] > 0.01 and ret.p_value[3, 1] > 0.01
+    assert np.all(ret.p_value[1:] >= 1 / 1000)
+
+
+def test_bootstrap(data):
+    exmatrix, result = data
+    ret = Resampling(method="bootstrap", n_resample=4000, seed=1).analyze(exmatrix, result)
+    assert ret.p_value is None
+    assert np.all(ret.ci_low < ret.coef) and np.all(ret.coef < ret.ci_high)
+    # the residual bootstrap estimates sigma / sqrt(n), the standard error of a -1/+1 design
+    x = np.column_stack([np.ones(len(exmatrix)), exmatrix])
+    resid = result - x @ ret.coef
+    se = np.sqrt((resid ** 2).sum(axis=0) / (len(x) - 4) / len(x))
+    assert np.allclose(ret.std_err, se[None], rtol=0.1), \
+        "std_err expected to approximate the standard error of the coefficients"
+    assert ret.ci_low[1, 0] > 0 and ret.ci_high[1, 1] < 0.5 and ret.ci_high[2, 1] < 0
+
+
+@pytest.mark.parametrize("method", ["permutation", "bootstrap"])
+def test_reproducible(data, method):
+    exmatrix, result = data
+    kwargs = {"method": method, "n_resample": 250, "batch_size": 60, "seed": 2}
+    ret = Resampling(**kwargs).analyze(exmatrix, result)
+    same = Resampling(**kwargs).analyze(exmatrix, result)
+    pooled = Resampling(n_jobs=2, **kwargs).analyze(exmatrix, result)
+    for a, b, c in zip(ret, same, pooled):
+        if isinstance(a, np.ndarray):
+            assert np.array_equal(a, b, equal_nan=True) and np.array_equal(a, c, equal_nan=True), \
+                "results expected to depend on the seed only, not on n_jobs"
+    other = Resampling(**{**kwargs, "seed": 3}).analyze(exmatrix, result)
+    assert not np.array_equal(
+        ret.p_value[1:] if method == "permutation" else ret.std_err,
+        other.p_value[1:] if method == "permutation" else other.std_err,
+    )
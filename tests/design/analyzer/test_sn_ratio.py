@@ -0,0 +1,88 @@
+"""
+Test for Taguchi Signal-to-Noise Ratio Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer import SNRatio, SNRatioResult
+from tagupy.design.generator import FullFact, ReplicatedDesign
+
+
+@pytest.fixture
+def data():
+    base = FullFact(n_rep=1).get_exmatrix(levels=[2, 3, 2])
+    n_rep = 20
+    rng = np.random.default_rng(0)
+    x = np.tile(base, (n_rep, 1))
+    result = (5 + x[:, 1])[:, None] + (0.5 + x[:, 0])[:, None] * rng.normal(size=(len(x), 2))
+    return base, n_rep, result
+
+
+def _sn(kind, y):
+    if kind == "larger":
+        return -10 * np.log10(np.mean(1 / y ** 2))
+    if kind == "smaller":
+        return -10 * np.log10(np.mean(y ** 2))
+    return 10 * np.log10(np.mean(y) ** 2 / np.var(y, ddof=1))
+
+
+def test_init_invalid_input():
+    for kwargs in [{"kind": "target"}, {"n_rep": 0}, {"n_rep": 2.}]:
+        with pytest.raises(AssertionError):
+            SNRatio(**kwargs)
+
+
+def test_analyze_invalid_input(data):
+    base, n_rep, result = data
+    x = np.tile(base, (n_rep, 1))
+    with pytest.raises(AssertionError):
+        SNRatio(n_rep=7).analyze(x, result)
+    swapped = x.copy()
+    swapped[[0, 1]] = swapped[[1, 0]]
+    with pytest.raises(AssertionError):
+        SNRatio(n_rep=n_rep).analyze(swapped, result)
+    with pytest.raises(AssertionError):
+        SNRatio(n_rep=3).analyze(ReplicatedDesign(base, n_rep), result)
+    with pytest.raises(AssertionError):
+        SNRatio(kind="nominal").analyze(base, result[:len(base)])
+
+
+@pytest.mark.parametrize("kind", ["larger", "smaller", "nominal"])
+def test_analyze(data, kind):
+    base, n_rep, result = data
+    ret = SNRatio(kind=kind).analyze(np.tile(base, (n_rep, 1)), result)
+    assert isinstance(ret, SNRatioResult), \
+        f"output expected SNRatioResult, got {type(ret)}"
+    assert np.array_equal(ret.exmatrix, base)
+    blocks = result.reshape(n_rep, len(base), 2)
+    sn = np.array([[_sn(kind, blocks[:, i, k]) for k in range(2)] for i in range(len(base))])
+    assert np.allclose(ret.sn, sn), \
+        f"sn expected to be the {kind} SN ratio of every run"
+    assert np.allclose(ret.mean, blocks.mean(axis=0))
+    for j in range(base.shape[1]):
+        level = np.unique(base[:, j])
+        assert np.array_equal(ret.levels[j], level)
+        table = np.array([sn[base[:, j] == v].mean(axis=0) for v in level])
+        assert np.allclose(ret.effects[j], table), \
+            "effects expected to be the mean SN ratio at every level"
+        assert np.allclose(ret.delta[j], table.max(axis=0) - table.min(axis=0))
+        assert np.array_equal(ret.best[j], level[table.argmax(axis=0)])
+    lazy = SNRatio(kind=kind).analyze(ReplicatedDesign(base, n_rep), result)
+    assert np.array_equal(lazy.sn, ret.sn) and np.array_equal(lazy.delta, ret.delta)
+
+
+def test_analyze_nominal_levels(data):
+    base, n_rep, result = data
+    ret = SNRatio(kind="nominal").analyze(ReplicatedDesign(base, n_rep), result)
+    # the noise grows with x0 and the mean with x1
+    assert np.all(ret.best[0] == 0) and np.all(ret.best[1] == 2)
+    assert np.all(ret.delta[0] > ret.delta[2])
+
+
+def test_analyze_view():
+    base = FullFact(n_rep=1).get_exmatrix(levels=[2, 2])
+    result = np.random.default_rng(1).uniform(1, 2, size=(1000 * len(base), 3))
+    ret = SNRatio(kind="smaller").analyze(ReplicatedDesign(base, 1000), result)
+    assert ret.sn.shape == (4, 3) and ret.mean.shape == (4, 3)
+    assert [len(table) for table in ret.effects] == [2, 2]
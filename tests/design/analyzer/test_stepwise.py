@@ -0,0 +1,111 @@
+"""
+Test for Stepwise Model Selection Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer import Stepwise, StepwiseResult
+from tagupy.design.generator import DSD, FullFact
+from tagupy.utils import ModelMatrix
+
+
+def _criterion(exmatrix, result, terms, criterion):
+    x = ModelMatrix(exmatrix, terms=terms).toarray()
+    coef = np.linalg.lstsq(x, result, rcond=None)[0]
+    sse = ((result - x @ coef) ** 2).sum()
+    n, k = x.shape
+    if criterion == "bic":
+        return n * np.log(sse / n) + k * np.log(n)
+    return n * np.log(sse / n) + 2 * k + 2 * k * (k + 1) / (n - k - 1)
+
+
+@pytest.fixture
+def data():
+    exmatrix = DSD(n_rep=1).get_exmatrix(n_factor=8, n_fake=2)
+    noise = np.random.default_rng(0).normal(scale=0.5, size=len(exmatrix))
+    result = 2 * exmatrix[:, 1] - 3 * exmatrix[:, 4] + 1.5 * exmatrix[:, 1] * exmatrix[:, 4] \
+        + 2 * exmatrix[:, 6] ** 2 + noise
+    return exmatrix, result
+
+
+def test_init_invalid_input():
+    for kwargs in [dict(criterion="aic"), dict(direction="up"),
+                   dict(alpha_enter=0.2, alpha_remove=0.1), dict(max_step=0)]:
+        with pytest.raises(AssertionError):
+            Stepwise(**kwargs)
+    with pytest.raises(AssertionError):
+        Stepwise().analyze(np.ones((4, 2)), np.ones((4, 2)))
+
+
+def test_analyze_forward(data):
+    exmatrix, result = data
+    for criterion in ["aicc", "bic"]:
+        ret = Stepwise(criterion=criterion, direction="forward").analyze(exmatrix, result)
+        assert isinstance(ret, StepwiseResult), \
+            f"output expected StepwiseResult, got {type(ret)}"
+        model = ModelMatrix(exmatrix, terms="quadratic")
+        candidates = [term for term in model.terms if term]
+        selected = [()]
+        for action, label, value in ret.history:
+            assert action == "add", f"forward selection expected to add only, got {action}"
+            scores = {term: _criterion(exmatrix, result, selected + [term], criterion)
+                      for term in candidates if term not in selected}
+            best = min(scores, key=scores.get)
+            assert label == model.labels[model.index(best)] and np.isclose(value, scores[best]), \
+                f"step expected to add {best} with {scores[best]}, got {label} with {value}"
+            selected.append(best)
+        assert ret.terms == selected and np.isclose(
+            ret.criterion, _criterion(exmatrix, result, selected, criterion)), \
+            f"selected terms expected {selected}, got {ret.terms}"
+        x = ModelMatrix(exmatrix, terms=selected).toarray()
+        coef = np.linalg.lstsq(x, result, rcond=None)[0]
+        ss_error = ((result - x @ coef) ** 2).sum()
+        assert np.allclose(ret.coef, coef) and np.isclose(ret.ss_error, ss_error), \
+            f"coef expected {coef}, got {ret.coef}"
+
+
+def test_analyze_finds_active_terms(data):
+    exmatrix, result = data
+    for criterion in ["aicc", "p_value"]:
+        ret = Stepwise(criterion=criterion).analyze(exmatrix, result)
+        for term in [(1,), (4,), (1, 4), (6, 6)]:
+            assert term in ret.terms, f"active term {term} expected to be selected, got {ret.terms}"
+
+
+def test_analyze_backward(data):
+    exmatrix, result = data
+    ret = Stepwise(criterion="bic", terms="linear", direction="backward").analyze(exmatrix, result)
+    assert all(action == "remove" for action, _, _ in ret.history), \
+        "backward elimination expected to remove only"
+    kept = ret.terms
+    score = _criterion(exmatrix, result, kept, "bic")
+    for term in kept[1:]:
+        assert _criterion(exmatrix, result, [t for t in kept if t != term], "bic") >= score, \
+            f"removing {term} expected not to improve the selected model"
+    assert np.isclose(ret.criterion, score), \
+        f"criterion expected {score}, got {ret.criterion}"
+
+
+def test_analyze_backward_rank_deficient():
+    exmatrix = DSD(n_rep=1).get_exmatrix(n_factor=6, n_fake=2)
+    result = np.random.default_rng(0).normal(size=len(exmatrix))
+    # 27 quadratic candidates and the intercept for 17 runs
+    with pytest.raises(AssertionError):
+        Stepwise(direction="backward").analyze(exmatrix, result)
+    exmatrix = 2 * FullFact(n_rep=1).get_exmatrix(levels=[2, 2, 2]) - 1
+    # x0^2 of a -1/+1 design is the intercept
+    with pytest.raises(np.linalg.LinAlgError):
+        Stepwise(terms=[(0,), (0, 0)], direction="backward").analyze(exmatrix, np.arange(8.))
+
+
+def test_analyze_both(data):
+    exmatrix, result = data
+    ret = Stepwise(criterion="aicc", direction="both").analyze(exmatrix, result)
+    x = ModelMatrix(exmatrix, terms=ret.terms).toarray()
+    coef = np.linalg.lstsq(x, result, rcond=None)[0]
+    assert np.allclose(ret.coef, coef), \
+        "coef expected to be refit on the selected terms after removals"
+    ret = Stepwise(max_step=2).analyze(exmatrix, result)
+    assert len(ret.history) == 2 and len(ret.terms) <= 3, \
+        f"selection expected to stop after max_step steps, got {ret.history}"
@@ -0,0 +1,74 @@
+"""
+Test for Two-stage Definitive Screening Design Analysis Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer import TwoStageDSD, TwoStageDSDResult
+from tagupy.design.generator import DSD, FullFact
+from tagupy.utils import ModelMatrix
+
+
+def _response(exmatrix, rng):
+    return 4 + 3 * exmatrix[:, 0] - 2 * exmatrix[:, 2] + 2.5 * exmatrix[:, 0] * exmatrix[:, 2] \
+        - 3 * exmatrix[:, 2] ** 2 + rng.normal(scale=0.3, size=len(exmatrix))
+
+
+def test_init_invalid_input():
+    for kwargs in [dict(alpha_main=0), dict(alpha=1.), dict(alpha=1)]:
+        with pytest.raises(AssertionError):
+            TwoStageDSD(**kwargs)
+
+
+def test_analyze_invalid_input():
+    exmatrix = FullFact(n_rep=1).get_exmatrix(levels=[3, 3])
+    with pytest.raises(AssertionError):
+        TwoStageDSD().analyze(exmatrix[:-1], np.ones(len(exmatrix) - 1))
+    exmatrix = DSD(n_rep=1).get_exmatrix(n_factor=5, n_fake=2)
+    with pytest.raises(AssertionError):
+        TwoStageDSD().analyze(exmatrix, np.ones((len(exmatrix), 2)))
+
+
+def test_analyze():
+    rng = np.random.default_rng(0)
+    exmatrix = DSD(n_rep=1).get_exmatrix(n_factor=8, n_fake=2)
+    result = _response(exmatrix, rng)
+    ret = TwoStageDSD().analyze(exmatrix, result)
+    assert isinstance(ret, TwoStageDSDResult), \
+        f"output expected TwoStageDSDResult, got {type(ret)}"
+    assert sorted(ret.terms) == [(), (0,), (0, 2), (2,), (2, 2)], \
+        f"active terms expected to be selected, got {ret.labels}"
+    assert ret.active.tolist() == [True, False, True] + [False] * 5, \
+        f"active factors expected 0 and 2, got {ret.active}"
+
+    x = ModelMatrix(exmatrix, terms=ret.terms).toarray()
+    coef = np.linalg.lstsq(x, result, rcond=None)[0]
+    assert np.allclose(ret.coef, coef), \
+        f"coef expected to be the least-squares fit on every run {coef}, got {ret.coef}"
+    sigma2 = ((result - x @ coef) ** 2).sum() / (len(exmatrix) - len(ret.terms))
+    assert np.isclose(ret.sigma2, sigma2) and ret.df_error == len(exmatrix) - len(ret.terms), \
+        f"sigma2 expected {sigma2}, got {ret.sigma2}"
+
+    m = len(exmatrix) // 2
+    odd = (result[:m] - result[m:2 * m]) / 2
+    main_coef = np.linalg.lstsq(exmatrix[:m], odd, rcond=None)[0]
+    assert np.allclose(ret.main_coef, main_coef), \
+        f"main_coef expected the fit of the odd part {main_coef}, got {ret.main_coef}"
+
+
+def test_analyze_replicated():
+    rng = np.random.default_rng(1)
+    model = DSD(n_rep=3)
+    exmatrix = model.get_exmatrix(n_factor=6, n_fake=2)
+    result = _response(exmatrix, rng)
+    ret = TwoStageDSD().analyze(exmatrix, result)
+    x = ModelMatrix(exmatrix, terms=ret.terms).toarray()
+    coef = np.linalg.lstsq(x, result, rcond=None)[0]
+    assert np.allclose(ret.coef, coef), \
+        "coef of replicated runs expected to be the least-squares fit on every run"
+    assert ret.df_error == len(exmatrix) - len(ret.terms), \
+        f"df_error expected {len(exmatrix) - len(ret.terms)}, got {ret.df_error}"
+    lazy = TwoStageDSD().analyze(model.get_exmatrix(n_factor=6, n_fake=2, lazy=True), result)
+    assert lazy.terms == ret.terms and np.allclose(lazy.coef, ret.coef), \
+        "ReplicatedDesign expected to give the same analysis"
@@ -0,0 +1,75 @@
+"""
+Test for Walsh-Hadamard Effect Estimation Module
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from tagupy.design.analyzer import EffectEstimate, WalshHadamard
+from tagupy.design.generator import DSD, FullFact, PlackettBurman
+
+
+def _lstsq(x, result):
+    x = np.hstack([np.ones((len(x), 1)), x])
+    return np.linalg.lstsq(x, result, rcond=None)[0]
+
+
+@pytest.fixture
+def result_block():
+    return np.random.default_rng(0).normal(size=(96, 7))
+
+
+def test_analyze_invalid_input():
+    model = WalshHadamard()
+    for exmatrix, result in [(np.ones(4), np.ones(4)), (np.ones((4, 2)), np.ones((3, 1)))]:
+        with pytest.raises(AssertionError):
+            model.analyze(exmatrix, result)
+
+
+def test_analyze_full_factorial(result_block):
+    n_rep, n_factor = 3, 5
+    exmatrix = FullFact(n_rep=n_rep).get_exmatrix(levels=[2] * n_factor)
+    order = np.random.default_rng(1).permutation(len(exmatrix))
+    exmatrix, result = exmatrix[order], result_block[:len(exmatrix)]
+    ret = WalshHadamard().analyze(exmatrix, result)
+    assert isinstance(ret, EffectEstimate) and ret.method == "fwht", \
+        f"full factorial design expected to take fwht path, got {ret.method}"
+    coded = 2 * exmatrix.astype(float) - 1
+    terms = [()] + [s for k in range(1, n_factor + 1) for s in combinations(range(n_factor), k)]
+    yates = sorted(terms, key=lambda s: sum(1 << j for j in s))
+    full = np.stack([np.prod(coded[:, list(s)], axis=1) for s in yates], axis=1)
+    exp = np.linalg.lstsq(full, result, rcond=None)[0]
+    assert ret.contrasts.shape == exp.shape and np.allclose(ret.contrasts, exp), \
+        f"contrasts expected {exp}, got {ret.contrasts}"
+    assert np.allclose(ret.coef, _lstsq(coded, result)), \
+        f"coefficients expected {_lstsq(coded, result)}, got {ret.coef}"
+    assert np.allclose(ret.effects, 2 * ret.coef[1:]), \
+        "effects expected to be twice the coefficients"
+
+
+def test_analyze_orthogonal(result_block):
+    for n_rep, n_factor in [(1, 11), (2, 7), (1, 19)]:
+        exmatrix = PlackettBurman(n_rep=n_rep).get_exmatrix(n_factor=n_factor)
+        result = result_block[:len(exmatrix)]
+        ret = WalshHadamard().analyze(exmatrix, result)
+        assert ret.method == "orthogonal" and ret.contrasts is None, \
+            f"PB design expected to take orthogonal path, got {ret.method}"
+        assert np.allclose(ret.coef, _lstsq(exmatrix, result)), \
+            f"coefficients expected {_lstsq(exmatrix, result)}, got {ret.coef}"
+
+
+def test_analyze_fallback(result_block):
+    pb = PlackettBurman(n_rep=1).get_exmatrix(n_factor=11)
+    for exmatrix, coded in [
+        (DSD(n_rep=1).get_exmatrix(n_factor=5, n_fake=1), None),
+        (pb[:-2], pb[:-2]),
+    ]:
+        result = result_block[:len(exmatrix)]
+        ret = WalshHadamard().analyze(exmatrix, result[:, 0])
+        exp = _lstsq(exmatrix if coded is None else coded, result[:, :1])
+        assert ret.method == "lstsq" and ret.coef.shape == exp.shape, \
+            f"non-orthogonal design expected to fall back to lstsq, got {ret.method}"
+        assert np.allclose(ret.coef, exp), \
+            f"coefficients expected {exp}, got {ret.coef}"
@@ -0,0 +1,35 @@
+"""
+Test for Cache of Base Matrices
+"""
+
+import numpy as np
+
+from tagupy.design.generator import DSD, PlackettBurman, base_matrix_cache
+
+
+def test_generators_share_cache():
+    base_matrix_cache.clear()
+    pb = PlackettBurman(2)
+    dsd = DSD(3)
+    exp_pb = pb.get_exmatrix(10)
+    exp_dsd = dsd.get_exmatrix(n_factor=6, n_fake=2)
+    misses = base_matrix_cache.info().misses
+    assert misses == 2, f"first calls expected 2 cache misses, got {misses}"
+    for _ in range(5):
+        assert np.array_equal(pb.get_exmatrix(10), exp_pb)
+        assert np.array_equal(pb.get_exmatrix(9), exp_pb[:, :9])
+        assert np.array_equal(dsd.get_exmatrix(n_factor=5, n_fake=3), exp_dsd[:, :5])
+    info = base_matrix_cache.info()
+    assert info.misses == 2 and info.hits == 15, \
+        f"repeated calls expected to hit the cache, got {info}"
+
+
+def test_cached_matrices_are_protected():
+    model = PlackettBurman(1)
+    ret = model.get_exmatrix(5)
+    ret[:] = 0
+    assert (np.abs(model.get_exmatrix(5)) == 1).all(), \
+        "writes to an exmatrix expected not to reach the cache"
+    lazy = model.get_exmatrix(5, lazy=True)
+    assert not lazy.base.flags.writeable, \
+        "base of a lazy exmatrix expected to be read-only"
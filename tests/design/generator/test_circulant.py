@@ -0,0 +1,37 @@
+"""
+Test for Circulant Matrix Builders
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator._circulant import _back_circulant_view, _circulant, _circulant_view
+
+
+@pytest.fixture
+def correct_input():
+    rng = np.random.default_rng(0)
+    return [np.array([1]), np.array([1, -1]), np.arange(7), rng.choice([-1, 1], 31).astype(np.int8)]
+
+
+def test_circulant_valid_output(correct_input):
+    for vec in correct_input:
+        exp = np.vstack([np.roll(vec, i) for i in range(len(vec))])
+        for fn in [_circulant, _circulant_view]:
+            ret = fn(vec)
+            assert ret.dtype == vec.dtype, \
+                f"{fn.__name__} expected dtype {vec.dtype}, got {ret.dtype}"
+            assert np.array_equal(ret, exp), \
+                f"{fn.__name__} of {vec} expected rows np.roll(vec, i), got {ret}"
+        r = np.eye(len(vec), dtype=int)[::-1]
+        assert np.array_equal(_back_circulant_view(vec), exp @ r), \
+            f"back-circulant of {vec} expected {exp @ r}, got {_back_circulant_view(vec)}"
+
+
+def test_circulant_view_read_only(correct_input):
+    for vec in correct_input:
+        ret = _circulant_view(vec)
+        assert not ret.flags.writeable, \
+            f"circulant view of {vec} expected read-only"
+        assert ret.base is not None, \
+            f"circulant view of {vec} expected to be a view"
@@ -0,0 +1,39 @@
+"""
+Test for Conference Matrix Construction Engine
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import _conference as cf
+
+
+@pytest.fixture
+def correct_input():
+    # paley (prime and prime power, both residues), doubling
+    return [(2, "skew2"), (14, "paley"), (26, "paley"), (28, "paley"), (50, "paley"),
+            (82, "paley"), (126, "paley"), (96, "double"), (120, "double"), (256, "double")]
+
+
+def test_conference_valid_output(correct_input):
+    for order, kind in correct_input:
+        assert cf._conference_plan(order)[0] == kind, \
+            f"construction of order {order} expected {kind}, got {cf._conference_plan(order)}"
+        c_mat = cf._conference(order)
+        assert c_mat.shape == (order, order) and c_mat.dtype == np.int8, \
+            f"expected int8 matrix of order {order}, got {c_mat.dtype} {c_mat.shape}"
+        assert (np.abs(c_mat) == 1 - np.eye(order)).all(), \
+            f"conference matrix of order {order} expected zeros only on the diagonal"
+        gram = c_mat.astype(float) @ c_mat.T
+        assert (gram == (order - 1) * np.eye(order)).all(), \
+            f"conference matrix of order {order} expected C @ C.T = {order - 1} * I"
+        if cf._is_antisymmetric(order):
+            assert (c_mat == -c_mat.T).all(), \
+                f"conference matrix of order {order} expected to be antisymmetric"
+
+
+def test_conference_unsupported_order():
+    for order in [0, 3, 22, 34, 52, 58]:
+        assert cf._conference_plan(order) is None
+        with pytest.raises(ValueError):
+            cf._conference(order)
@@ -33,11 +33,11 @@ def test_init_invalid_input():
 
 
 def test_get_exmatrix_invalid_input():
-    # first 4 elements in arg don't meet the requirment of either n-factor and n_fake
-    # last 4 elements in arg don't meet the requirement of sum_factor(=n_factor+n_fake)
-    arg0 = ['moge', None, [], 0, -1, 1, 51, 3, 26]
-    arg1 = ['moge', None, [], 0, -1, 1, 3, 51, 26]
-    cor = [2 for i in range(9)]
+    # first 5 elements in arg don't meet the requirment of either n-factor and n_fake
+    # last element in arg doesn't meet the requirement of sum_factor(=n_factor+n_fake)
+    arg0 = ['moge', None, [], 0, -1, 1]
+    arg1 = ['moge', None, [], 0, -1, 1]
+    cor = [2 for i in range(6)]
     model = DSD(2)
     for a, c in zip(arg0[:5], cor[:5]):
         with pytest.raises(AssertionError) as e:
@@ -72,3 +72,29 @@ def test_get_exmatrix_valid_output(correct_input):
             f"shape of exmatrix expected {cor}, got {ret}"
         assert ((ex_mat == 0) | (ex_mat == 1) | (ex_mat == -1)).all(),\
             f'Error: all the elements in exmatrix should be either 0, -1, or 1, got {ex_mat}'
+
+
+def test_get_exmatrix_dtype():
+    model = DSD(2)
+    ret = model.get_exmatrix(n_factor=6, n_fake=2)
+    assert ret.dtype == np.int8, \
+        f"dtype of exmatrix expected int8, got {ret.dtype}"
+    ret = model.get_exmatrix(n_factor=6, n_fake=2, dtype=np.float32)
+    assert ret.dtype == np.float32, \
+        f"dtype of exmatrix expected float32, got {ret.dtype}"
+
+
+def test_get_exmatrix_large_valid_output():
+    model = DSD(1)
+    for fac, n_fake, order in [(50, 2, 54), (58, 2, 60), (60, 4, 64), (98, 2, 102), (196, 4, 200)]:
+        ex_mat = model.get_exmatrix(n_factor=fac, n_fake=n_fake)
+        cor = (2 * order + 1, fac)
+        assert ex_mat.shape == cor, \
+            f"shape of exmatrix expected {cor}, got {ex_mat.shape}"
+        assert ((ex_mat == 0) | (ex_mat == 1) | (ex_mat == -1)).all(), \
+            f'Error: all the elements in exmatrix should be either 0, -1, or 1, got {ex_mat}'
+        x = ex_mat.astype(float)
+        assert (x.T @ x == (2 * order - 2) * np.eye(fac)).all(), \
+            "main effects of a DSD expected to be orthogonal"
+        assert (x.sum(axis=0) == 0).all(), \
+            "DSD expected to be mean orthogonal"
@@ -81,3 +81,82 @@ def test_getexmatrix_invalid_output(correct_input):
         ret = model.get_exmatrix(i)
         assert isinstance(ret, np.ndarray), \
             f'Error: dtype of ematrix expected np.adarray, got {type(ret)}'
+
+
+def test_iter_exmatrix_valid_output(correct_input):
+    model = FullFact(3)
+    for i in correct_input:
+        exp = model.get_exmatrix(i)
+        for chunk_size in [1, 7, 64, len(exp), len(exp) + 1]:
+            chunks = list(model.iter_exmatrix(i, chunk_size=chunk_size))
+            assert all(len(c) <= chunk_size for c in chunks), \
+                f'Error: chunk exceeds chunk_size {chunk_size}, got {[len(c) for c in chunks]}'
+            ret = np.vstack(chunks)
+            assert np.array_equal(exp, ret), \
+                f'Error: chunks differ from get_exmatrix > expected: {exp}, got: {ret}'
+
+
+def test_iter_exmatrix_invalid_input():
+    model = FullFact(3)
+    for chunk_size in ['a', 3.2, None, 0, -1]:
+        with pytest.raises(AssertionError) as e:
+            next(model.iter_exmatrix([2, 3], chunk_size=chunk_size))
+        assert f'{chunk_size}' in f"{e.value}", \
+            f"NoReasons: Inform the AssertionError reasons, got {e.value}"
+
+
+def test_get_runs_valid_output(correct_input):
+    model = FullFact(3)
+    for i in correct_input:
+        exp = model.get_exmatrix(i)
+        n_total = len(exp)
+        for idx in [0, n_total - 1, -1, -n_total, slice(None), slice(3, 50, 4),
+                    slice(None, None, -3), [5, 0, -2, 5], np.arange(0, n_total, 7)]:
+            if not isinstance(idx, slice) and np.max(np.abs(idx)) > n_total:
+                continue
+            ret = model.get_runs(i, idx)
+            assert np.array_equal(exp[idx], ret), \
+                f'Error: runs {idx} not matched > expected: {exp[idx]}, got: {ret}'
+
+
+def test_get_runs_invalid_input():
+    model = FullFact(2)
+    for idx in [24, -25, 1.5, [1, 'a'], [[0, 1]]]:
+        with pytest.raises(AssertionError):
+            model.get_runs([2, 3, 2], idx)
+
+
+def test_shard_valid_output(correct_input):
+    model = FullFact(3)
+    for i in correct_input:
+        exp = model.get_exmatrix(i)
+        for world_size in [1, 2, 5, 16]:
+            shards = [model.shard(i, rank, world_size) for rank in range(world_size)]
+            lengths = [len(s) for s in shards]
+            assert max(lengths) - min(lengths) <= 1, \
+                f'Error: unbalanced shards, got lengths {lengths}'
+            ret = np.vstack(shards)
+            assert np.array_equal(exp, ret), \
+                f'Error: shards do not cover the design in order > expected: {exp}, got: {ret}'
+
+
+def test_shard_invalid_input():
+    model = FullFact(2)
+    for rank, world_size in [(-1, 2), (2, 2), (0.5, 2), (0, 0), (0, 'a')]:
+        with pytest.raises(AssertionError) as e:
+            model.shard([2, 3], rank, world_size)
+        assert 'Invalid input' in f"{e.value}", \
+            f"NoReasons: Inform the AssertionError reasons, got {e.value}"
+
+
+def test_get_exmatrix_dtype():
+    model = FullFact(2)
+    for levels, exp in [([2, 3], np.int8), ([128, 2], np.int8), ([129], np.int16)]:
+        ret = model.get_exmatrix(levels)
+        assert ret.dtype == exp, \
+            f'Error: dtype of exmatrix expected {exp}, got {ret.dtype}'
+        assert next(model.iter_exmatrix(levels)).dtype == exp
+        assert model.get_runs(levels, [0, 1]).dtype == exp
+    ret = model.get_exmatrix([2, 3], dtype=np.float32)
+    assert ret.dtype == np.float32, \
+        f'Error: dtype of exmatrix expected float32, got {ret.dtype}'
@@ -0,0 +1,54 @@
+"""
+Test for Hadamard Matrix Construction Engine
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import _hadamard as hd
+from tagupy.design.generator._circulant import _circulant
+
+
+@pytest.fixture
+def correct_input():
+    # sylvester, paley1, paley2 (prime power), williamson, kronecker
+    return [(1, "sylvester"), (2, "sylvester"), (128, "sylvester"), (28, "paley1"),
+            (244, "paley1"), (52, "paley2"), (100, "paley2"), (92, "williamson"),
+            (116, "williamson"), (184, "kron"), (1008, "kron")]
+
+
+def test_hadamard_valid_output(correct_input):
+    for order, kind in correct_input:
+        assert hd._hadamard_plan(order)[0] == kind, \
+            f"construction of order {order} expected {kind}, got {hd._hadamard_plan(order)}"
+        hmat = hd._hadamard(order)
+        assert hmat.shape == (order, order) and hmat.dtype == np.int8, \
+            f"expected int8 matrix of order {order}, got {hmat.dtype} {hmat.shape}"
+        gram = hmat.astype(np.float64) @ hmat.T
+        assert (gram == order * np.eye(order)).all(), \
+            f"Hadamard matrix of order {order} expected H @ H.T = {order} * I"
+
+
+def test_hadamard_memoized():
+    assert hd._hadamard(184) is hd._hadamard(184), \
+        "Hadamard matrices expected to be memoized"
+    assert not hd._hadamard(184).flags.writeable, \
+        "memoized Hadamard matrices expected to be read-only"
+
+
+def test_hadamard_unsupported_order():
+    for order in [0, 3, 6, 156, 668]:
+        assert hd._hadamard_plan(order) is None
+        with pytest.raises(ValueError):
+            hd._hadamard(order)
+
+
+def test_williamson_search():
+    for n in [3, 5, 7, 9]:
+        rows = hd._williamson_search(n)
+        assert (rows == rows[:, (-np.arange(n)) % n]).all(), \
+            f"generating rows of order {n} expected to be symmetric, got {rows}"
+        mats = [_circulant(v) for v in rows]
+        ret = sum(m @ m.T for m in mats)
+        assert (ret == 4 * n * np.eye(n)).all(), \
+            f"Williamson matrices of order {n} expected AA' + BB' + CC' + DD' = {4 * n}I"
@@ -5,7 +5,7 @@ Test for One Hot Design Generator Module
 import numpy as np
 import pytest
 
-from tagupy.design.generator import OneHot
+from tagupy.design.generator import OneHot, SparseDesign
 
 
 @pytest.fixture
@@ -85,3 +85,28 @@ def test_get_exmatrix_sum(correct_inputs):
                 got {np.bincount(sum[1])[0]}"
         assert np.array_equal(sum[0], np.full((n_factor), n_rep)), \
             f"sum of values in a col should be n_rep, got {sum[0]}"
+
+
+def test_get_exmatrix_dtype():
+    model = OneHot(2)
+    ret = model.get_exmatrix(5)
+    assert ret.dtype == np.int8, \
+        f"dtype of exmatrix expected int8, got {ret.dtype}"
+    ret = model.get_exmatrix(5, dtype=np.float64)
+    assert ret.dtype == np.float64, \
+        f"dtype of exmatrix expected float64, got {ret.dtype}"
+
+
+def test_get_exmatrix_sparse(correct_inputs):
+    model = OneHot(3)
+    for n_factor in correct_inputs:
+        ret = model.get_exmatrix(n_factor, sparse=True)
+        exp = model.get_exmatrix(n_factor)
+        assert isinstance(ret, SparseDesign), \
+            f"type of exmatrix expected SparseDesign, got {type(ret)}"
+        assert ret.nnz == 3 * n_factor, \
+            f"nnz of exmatrix expected {3 * n_factor}, got {ret.nnz}"
+        assert ret.dtype == exp.dtype and np.array_equal(ret.toarray(), exp), \
+            f"sparse exmatrix expected {exp}, got {ret.toarray()}"
+    with pytest.raises(AssertionError):
+        model.get_exmatrix(3, lazy=True, sparse=True)
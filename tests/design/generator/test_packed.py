@@ -0,0 +1,96 @@
+"""
+Test for Bit-packed Two-level Experiment Matrix Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import PackedDesign
+from tagupy.design.generator import _packed as pk
+from tagupy.utils import get_corr_matrix
+
+
+@pytest.fixture
+def correct_input():
+    rng = np.random.default_rng(0)
+    # less than, exactly and more than a word of runs
+    shapes = [(1, 1), (12, 11), (64, 5), (131, 70)]
+    return [rng.choice([-1, 1], shape).astype(np.int8) for shape in shapes]
+
+
+def test_init_invalid_input():
+    for arg in [np.ones(3), np.zeros((2, 2)), np.array([[1, 2], [-1, 1]])]:
+        with pytest.raises(AssertionError):
+            PackedDesign(arg)
+
+
+def test_packed_memory(correct_input):
+    for exmatrix in correct_input:
+        ret = PackedDesign(exmatrix)
+        n_word = -(-exmatrix.shape[0] // 64)
+        assert ret.words.shape == (exmatrix.shape[1], n_word) and ret.words.dtype == np.uint64, \
+            f"words expected uint64 of shape {(exmatrix.shape[1], n_word)}, got {ret.words.shape}"
+        assert not ret.words.flags.writeable, \
+            "words expected to be read-only"
+
+
+def test_packed_toarray(correct_input):
+    for exmatrix in correct_input:
+        ret = PackedDesign(exmatrix)
+        assert ret.shape == exmatrix.shape, \
+            f"shape expected {exmatrix.shape}, got {ret.shape}"
+        assert np.array_equal(ret.toarray(), exmatrix) and np.asarray(ret).dtype == np.int8, \
+            f"toarray expected {exmatrix}, got {ret.toarray()}"
+
+
+def test_packed_kernels(correct_input):
+    for exmatrix in correct_input:
+        ret = PackedDesign(exmatrix)
+        dense = exmatrix.astype(np.int64)
+        assert np.array_equal(ret.sum(axis=0), dense.sum(axis=0)) and ret.sum() == dense.sum(), \
+            f"column sums expected {dense.sum(axis=0)}, got {ret.sum(axis=0)}"
+        for block_size in [None, 1, 7]:
+            assert np.array_equal(ret.gram(block_size), dense.T @ dense), \
+                f"gram expected {dense.T @ dense}, got {ret.gram(block_size)}"
+        if exmatrix.shape[0] > 1:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                exp = get_corr_matrix(exmatrix, max_dim=1)
+                assert np.allclose(get_corr_matrix(ret, max_dim=1), exp, equal_nan=True), \
+                    "correlation matrix of packed design expected np.corrcoef"
+
+
+def test_popcount_fallback(monkeypatch):
+    words = np.random.default_rng(1).integers(0, 2 ** 63, (4, 3), dtype=np.uint64)
+    exp = np.array([[bin(w).count("1") for w in row] for row in words.tolist()])
+    if hasattr(np, "bitwise_count"):
+        assert np.array_equal(pk._popcount(words), exp), \
+            f"popcount expected {exp}, got {pk._popcount(words)}"
+        monkeypatch.delattr(np, "bitwise_count")
+    assert np.array_equal(pk._popcount(words), exp), \
+        f"popcount by lookup table expected {exp}, got {pk._popcount(words)}"
+
+
+def test_is_orthogonal():
+    hadamard = np.array([[1, 1, 1, 1], [1, -1, 1, -1], [1, 1, -1, -1], [1, -1, -1, 1]])
+    assert PackedDesign(hadamard).is_orthogonal(), \
+        "Hadamard matrix expected to be orthogonal"
+    hadamard[0, 0] = -1
+    assert not PackedDesign(hadamard).is_orthogonal(), \
+        "perturbed Hadamard matrix expected not to be orthogonal"
+
+
+def test_tile(correct_input):
+    for exmatrix in correct_input:
+        for n_rep in [1, 2, 5, 64, 67]:
+            ret = PackedDesign(exmatrix).tile(n_rep)
+            exp = PackedDesign(np.tile(exmatrix, (n_rep, 1)))
+            assert ret.shape == exp.shape and np.array_equal(ret.words, exp.words), \
+                f"tile expected the packed words of {n_rep} stacked copies, got {ret.words}"
+            assert not ret.words.flags.writeable
+    with pytest.raises(AssertionError):
+        PackedDesign(np.ones((3, 2))).tile(0)
+
+
+def test_array_without_copy():
+    with pytest.raises(ValueError):
+        PackedDesign(np.ones((3, 2))).__array__(copy=False)
@@ -10,14 +10,15 @@ from tagupy.design.generator._pb_ref import _pb
 
 @pytest.fixture
 def supported_num():
-    # multiples of 4 within [4, 100] but 92
-    l_num = [i for i in np.arange(4, 90, 4)] + [96, 100]
+    # multiples of 4 within [4, 152] and orders of each construction
+    l_num = [i for i in np.arange(4, 153, 4)] + [256, 244, 364, 464, 1152]
     return [(i, _pb(i)) for i in l_num]
 
 
-def test_pb92_not_implemented_error():
-    with pytest.raises(ValueError):
-        _pb(92)
+def test_pb_unsupported_error():
+    for num in [156, 668]:
+        with pytest.raises(ValueError):
+            _pb(num)
 
 
 def test_pbX_output(supported_num):
@@ -39,5 +40,6 @@ def test_pbX_conversion_to_hadamard(supported_num):
         hadamard = np.concatenate([pb, np.ones((num, 1))], axis=1)
         assert ((pb == 1) | (pb == -1)).all(), \
             f"all the elements in exmatrix should be either -1 or 1, got {pb} in _pb{num}"
-        assert (hadamard @ hadamard.T == num * np.identity(num)).all(), \
+        h = hadamard.astype(np.int64)
+        assert (h @ h.T == num * np.identity(num)).all(), \
             f"return var expected to be submatrix of hadamard matrix, got {pb} in _pb{num}"
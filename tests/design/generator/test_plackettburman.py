@@ -5,12 +5,12 @@ Test for Plackett-Burman Design Generator Module
 import numpy as np
 import pytest
 
-from tagupy.design.generator import PlackettBurman
+from tagupy.design.generator import PackedDesign, PlackettBurman
 
 
 @pytest.fixture
 def correct_input():
-    return [1, 2, 5, 10, 40, 80, 97]
+    return [1, 2, 5, 10, 40, 80, 88, 91, 97, 150]
 
 
 def test_init_invalid_input():
@@ -23,14 +23,14 @@ def test_init_invalid_input():
 
 
 def test_init_correct_input(correct_input):
-    exp = [1, 2, 5, 10, 40, 80, 97]
+    exp = [1, 2, 5, 10, 40, 80, 88, 91, 97, 150]
     for i, el in enumerate(correct_input):
         assert PlackettBurman(el).n_rep == exp[i], \
             f"self.n_rep expected {exp[i]}, got {PlackettBurman(el).n_rep}"
 
 
 def test_get_exmatrix_invalid_input():
-    arg = ["moge", None, np.ones((2, 3)), 3.4, 0, -1, 100]
+    arg = ["moge", None, np.ones((2, 3)), 3.4, 0, -1]
     model = PlackettBurman(1)
     for n_factor in arg:
         with pytest.raises(AssertionError) as e:
@@ -40,7 +40,8 @@ def test_get_exmatrix_invalid_input():
 
 
 def test_get_exmatrix_undefined_input_val():
-    arg = [88, 89, 90, 91]
+    # no Hadamard matrix of order 668 is known
+    arg = [664, 665, 666, 667]
     model = PlackettBurman(1)
     for n_factor in arg:
         with pytest.raises(ValueError):
@@ -72,3 +73,28 @@ def test_get_exmatrix_output_element(correct_input):
         ret = model.get_exmatrix(n_factor)
         assert ((ret == 1) | (ret == -1)).all(), \
             f"all the elements in exmatrix should be either -1 or 1, got {ret}"
+
+
+def test_get_exmatrix_dtype():
+    model = PlackettBurman(2)
+    ret = model.get_exmatrix(10)
+    assert ret.dtype == np.int8, \
+        f"dtype of exmatrix expected int8, got {ret.dtype}"
+    ret = model.get_exmatrix(10, dtype=np.int64)
+    assert ret.dtype == np.int64, \
+        f"dtype of exmatrix expected int64, got {ret.dtype}"
+
+
+def test_get_exmatrix_packed():
+    model = PlackettBurman(3)
+    for n_factor in [1, 7, 19, 50]:
+        ret = model.get_exmatrix(n_factor, packed=True)
+        exp = model.get_exmatrix(n_factor)
+        assert isinstance(ret, PackedDesign), \
+            f"type of exmatrix expected PackedDesign, got {type(ret)}"
+        assert np.array_equal(ret.toarray(), exp), \
+            f"packed exmatrix expected {exp}, got {ret.toarray()}"
+        assert ret.is_orthogonal(), \
+            f"columns of PB design expected to be orthogonal, got {ret.gram()}"
+    with pytest.raises(AssertionError):
+        model.get_exmatrix(3, lazy=True, packed=True)
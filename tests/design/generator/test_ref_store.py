@@ -0,0 +1,46 @@
+"""
+Test for Bit-packed Reference Table Store
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import _ref_build, _ref_store
+
+
+@pytest.fixture
+def correct_input():
+    rng = np.random.default_rng(0)
+    return [
+        rng.choice([-1, 1], size=(12, 11)),
+        rng.choice([-1, 0, 1], size=(9, 17)),
+        rng.choice([-1, 1], size=23),
+        np.array([[0, 1], [-1, 0]]),
+    ]
+
+
+def test_pack_unpack_roundtrip(correct_input):
+    for table in correct_input:
+        packed = _ref_store._pack_table(table)
+        assert packed.dtype == np.uint8, \
+            f"dtype of packed table expected uint8, got {packed.dtype}"
+        ret = _ref_store._unpack_table(packed, table.shape)
+        assert np.array_equal(ret, table), \
+            f"unpacked table expected {table}, got {ret}"
+
+
+def test_pack_invalid_input():
+    with pytest.raises(AssertionError):
+        _ref_store._pack_table(np.array([[2, 1], [1, 0]]))
+
+
+def test_store_matches_literal_tables():
+    tables = _ref_build._literal_tables()
+    for name, table in tables.items():
+        packed = np.load(_ref_store._table_path(name), mmap_mode='r')
+        n_byte = -(-table.shape[-1] // 8)
+        assert packed.dtype == np.uint8 and packed.shape[-1] == n_byte, \
+            f"stored table {name} expected {n_byte} bytes per row, got {packed.shape}"
+        ret = _ref_store._load_table(name, table.shape)
+        assert np.array_equal(ret, table), \
+            f"stored table {name} differs from the literal table"
@@ -0,0 +1,82 @@
+"""
+Test for Replicated Experiment Matrix Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import DSD, FullFact, OneHot, PlackettBurman, ReplicatedDesign
+
+
+@pytest.fixture
+def correct_input():
+    return [
+        (FullFact, {"levels": [2, 3, 2]}),
+        (OneHot, {"n_factor": 5}),
+        (PlackettBurman, {"n_factor": 10}),
+        (DSD, {"n_factor": 6, "n_fake": 2}),
+    ]
+
+
+def test_init_invalid_input():
+    for n_rep in ["moge", None, 3.4, 0, -22]:
+        with pytest.raises(AssertionError) as e:
+            ReplicatedDesign(np.ones((2, 3)), n_rep)
+        assert f"{n_rep}" in f"{e.value}", \
+            f"NoReasons: Inform the AssertionError reasons, got {e.value}"
+    with pytest.raises(AssertionError):
+        ReplicatedDesign(np.ones(3), 2)
+
+
+def test_lazy_exmatrix_matches_eager(correct_input):
+    for cls, info in correct_input:
+        model = cls(7)
+        exp = model.get_exmatrix(**info)
+        ret = model.get_exmatrix(**info, lazy=True)
+        assert isinstance(ret, ReplicatedDesign), \
+            f"type of lazy exmatrix expected ReplicatedDesign, got {type(ret)}"
+        assert ret.shape == exp.shape and len(ret) == len(exp), \
+            f"shape of lazy exmatrix expected {exp.shape}, got {ret.shape}"
+        assert np.array_equal(np.asarray(ret), exp), \
+            f"materialized exmatrix expected {exp}, got {np.asarray(ret)}"
+        assert ret.base.shape[0] * 7 == exp.shape[0], \
+            f"lazy exmatrix expected to hold a single replication, got {ret.base.shape}"
+
+
+def test_indexing_matches_ndarray(correct_input):
+    for cls, info in correct_input:
+        model = cls(4)
+        exp = model.get_exmatrix(**info)
+        ret = model.get_exmatrix(**info, lazy=True)
+        keys = [0, -1, len(exp) - 3, slice(None), slice(2, None, 3), slice(None, None, -1),
+                [1, -2, 5], np.arange(0, len(exp), 5), (slice(1, 9), 0), (3, slice(None, 2)),
+                (slice(None), [0, -1]), exp[:, 0] == exp[0, 0]]
+        for key in keys:
+            assert np.array_equal(ret[key], exp[key]), \
+                f"indexing with {key} expected {exp[key]}, got {ret[key]}"
+        with pytest.raises(IndexError):
+            ret[len(exp)]
+
+
+def test_replicates_are_read_only_views():
+    base = np.arange(6).reshape(3, 2)
+    design = ReplicatedDesign(base, 50)
+    rep = design.replicates
+    assert rep.shape == (50, 3, 2), \
+        f"shape of replicates expected (50, 3, 2), got {rep.shape}"
+    assert np.shares_memory(rep, design.base), \
+        "replicates expected to be a view of base"
+    with pytest.raises(ValueError):
+        rep[0, 0, 0] = 1
+    with pytest.raises(ValueError):
+        design.base[0, 0] = 1
+    base[0, 0] = 10
+    assert design.base[0, 0] == 0, \
+        "ReplicatedDesign expected to be unaffected by later writes to the input"
+
+
+def test_array_without_copy():
+    design = ReplicatedDesign(np.arange(6).reshape(3, 2), 2)
+    with pytest.raises(ValueError):
+        design.__array__(copy=False)
+    assert np.array_equal(design.__array__(copy=True), np.tile(design.base, (2, 1)))
@@ -0,0 +1,68 @@
+"""
+Test for Sparse Experiment Matrix Module
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import SparseDesign
+
+
+@pytest.fixture
+def correct_input():
+    rng = np.random.default_rng(0)
+    dense = rng.choice([-1, 0, 0, 1], (13, 5)).astype(np.int8)
+    rows, cols = np.nonzero(dense)
+    return dense, SparseDesign(rows, cols, dense[rows, cols], shape=dense.shape)
+
+
+def test_init_invalid_input():
+    arg = [
+        ([0], [0], [1], [2, 2]),
+        ([0], [0], [1], (2, -1)),
+        ([0, 1], [0], [1], (2, 2)),
+        ([2], [0], [1], (2, 2)),
+        ([0], [0.5], [1], (2, 2)),
+    ]
+    for rows, cols, data, shape in arg:
+        with pytest.raises(AssertionError):
+            SparseDesign(rows, cols, data, shape=shape)
+
+
+def test_sparse_attributes(correct_input):
+    dense, design = correct_input
+    assert design.shape == dense.shape and len(design) == len(dense), \
+        f"shape expected {dense.shape}, got {design.shape}"
+    assert design.nnz == np.count_nonzero(dense), \
+        f"nnz expected {np.count_nonzero(dense)}, got {design.nnz}"
+    assert design.dtype == np.int8, \
+        f"dtype expected int8, got {design.dtype}"
+
+
+def test_sparse_toarray(correct_input):
+    dense, design = correct_input
+    assert np.array_equal(design.toarray(), dense), \
+        f"toarray expected {dense}, got {design.toarray()}"
+    assert np.array_equal(np.asarray(design, dtype=float), dense), \
+        "np.asarray expected the dense matrix"
+    dup = SparseDesign([0, 0], [1, 1], [1, 2], shape=(1, 2))
+    assert np.array_equal(dup.toarray(), [[0, 3]]), \
+        f"duplicated coordinates expected to be summed up, got {dup.toarray()}"
+
+
+def test_sparse_products(correct_input):
+    dense, design = correct_input
+    rng = np.random.default_rng(1)
+    x, y = rng.normal(size=(5, 3)), rng.normal(size=(2, 13))
+    for exp, ret in [
+        (dense @ x[:, 0], design @ x[:, 0]),
+        (dense @ x, design @ x),
+        (y[0] @ dense, y[0] @ design),
+        (y @ dense, y @ design),
+        (dense.T @ dense, design.gram()),
+        (dense.sum(axis=0), design.sum(axis=0)),
+        (dense.sum(axis=1), design.sum(axis=1)),
+        (dense.sum(), design.sum()),
+    ]:
+        assert ret.shape == exp.shape and np.allclose(ret, exp), \
+            f"product expected {exp}, got {ret}"
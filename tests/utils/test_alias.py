@@ -0,0 +1,69 @@
+"""
+Test for Utility alias matrix
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import DSD, FullFact, OneHot, PlackettBurman
+from tagupy.utils import alias_factor_cache, get_alias_matrix
+from tagupy.utils._cache import _design_digest
+
+
+def _expected(exmatrix):
+    x = exmatrix.astype(float)
+    n_factor = x.shape[1]
+    x1 = np.hstack([np.ones((len(x), 1)), x])
+    cols = [x[:, i] * x[:, j] for i, j in combinations(range(n_factor), 2)]
+    cols += [x[:, i] ** 2 for i in range(n_factor) if len(np.unique(x[:, i])) > 2]
+    x2 = np.stack(cols, axis=1)
+    return np.linalg.inv(x1.T @ x1) @ x1.T @ x2
+
+
+@pytest.fixture
+def correct_input():
+    return [
+        (PlackettBurman(n_rep=1), {"n_factor": 7}, "diag"),
+        (PlackettBurman(n_rep=2), {"n_factor": 10}, "diag"),
+        (DSD(n_rep=1), {"n_factor": 6, "n_fake": 2}, "diag"),
+        (FullFact(n_rep=1), {"levels": [3, 2, 4]}, "qr"),
+        (OneHot(n_rep=2), {"n_factor": 4}, "qr"),
+    ]
+
+
+def test_get_alias_matrix_valid_output(correct_input):
+    for model, info, kind in correct_input:
+        exmatrix = model.get_exmatrix(**info)
+        exp = _expected(exmatrix)
+        ret = get_alias_matrix(exmatrix, max_dim=2)
+        assert ret.shape == exp.shape and np.allclose(ret, exp), \
+            f"alias matrix of {type(model).__name__} expected {exp}, got {ret}"
+        assert np.allclose(model.get_alias_matrix(max_dim=2, **info), exp), \
+            f"alias matrix from {type(model).__name__}.get_alias_matrix expected {exp}"
+        key = ("main", _design_digest(exmatrix))
+        assert key in alias_factor_cache and alias_factor_cache.get(key, None)[0] == kind, \
+            f"factorization of {type(model).__name__} expected {kind} in alias_factor_cache"
+
+
+def test_get_alias_matrix_reuse_factor():
+    alias_factor_cache.clear()
+    exmatrix = FullFact(n_rep=1).get_exmatrix(levels=[3, 3, 2])
+    for _ in range(3):
+        get_alias_matrix(exmatrix, max_dim=2)
+    info = alias_factor_cache.info()
+    assert (info.hits, info.misses) == (2, 1), \
+        f"factorization expected to be computed once, got {info}"
+
+
+def test_get_alias_matrix_invalid_input():
+    exmatrix = PlackettBurman(n_rep=1).get_exmatrix(n_factor=3)
+    for max_dim in [1, 3]:
+        with pytest.raises(NotImplementedError):
+            get_alias_matrix(exmatrix, max_dim=max_dim)
+    with pytest.raises(AssertionError):
+        get_alias_matrix(exmatrix[:, 0], max_dim=2)
+    for singular in [np.zeros((4, 2)), np.array([[1, 2], [2, 4], [3, 6]])]:
+        with pytest.raises(np.linalg.LinAlgError):
+            get_alias_matrix(singular, max_dim=2)
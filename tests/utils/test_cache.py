@@ -0,0 +1,52 @@
+"""
+Test for Utility cache
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tagupy.utils import CacheInfo, LRUCache
+
+
+def test_init_invalid_input():
+    for maxsize in ["moge", None, 3.4, 0, -1]:
+        with pytest.raises(AssertionError) as e:
+            LRUCache(maxsize)
+        assert f"{maxsize}" in f"{e.value}", \
+            f"NoReasons: Inform the AssertionError reasons, got {e.value}"
+
+
+def test_get_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: -1)
+    cache.get("c", lambda: 3)
+    assert "a" in cache and "c" in cache and "b" not in cache, \
+        "least recently used entry expected to be evicted"
+    assert cache.info() == CacheInfo(hits=1, misses=3, maxsize=2, currsize=2), \
+        f"unexpected cache statistics, got {cache.info()}"
+
+
+def test_clear_and_resize():
+    cache = LRUCache(4)
+    for i in range(4):
+        cache.get(i, lambda: i)
+    cache.resize(1)
+    assert len(cache) == 1 and 3 in cache, \
+        f"resize expected to keep the most recent entry, got {len(cache)} entries"
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=1, currsize=0), \
+        f"clear expected to reset the cache, got {cache.info()}"
+
+
+def test_get_thread_safe():
+    cache = LRUCache(8)
+    with ThreadPoolExecutor(8) as pool:
+        ret = list(pool.map(lambda i: cache.get(i % 4, lambda: [i % 4]), range(1000)))
+    info = cache.info()
+    assert all(r is cache.get(r[0], list) for r in ret), \
+        "every thread expected to receive the stored value"
+    assert info.hits + info.misses == 1000 and info.currsize == 4, \
+        f"unexpected cache statistics, got {info}"
@@ -0,0 +1,68 @@
+"""
+Test for Utility Functions
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import DSD, FullFact, OneHot
+from tagupy.utils import get_corr_matrix
+
+
+def test_get_corr_matrix_sparse():
+    for n_rep, n_factor in [(1, 2), (2, 7), (5, 30)]:
+        model = OneHot(n_rep)
+        exp = get_corr_matrix(model.get_exmatrix(n_factor), max_dim=1)
+        ret = get_corr_matrix(model.get_exmatrix(n_factor, sparse=True), max_dim=1)
+        assert np.allclose(ret, exp), \
+            f"correlation matrix of sparse design expected {exp}, got {ret}"
+
+
+def _model_matrix(exmatrix):
+    n_factor = exmatrix.shape[1]
+    cols = [exmatrix[:, i] for i in range(n_factor)]
+    cols += [exmatrix[:, i] * exmatrix[:, j] for i, j in combinations(range(n_factor), 2)]
+    cols += [exmatrix[:, i] ** 2 for i in range(n_factor) if len(np.unique(exmatrix[:, i])) > 2]
+    return np.stack(cols, axis=1).astype(float)
+
+
+@pytest.fixture
+def second_order_input():
+    return [
+        DSD(n_rep=1).get_exmatrix(n_factor=6, n_fake=2),
+        DSD(n_rep=2).get_exmatrix(n_factor=3, n_fake=1),
+        FullFact(n_rep=1).get_exmatrix(levels=[3, 2, 4]),
+    ]
+
+
+def test_get_corr_matrix_second_order(second_order_input):
+    for exmatrix in second_order_input:
+        exp = np.corrcoef(_model_matrix(exmatrix).T)
+        for block_size in [1, 5, 256]:
+            ret = get_corr_matrix(exmatrix, max_dim=2, block_size=block_size)
+            assert ret.shape == exp.shape and np.allclose(ret, exp), \
+                f"correlation matrix of max_dim = 2 expected {exp}, got {ret}"
+            ret = get_corr_matrix(exmatrix, max_dim=2, condensed=True, block_size=block_size)
+            assert np.allclose(ret, exp[np.triu_indices(len(exp), k=1)]), \
+                f"condensed correlation matrix expected upper triangle of {exp}, got {ret}"
+
+
+def test_get_corr_matrix_dtype(second_order_input):
+    for exmatrix in second_order_input:
+        for max_dim in [1, 2]:
+            exp = get_corr_matrix(exmatrix, max_dim=max_dim)
+            ret = get_corr_matrix(exmatrix, max_dim=max_dim, dtype=np.float32)
+            assert ret.dtype == np.float32 and np.allclose(ret, exp, atol=1e-6), \
+                f"float32 correlation matrix expected {exp}, got {ret}"
+
+
+def test_get_corr_matrix_invalid_input(second_order_input):
+    exmatrix = second_order_input[0]
+    for max_dim in [0, 3]:
+        with pytest.raises(NotImplementedError):
+            get_corr_matrix(exmatrix, max_dim=max_dim)
+    for kwargs in [{"dtype": int}, {"block_size": 0}]:
+        with pytest.raises(AssertionError):
+            get_corr_matrix(exmatrix, max_dim=2, **kwargs)
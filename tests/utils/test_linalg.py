@@ -0,0 +1,67 @@
+"""
+Test for Utility linear algebra
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.utils import _linalg as la
+
+
+def test_back_substitution():
+    rng = np.random.default_rng(0)
+    r = np.triu(rng.normal(size=(6, 6))) + 6 * np.eye(6)
+    for b in [rng.normal(size=(6, 4)), rng.normal(size=6)]:
+        assert np.allclose(la._back_substitution(r, b), np.linalg.solve(r, b)), \
+            "back substitution expected to solve the upper triangular system"
+
+
+def test_qr_add_delete_row():
+    rng = np.random.default_rng(1)
+    x, y = rng.normal(size=(10, 4)), rng.normal(size=(10, 3))
+    r, z = np.zeros((4, 4)), np.zeros((4, 3))
+    ss = np.zeros(3)
+    for xi, yi in zip(x, y):
+        e = la._qr_add_row(r, z, xi, yi)
+        ss += e * e
+    assert np.allclose(np.triu(r), r) and np.allclose(r.T @ r, x.T @ x), \
+        "updated factor expected r'r = X'X"
+    coef = np.linalg.lstsq(x, y, rcond=None)[0]
+    assert np.allclose(la._back_substitution(r, z), coef) and \
+        np.allclose(ss, ((y - x @ coef) ** 2).sum(axis=0)), \
+        "updated factor expected to give the least-squares fit"
+
+    e = la._qr_delete_row(r, z, x[0], y[0])
+    ss -= e * e
+    coef = np.linalg.lstsq(x[1:], y[1:], rcond=None)[0]
+    ss_error = ((y[1:] - x[1:] @ coef) ** 2).sum(axis=0)
+    assert np.allclose(r.T @ r, x[1:].T @ x[1:]) and \
+        np.allclose(la._back_substitution(r, z), coef) and np.allclose(ss, ss_error), \
+        "downdated factor expected to give the least-squares fit without the row"
+
+    r, z = np.zeros((2, 2)), np.zeros((2, 1))
+    la._qr_add_row(r, z, np.array([1., 0.]), np.ones(1))
+    la._qr_add_row(r, z, np.array([0., 1.]), np.ones(1))
+    with pytest.raises(np.linalg.LinAlgError):
+        la._qr_delete_row(r, z, np.array([1., 0.]), np.ones(1))
+
+
+def test_qr_add_delete_column():
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=(12, 5))
+    q, r = np.linalg.qr(x[:, :3])
+    for j in [3, 4]:
+        q, r = la._qr_add_column(q, r, x[:, j])
+    assert np.allclose(q.T @ q, np.eye(5)) and np.allclose(np.triu(r), r) and \
+        np.allclose(q @ r, x), \
+        "added column expected to extend the thin QR factorization"
+    q2, r2, u = la._qr_delete_column(q, r, 1)
+    rest = np.delete(x, 1, axis=1)
+    assert np.allclose(q2.T @ q2, np.eye(4)) and np.allclose(np.triu(r2), r2) and \
+        np.allclose(q2 @ r2, rest), \
+        "deleted column expected to give the thin QR factorization of the rest"
+    assert np.isclose(np.linalg.norm(u), 1) and np.allclose(q2.T @ u, 0) and \
+        np.allclose(q @ (q.T @ u), u), \
+        "dropped direction expected in the old span and orthogonal to the new one"
+    with pytest.raises(np.linalg.LinAlgError):
+        la._qr_add_column(q, r, x[:, :2] @ np.array([1., -2.]))
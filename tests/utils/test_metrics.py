@@ -0,0 +1,101 @@
+"""
+Test for Utility design metrics
+"""
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import DSD, FullFact, PlackettBurman
+from tagupy.utils import DesignMetrics, get_design_metrics, get_prediction_variance, get_vif
+
+
+def _with_intercept(exmatrix):
+    return np.hstack([np.ones((len(exmatrix), 1)), exmatrix])
+
+
+@pytest.fixture
+def batch_input():
+    rng = np.random.default_rng(0)
+    batch = np.concatenate([np.ones((50, 12, 1)), rng.choice([-1, 0, 1], (50, 12, 4))], axis=2)
+    # singular candidates with duplicated columns
+    batch[::10, :, 4] = batch[::10, :, 3]
+    return batch
+
+
+def test_design_metrics_orthogonal():
+    for exmatrix in [PlackettBurman(n_rep=1).get_exmatrix(n_factor=11),
+                     FullFact(n_rep=2).get_exmatrix(levels=[2, 2, 2]) * 2 - 1]:
+        x = _with_intercept(exmatrix)
+        ret = get_design_metrics(x, region=x)
+        assert isinstance(ret, DesignMetrics), \
+            f"type of metrics expected DesignMetrics, got {type(ret)}"
+        for name in ["d_efficiency", "a_efficiency", "g_efficiency", "i_efficiency"]:
+            assert isinstance(getattr(ret, name), float) and np.isclose(getattr(ret, name), 100), \
+                f"{name} of an orthogonal design expected 100, got {getattr(ret, name)}"
+
+
+def test_design_metrics_batch(batch_input):
+    region = _with_intercept(FullFact(n_rep=1).get_exmatrix(levels=[3] * 4) - 1)
+    ret = get_design_metrics(batch_input, region=region)
+    for i, x in enumerate(batch_input):
+        n, p = x.shape
+        xtx = x.T @ x
+        if np.linalg.matrix_rank(xtx) < p:
+            assert ret.d_efficiency[i] == 0 and ret.max_variance[i] == np.inf, \
+                f"singular design expected zero efficiency, got {ret.d_efficiency[i]}"
+            continue
+        inv = np.linalg.inv(xtx)
+        var = np.einsum("ij,jk,ik->i", x, inv, x)
+        exp = DesignMetrics(
+            d_efficiency=100 * np.linalg.det(xtx) ** (1 / p) / n,
+            a_efficiency=100 * p / (n * np.trace(inv)),
+            g_efficiency=100 * p / (n * var.max()),
+            i_efficiency=100 * p / (n * np.einsum("ij,jk,ik->i", region, inv, region).mean()),
+            max_variance=var.max(),
+            mean_variance=np.einsum("ij,jk,ik->i", region, inv, region).mean(),
+        )
+        for name, value in exp._asdict().items():
+            assert np.isclose(getattr(ret, name)[i], value), \
+                f"{name} of design {i} expected {value}, got {getattr(ret, name)[i]}"
+        assert np.allclose(get_prediction_variance(x), var), \
+            f"prediction variance expected {var}, got {get_prediction_variance(x)}"
+    assert np.isnan(get_design_metrics(batch_input).i_efficiency).all(), \
+        "i_efficiency without region expected nan"
+
+
+def test_prediction_variance_points(batch_input):
+    points = batch_input[0, :5]
+    ret = get_prediction_variance(batch_input, points)
+    assert ret.shape == (len(batch_input), 5), \
+        f"shape of prediction variance expected {(len(batch_input), 5)}, got {ret.shape}"
+    assert np.allclose(ret[0], get_prediction_variance(batch_input[0])[:5]), \
+        "prediction variance at design points expected to agree"
+
+
+def test_vif():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=(30, 4))
+    x[:, 3] += x[:, 0]
+    exp = []
+    for j in range(4):
+        others = np.hstack([np.ones((30, 1)), np.delete(x, j, axis=1)])
+        resid = x[:, j] - others @ np.linalg.lstsq(others, x[:, j], rcond=None)[0]
+        exp.append(1 / (resid @ resid / ((x[:, j] - x[:, j].mean()) ** 2).sum()))
+    assert np.allclose(get_vif(x), exp), \
+        f"VIF expected {exp}, got {get_vif(x)}"
+    assert np.allclose(get_vif(np.stack([x, x])), [exp, exp]), \
+        "VIF of a batch expected to agree with each design"
+    dsd = DSD(n_rep=1).get_exmatrix(n_factor=6, n_fake=2)
+    assert np.allclose(get_vif(dsd), 1), \
+        f"VIF of orthogonal main effects expected 1, got {get_vif(dsd)}"
+    ret = get_vif(np.hstack([x[:, :2], x[:, :1] * 2, np.ones((30, 1))]))
+    assert np.isinf(ret[:3]).all() and np.isnan(ret[3]), \
+        f"VIF expected inf for dependent terms and nan for constant terms, got {ret}"
+
+
+def test_invalid_input():
+    for arg in [np.ones(3), np.ones((2, 2, 2, 2))]:
+        with pytest.raises(AssertionError):
+            get_design_metrics(arg)
+    with pytest.raises(AssertionError):
+        get_design_metrics(np.ones((4, 2)), region=np.ones((3, 3)))
@@ -0,0 +1,97 @@
+"""
+Test for Utility model matrix
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from tagupy.design.generator import DSD, OneHot, PlackettBurman
+from tagupy.utils import LRUCache, ModelMatrix, model_column_cache
+
+
+@pytest.fixture
+def correct_input():
+    return [
+        PlackettBurman(n_rep=1).get_exmatrix(n_factor=5),
+        DSD(n_rep=1).get_exmatrix(n_factor=4, n_fake=2),
+        OneHot(n_rep=2).get_exmatrix(n_factor=3, lazy=True),
+    ]
+
+
+def _expected(exmatrix, spec):
+    x = np.asarray(exmatrix).astype(float)
+    n_factor = x.shape[1]
+    cols = [np.ones(len(x))] + [x[:, i] for i in range(n_factor)]
+    if spec != "linear":
+        cols += [x[:, i] * x[:, j] for i, j in combinations(range(n_factor), 2)]
+    if spec == "quadratic":
+        cols += [x[:, i] ** 2 for i in range(n_factor) if len(np.unique(x[:, i])) > 2]
+    return np.stack(cols, axis=1)
+
+
+def test_init_invalid_input():
+    for exmatrix, terms in [(np.ones(3), "linear"), (np.ones((3, 2)), "cubic")]:
+        with pytest.raises(AssertionError):
+            ModelMatrix(exmatrix, terms=terms)
+    with pytest.raises(AssertionError):
+        ModelMatrix(np.ones((3, 2))).column((0, 2))
+
+
+def test_model_matrix_specs(correct_input):
+    for exmatrix in correct_input:
+        for spec in ["linear", "interaction", "quadratic"]:
+            exp = _expected(exmatrix, spec)
+            ret = ModelMatrix(exmatrix, terms=spec)
+            assert ret.shape == exp.shape, \
+                f"shape of {spec} model matrix expected {exp.shape}, got {ret.shape}"
+            assert np.array_equal(ret.toarray(), exp) and np.array_equal(np.asarray(ret), exp), \
+                f"{spec} model matrix expected {exp}, got {ret.toarray()}"
+            assert np.array_equal(ret[1:3, 2:], exp[1:3, 2:]), \
+                "slicing of model matrix expected to agree with the dense matrix"
+            assert np.array_equal(ret[:, 1], exp[:, 1]), \
+                "column of model matrix expected to agree with the dense matrix"
+
+
+def test_model_matrix_explicit_terms():
+    exmatrix = np.array([[1, 2, 3], [4, 5, 6]])
+    ret = ModelMatrix(exmatrix, terms=[(), (2, 0), (1, 1, 1), [0, 1, 2]])
+    assert ret.terms == ((), (0, 2), (1, 1, 1), (0, 1, 2)), \
+        f"terms expected to be normalized, got {ret.terms}"
+    assert ret.labels == ["1", "x0*x2", "x1^3", "x0*x1*x2"], \
+        f"labels expected ['1', 'x0*x2', 'x1^3', 'x0*x1*x2'], got {ret.labels}"
+    assert np.array_equal(ret.toarray(), [[1, 3, 8, 6], [1, 24, 125, 120]]), \
+        f"model matrix of explicit terms expected product columns, got {ret.toarray()}"
+    assert ret.index((2, 0)) == 1, \
+        f"index of (2, 0) expected 1, got {ret.index((2, 0))}"
+
+
+def test_model_matrix_shared_cache(correct_input):
+    exmatrix = correct_input[1]
+    cache = LRUCache(maxsize=1000)
+    ModelMatrix(exmatrix, terms="quadratic", cache=cache).toarray()
+    misses = cache.info().misses
+    other = ModelMatrix(exmatrix.copy(), terms="interaction", cache=cache)
+    other.toarray()
+    blocks = list(other.iter_blocks(block_size=4))
+    assert [start for start, _ in blocks] == list(range(0, other.shape[1], 4)), \
+        f"blocks expected to start every 4 terms, got {[start for start, _ in blocks]}"
+    assert np.array_equal(np.hstack([block for _, block in blocks]), other.toarray()), \
+        "blocks expected to make up the model matrix"
+    assert cache.info().misses == misses, \
+        "columns of the same design expected to be shared across model matrices"
+    col = other.column((0, 1))
+    assert not col.flags.writeable, \
+        "cached column expected to be read-only"
+    assert (model_column_cache.info().maxsize, len(cache)) == (4096, misses), \
+        f"each term column expected to be computed once, got {cache.info()}"
+
+
+def test_model_matrix_bounded_cache(correct_input):
+    cache = LRUCache(maxsize=3)
+    ret = ModelMatrix(correct_input[0], terms="interaction", cache=cache)
+    assert np.array_equal(ret.toarray(), _expected(correct_input[0], "interaction")), \
+        "model matrix expected to be correct with a small cache"
+    assert len(cache) == 3, \
+        f"cache expected to be bounded to 3 columns, got {len(cache)}"
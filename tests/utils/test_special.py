@@ -0,0 +1,54 @@
+"""
+Test for Utility special functions
+"""
+
+import math
+
+import numpy as np
+
+from tagupy.utils import _special as sp
+
+
+def test_betainc():
+    # closed forms: I_x(a, 1) = x^a, I_x(1, b) = 1 - (1 - x)^b, I_x(1/2, 1/2) = 2 asin(sqrt(x)) / pi
+    x = np.linspace(0, 1, 21)
+    for a in [0.5, 3, 40]:
+        assert np.allclose(sp._betainc(a, 1, x), x ** a), \
+            f"I_x({a}, 1) expected x^{a}"
+        assert np.allclose(sp._betainc(1, a, x), 1 - (1 - x) ** a), \
+            f"I_x(1, {a}) expected 1 - (1 - x)^{a}"
+    assert np.allclose(sp._betainc(0.5, 0.5, x), 2 * np.arcsin(np.sqrt(x)) / np.pi), \
+        "I_x(1/2, 1/2) expected 2 asin(sqrt(x)) / pi"
+    assert np.isnan(sp._betainc(2, 3, np.nan)), \
+        "I_x(a, b) expected nan for nan"
+
+
+def test_distributions():
+    # F(2, d) sf = (1 + 2f / d)^(-d / 2), t(1) is Cauchy, t(2) sf has a closed form
+    f = np.array([0, 0.5, 1, 4, 30, np.inf])
+    for d in [1, 4, 10, 77]:
+        assert np.allclose(sp._f_sf(f, 2, d), (1 + 2 * f / d) ** (-d / 2)), \
+            f"F(2, {d}) survival function expected its closed form"
+    t = np.array([0, 0.3, 1, 6.3, 100])
+    assert np.allclose(sp._t_sf2(t, 1), 1 - 2 * np.arctan(t) / np.pi), \
+        "two-sided p-value of t(1) expected 1 - 2 atan(t) / pi"
+    assert np.allclose(sp._t_sf2(t, 2), 1 - t / np.sqrt(2 + t * t)), \
+        "two-sided p-value of t(2) expected 1 - t / sqrt(2 + t^2)"
+    p = np.array([0.5, 0.05, 0.01, 1e-6])
+    for df in [1, 2, 5, 30]:
+        assert np.allclose(sp._t_sf2(sp._t_isf2(p, df), df), p), \
+            f"t quantile of df {df} expected to invert the p-value"
+    assert np.allclose(sp._t_isf2(0.05, [5, 10]), [2.570582, 2.228139]), \
+        "t quantiles expected the tabulated values"
+
+
+def test_normal():
+    z = np.array([-9, -3, -1.2, 0, 0.4, 1.96, 5])
+    exp = [0.5 * math.erfc(-v / math.sqrt(2)) for v in z]
+    assert np.allclose(sp._norm_cdf(z), exp, rtol=1e-12, atol=0), \
+        f"normal cdf expected {exp}, got {sp._norm_cdf(z)}"
+    q = np.array([1e-10, 0.01, 0.3, 0.5, 0.975, 1 - 1e-6])
+    assert np.allclose(sp._norm_cdf(sp._norm_ppf(q)), q, rtol=1e-12, atol=0), \
+        "normal quantile expected to invert the cdf"
+    assert np.array_equal(sp._norm_ppf([0, 1]), [-np.inf, np.inf]), \
+        "normal quantile of 0 and 1 expected infinite"